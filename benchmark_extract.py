@@ -0,0 +1,198 @@
+import asyncio
+import sys
+import time
+import tracemalloc
+
+from playwright.async_api import async_playwright
+
+from engine.adapter import SiteAdapter
+from engine.browser_extract import extract_rows_in_browser
+from engine.config import SNAPSHOT_DIR
+from engine.mock_site import strip_scripts
+from engine.snapshots import (
+    detail_snapshots,
+    diff_rows,
+    extract_detail,
+    extract_list,
+    golden_path,
+    list_snapshots,
+    load_golden,
+    read_snapshot,
+    save_golden,
+)
+from sites import SITE_ADAPTERS, adapter_class
+from sites.a16z import parse_company_modal
+
+# --- Configuration ---
+# Runs every site's extractors on the pages saved by record_snapshots.py
+# (snapshots/<site>/*.html and snapshots/<site>/detail/*.html) and compares the rows
+# with snapshots/<site>/golden/*.json. Sites that read their cards in the browser
+# (js_fields) are also timed that way, in a headless Chromium tab, against *.js.json.
+# Usage: `python benchmark_extract.py [sites...] [--update]` (--update rewrites the golden files)
+SITES = list(SITE_ADAPTERS)
+
+# Profile / modal parsers of sites whose profile is not read through parse_detail
+DETAIL_PARSERS = {
+    "a16z": parse_company_modal,
+}
+
+# <<<<<<< BENCHMARK CONFIGURATION >>>>>>>
+# How many times each snapshot is extracted (the best run is reported)
+REPEATS = 5
+PARSER = None  # HTML backend, None = config.HTML_PARSER (see benchmark_parsers.py to compare them)
+BROWSER_PATH = True  # also time the in-browser extraction of js_fields sites (needs Chromium)
+
+
+def detail_parser(site, adapter):
+    """soup -> fields function for the site's profile snapshots, or None"""
+    if site in DETAIL_PARSERS:
+        return DETAIL_PARSERS[site]
+    if type(adapter).parse_detail is not SiteAdapter.parse_detail:
+        return lambda soup: adapter.parse_detail(soup, {})
+    return None
+
+
+def measure(extract, html):
+    """(rows, best seconds, peak bytes) of an extractor on one snapshot"""
+    best = None
+    rows = None
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        rows = extract(html)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+
+    # Memory is traced on a separate run - tracing slows the timed ones down
+    tracemalloc.start()
+    extract(html)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return rows, best, peak
+
+
+async def measure_in_browser(page, adapter, html):
+    """(rows, best seconds) of the adapter's js_fields extraction on one snapshot loaded in page"""
+    await page.set_content(strip_scripts(html), wait_until="domcontentloaded")
+    best = None
+    rows = None
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        found = await extract_rows_in_browser(page, adapter.card_selectors, adapter.js_fields, adapter.empty_value)
+        rows = [row for row in (adapter.finish_row(row) for row in found) if row]
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return rows, best
+
+
+def check_golden(site, path, rows, update, variant=None):
+    """Compare rows with the snapshot's golden file (or write it); returns the number of differences"""
+    golden_file = golden_path(site, path, variant)
+    golden = load_golden(golden_file)
+    if update or golden is None:
+        save_golden(golden_file, rows)
+        print(f"      💾 golden {'updated' if golden is not None else 'created'}: {golden_file}")
+        return 0
+
+    differences = diff_rows(rows, golden)
+    if not differences:
+        print("      ✅ matches golden")
+    else:
+        print(f"      ⚠️ {len(differences)} differences from {golden_file}")
+        for difference in differences[:10]:
+            print(f"         {difference}")
+        if len(differences) > 10:
+            print(f"         ... {len(differences) - 10} more")
+    return len(differences)
+
+
+def benchmark_file(site, path, extract, update):
+    """Time one snapshot, print its stats and return (rows, seconds, differences)"""
+    html = read_snapshot(path)
+    rows, best, peak = measure(extract, html)
+    if rows is None:
+        return None
+    print(f"   📄 {path} ({len(html) / 1024:.0f} KB)  {len(rows):5d} rows  {best * 1000:8.1f} ms  "
+          f"{len(rows) / best if best else 0:9.0f} rows/s  peak {peak / 1024 / 1024:6.1f} MB")
+    return len(rows), best, check_golden(site, path, rows, update)
+
+
+def benchmark_site(site, update):
+    """Run the list and profile extractors of one site on its snapshots; returns the totals"""
+    adapter = adapter_class(site)()
+    parse = detail_parser(site, adapter)
+    jobs = [(path, lambda html: extract_list(adapter, html, PARSER)) for path in list_snapshots(site)]
+    if parse is not None:
+        jobs += [(path, lambda html: extract_detail(parse, html, PARSER)) for path in detail_snapshots(site)]
+    if not jobs:
+        return None
+
+    print(f"\n--- {site} ---")
+    totals = [0, 0.0, 0]
+    for path, extract in jobs:
+        result = benchmark_file(site, path, extract, update)
+        if result is None:
+            print(f"   📄 {path}: {type(adapter).__name__} has no parse_card - skipped")
+            continue
+        for index, value in enumerate(result):
+            totals[index] += value
+    return totals
+
+
+async def benchmark_in_browser(sites, update):
+    """Time the js_fields extraction of the given sites in one headless tab; returns the totals per site"""
+    playwright = await async_playwright().start()
+    summary = {}
+    try:
+        browser = await playwright.chromium.launch(headless=True)
+        page = await browser.new_page()
+        # Snapshots are measured offline: stylesheets, images and fonts are not fetched
+        await page.route("**/*", lambda route: route.abort())
+        for site in sites:
+            adapter = adapter_class(site)()
+            print(f"\n--- {site} (in browser) ---")
+            totals = [0, 0.0, 0]
+            for path in list_snapshots(site):
+                html = read_snapshot(path)
+                rows, best = await measure_in_browser(page, adapter, html)
+                print(f"   🌐 {path} ({len(html) / 1024:.0f} KB)  {len(rows):5d} rows  {best * 1000:8.1f} ms  "
+                      f"{len(rows) / best if best else 0:9.0f} rows/s")
+                for index, value in enumerate((len(rows), best, check_golden(site, path, rows, update, "js"))):
+                    totals[index] += value
+            summary[f"{site} (js)"] = totals
+        await browser.close()
+    except Exception as e:
+        print(f"⚠️ In-browser extraction not measured: {e} (playwright install chromium?)")
+    finally:
+        await playwright.stop()
+    return summary
+
+
+def main():
+    """Extraction speed, memory and correctness of every site on recorded pages"""
+    update = "--update" in sys.argv
+    sites = [arg for arg in sys.argv[1:] if arg != "--update"] or SITES
+
+    summary = {}
+    for site in sites:
+        totals = benchmark_site(site, update)
+        if totals is not None:
+            summary[site] = totals
+
+    browser_sites = [site for site in sites if site in SITE_ADAPTERS and adapter_class(site).js_fields
+                     and list_snapshots(site)]
+    if BROWSER_PATH and browser_sites:
+        summary.update(asyncio.run(benchmark_in_browser(browser_sites, update)))
+
+    if not summary:
+        print(f"❌ No snapshots found in {SNAPSHOT_DIR}/<site>/ - record some with record_snapshots.py")
+        return
+
+    print("\n📊 Summary")
+    for site, (rows, seconds, differences) in summary.items():
+        status = "✅" if not differences else f"⚠️ {differences} differences"
+        print(f"   {site:<20} {rows:6d} rows  {rows / seconds if seconds else 0:9.0f} rows/s  {status}")
+    if any(differences for _, _, differences in summary.values()):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
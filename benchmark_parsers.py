@@ -0,0 +1,71 @@
+import sys
+import time
+
+from engine.config import SNAPSHOT_DIR
+from engine.extract import PARSERS, parse_page, resolve_parser
+from engine.snapshots import extract_list, list_snapshots
+from sites import SITE_ADAPTERS, adapter_class
+
+# --- Configuration ---
+# Recorded list pages are read from snapshots/<site>/*.html
+SITES = list(SITE_ADAPTERS)
+
+# <<<<<<< BENCHMARK CONFIGURATION >>>>>>>
+# How many times each snapshot is parsed with each backend (the best run is reported)
+REPEATS = 5
+
+
+def benchmark_snapshot(adapter, path):
+    """Print the best parse / parse + extract times and row count of every backend for one snapshot"""
+    with open(path, encoding="utf-8") as f:
+        html = f.read()
+    print(f"\n📄 {path} ({len(html) / 1024:.0f} KB)")
+
+    reference = None
+    for parser in PARSERS:
+        if resolve_parser(parser) != parser:
+            print(f"   {parser:<12} not installed")
+            continue
+
+        best = None
+        best_parse = None
+        rows = None
+        for _ in range(REPEATS):
+            started = time.perf_counter()
+            parse_page(html, adapter.card_selectors, parser)
+            parsed = time.perf_counter()
+            rows = extract_list(adapter, html, parser)
+            elapsed = time.perf_counter() - parsed
+            best = elapsed if best is None else min(best, elapsed)
+            best_parse = parsed - started if best_parse is None else min(best_parse, parsed - started)
+
+        if rows is None:
+            print(f"   {type(adapter).__name__} has no parse_card - skipped")
+            return
+        if reference is None:
+            reference = rows
+        differ = sum(row != other for row, other in zip(rows, reference)) + abs(len(rows) - len(reference))
+        same = "same rows" if not differ else f"⚠️ {differ} rows differ"
+        print(f"   {parser:<12} parse {best_parse * 1000:7.1f} ms  parse + extract {best * 1000:8.1f} ms  {len(rows):5d} rows  "
+              f"{len(rows) / best if best else 0:9.0f} rows/s  {same}")
+
+
+def main():
+    """Compare the HTML parser backends on recorded page snapshots of every site"""
+    sites = sys.argv[1:] or SITES
+    found = False
+    for site in sites:
+        paths = list_snapshots(site)
+        if not paths:
+            continue
+        found = True
+        adapter = adapter_class(site)()
+        print(f"\n--- {site} ---")
+        for path in paths:
+            benchmark_snapshot(adapter, path)
+
+    if not found:
+        print(f"❌ No snapshots found in {SNAPSHOT_DIR}/<site>/*.html")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Shared scraper engine
+
+Owns the browser lifecycle, pagination, extraction helpers, dedup and persistence so that
+each site only has to describe itself as a SiteAdapter (see the sites package).
+
+The engine runs on playwright.async_api: run_adapter_async / run_adapters_async are the
+coroutines, run_adapter / run_adapters the blocking entry points used by the scripts.
+"""
+
+from engine.adapter import SiteAdapter
+from engine.blocking import ResourceBlocker, resource_blocker
+from engine.browser import close_browser, get_browser_and_page
+from engine.cursor import CrawlCursor
+from engine.keys import RecordIndex, canonical_url, fold_text, normalize_key
+from engine.page_state import JsonResponses, read_page_state
+from engine.pagination import HashOffset, InfiniteScroll, LoadMore, NextButton, PageParam, SinglePage
+from engine.pool import PagePool, detail_pool
+from engine.runner import RunState, run_adapter, run_adapter_async, run_adapters, run_adapters_async, scrape
+from engine.store import SqliteStore, open_store
+from engine.storage import StreamingCsvWriter, count_rows, load_existing_keys, save_data, save_incremental_data
+from engine.timing import span, timings
+from engine.waits import (
+    wait_for_count_growth,
+    wait_for_dom_settle,
+    wait_for_selector_or_settle,
+    wait_for_selector_state,
+    wait_stats,
+)
+
+__all__ = [
+    "SiteAdapter",
+    "RunState",
+    "run_adapter",
+    "run_adapter_async",
+    "run_adapters",
+    "run_adapters_async",
+    "scrape",
+    "get_browser_and_page",
+    "close_browser",
+    "ResourceBlocker",
+    "resource_blocker",
+    "RecordIndex",
+    "normalize_key",
+    "canonical_url",
+    "fold_text",
+    "JsonResponses",
+    "read_page_state",
+    "SinglePage",
+    "NextButton",
+    "LoadMore",
+    "InfiniteScroll",
+    "HashOffset",
+    "PageParam",
+    "CrawlCursor",
+    "PagePool",
+    "detail_pool",
+    "save_data",
+    "save_incremental_data",
+    "StreamingCsvWriter",
+    "SqliteStore",
+    "open_store",
+    "load_existing_keys",
+    "count_rows",
+    "wait_for_count_growth",
+    "wait_for_dom_settle",
+    "wait_for_selector_or_settle",
+    "wait_for_selector_state",
+    "wait_stats",
+    "span",
+    "timings",
+]
@@ -0,0 +1,201 @@
+import os
+
+from engine.browser import site_name, storage_state_path
+from engine.browser_extract import extract_rows_in_browser
+from engine.config import BASE_URL_OVERRIDE, DEFAULT_TIMEOUT, HEADLESS, LIVE_STATS, RUN_REPORT
+from engine.extract import CardBatch, parse_page
+from engine.keys import RecordIndex, normalize_key
+from engine.pagination import SinglePage
+
+
+class SiteAdapter:
+    """Declarative description of one site
+
+    Subclasses set the class attributes below and implement parse_card(); the engine takes
+    care of the browser, pagination, dedup and persistence. Any attribute can be overridden
+    per run with keyword arguments, e.g. OpenVCAdapter(url=..., max_items=100).
+
+    Hooks that touch the page (prepare, after_open, extract_rows, enrich) are coroutines
+    on the playwright.async_api page; parse_card / parse_detail only see parsed HTML.
+    """
+
+    # --- What to scrape ---
+    name = "Site"
+    url = None
+    domain = None  # substring expected in the URL after navigation
+    output_filename = None
+    max_items = 0  # 0 = no limit
+    limit_includes_existing = False  # count rows already in the CSV towards max_items
+
+    # --- How to find rows ---
+    card_selectors = []  # first selector that matches anything wins
+    incremental = False  # only read cards added since the last step (see engine/incremental.py)
+    html_parser = None  # "html.parser", "lxml" or "selectolax" (None = config.HTML_PARSER)
+    js_fields = None  # {field: selector(s) or (selector(s), kind)} read in the browser (see engine/browser_extract.py)
+    ready_marker = None  # substring expected in the page HTML once loaded
+    key_field = "Name"  # natural key used for dedup and resume
+    normalize_keys = True  # fold case / whitespace and canonicalize URLs before comparing keys
+    empty_value = "-"  # placeholder for missing fields
+
+    # --- Navigation ---
+    pagination = SinglePage()
+    wait_until = "domcontentloaded"
+    open_wait_ms = 5000  # wait after the first navigation
+    visit_profiles = True  # run the enrich() profile pass when the adapter has one
+    detail_delay_range = None  # (min, max) seconds between profile visits
+    detail_workers = 1  # tabs loading profile pages at once (1 = one by one on the main page)
+    detail_host_limit = 4  # max tabs loading the same host at once
+    detail_min_interval = 0  # min seconds between two profile requests to the same host
+    detail_settle_ms = 0  # wait after a pooled profile page has loaded
+    detail_wait_selector = None  # pooled profile pages wait for this (client-rendered content)
+    detail_wait_ms = 10000  # ceiling of that wait
+    detail_wait_quiet_ms = None  # also stop waiting once the page is quiet this long without it
+    stream_details = False  # with the tab pool, read profiles while the list is still being walked
+    detail_fields = []  # fields the profile pass adds (CSV columns even when the first profile fails)
+
+    # --- Persistence ---
+    resume = True  # skip rows whose key is already in the CSV
+    keyboard_stop = False  # press any key to stop and save
+    use_sqlite = False  # keep rows in <output_filename>.db, unique on key_field (see engine/store.py)
+    run_report = RUN_REPORT  # write <output_filename>_run_report.json at exit (see engine/timing.py)
+    live_stats = LIVE_STATS  # one live status line instead of the progress prints
+    resume_cursor = True  # with resume, restart after the last completed page (see engine/cursor.py)
+
+    # --- Browser ---
+    headless = None  # None = config.HEADLESS, but with a window while a login still has to be saved
+    requires_login = False  # the site needs a logged-in session (kept in the saved browser state)
+    keep_state = True  # save cookies / localStorage to browser_state/<site>.json after each run
+    persistent = False  # True = use the Chrome profile from config instead of the saved state
+    user_data_dir = None
+    profile_directory = None
+    extra_browser_args = []
+    context_options = {}
+    timeout = DEFAULT_TIMEOUT
+    block_resources = True  # abort images, media, fonts and trackers (see engine/blocking.py)
+    allowed_resources = []  # resource types or URL substrings that must load anyway
+    base_url_override = BASE_URL_OVERRIDE  # mock server answering this site's requests (see engine/mock_site.py)
+
+    def __init__(self, **overrides):
+        for attribute, value in overrides.items():
+            if not hasattr(self, attribute):
+                raise AttributeError(f"{type(self).__name__} has no setting '{attribute}'")
+            setattr(self, attribute, value)
+
+    def browser_options(self):
+        """Keyword arguments for get_browser_and_page()"""
+        return {
+            "headless": self.run_headless(),
+            "persistent": self.persistent,
+            "user_data_dir": self.user_data_dir,
+            "profile_directory": self.profile_directory,
+            "extra_args": self.extra_browser_args,
+            "context_options": self.context_options,
+            "timeout": self.timeout,
+            "storage_state": None if self.persistent else self.state_path(),
+        }
+
+    def state_path(self):
+        """File with this site's saved cookies / localStorage"""
+        return storage_state_path(site_name(self))
+
+    def has_saved_state(self):
+        return os.path.exists(self.state_path())
+
+    def run_headless(self):
+        """Whether the browser runs without a window for this run"""
+        if self.headless is not None:
+            return self.headless
+        if self.requires_login and not self.persistent and not self.has_saved_state():
+            # No saved login yet: open a window so it can be done once by hand
+            return False
+        return HEADLESS
+
+    # --- Hooks ---
+
+    async def prepare(self, page):
+        """Run before the list page is opened (login, session restore). Return False to abort."""
+        return True
+
+    async def after_open(self, page):
+        """Run once the list page is loaded (login form checks). Return False to abort."""
+        return True
+
+    def parse_page(self, html):
+        """Parsed list page handed to extract_rows (soup or CardBatch)"""
+        return parse_page(html, self.card_selectors, self.html_parser)
+
+    def select_cards(self, soup):
+        """Return the card elements in the current page"""
+        if isinstance(soup, CardBatch):
+            return soup.cards
+        for selector in self.card_selectors:
+            cards = soup.select(selector)
+            if cards:
+                return cards
+        return []
+
+    def parse_card(self, card):
+        """Turn one card element into a row dict (None to skip it)"""
+        raise NotImplementedError
+
+    async def extract_rows(self, page, soup, run):
+        """Yield the rows visible in the current page state"""
+        if self.js_fields:
+            rows = await extract_rows_in_browser(
+                page, self.card_selectors, self.js_fields, self.empty_value, only_new=self.incremental,
+                required=[self.key_field]
+            )
+            for row in rows:
+                row = self.finish_row(row)
+                if row:
+                    yield row
+            return
+
+        for card in self.select_cards(soup):
+            try:
+                row = self.parse_card(card)
+            except Exception as e:
+                print(f"Error extracting row: {e}")
+                continue
+            if row:
+                yield row
+
+    def finish_row(self, row):
+        """Post-process a row read in the browser with js_fields (None to skip it)"""
+        return row
+
+    def has_detail(self):
+        """True when rows need a second visit to their profile page"""
+        return self.visit_profiles and type(self).enrich is not SiteAdapter.enrich
+
+    async def enrich(self, page, row):
+        """Visit the row's profile page and return the extra fields"""
+        return {}
+    def uses_detail_pool(self):
+        """True when profile pages are loaded by a PagePool instead of enrich()"""
+        return self.detail_workers > 1 and type(self).parse_detail is not SiteAdapter.parse_detail
+
+    def detail_url(self, row):
+        """URL of the row's profile page for the page pool (None = nothing to visit)"""
+        return None
+
+    def parse_detail(self, soup, row):
+        """Return the extra fields from a profile page loaded by the page pool"""
+        return {}
+
+    def row_key(self, row):
+        """Dedup key of a row"""
+        value = row.get(self.key_field)
+        return str(value) if value is not None else None
+
+    def normalize_key(self, key):
+        """Form of a key used for dedup and resume"""
+        return normalize_key(key) if self.normalize_keys else str(key)
+
+    def key_index(self):
+        """Empty RecordIndex using this adapter's key normalization"""
+        return RecordIndex(self.normalize_key)
+
+    def is_empty(self, row):
+        """True when every field of the row is the empty placeholder"""
+        return all(value == self.empty_value for value in row.values())
@@ -0,0 +1,95 @@
+from engine.config import BLOCKED_RESOURCE_TYPES, TRACKER_DOMAINS
+
+# Rough transfer size of one aborted request, used to estimate the bytes a run saved
+# (an aborted request never tells us its real size)
+ESTIMATED_BYTES = {
+    "image": 40 * 1024,
+    "media": 500 * 1024,
+    "font": 30 * 1024,
+    "tracker": 25 * 1024,
+}
+
+
+class BlockStats:
+    """Requests aborted by a ResourceBlocker, per reason"""
+
+    def __init__(self):
+        self.blocked = {}  # reason -> aborted requests
+        self.allowed = 0
+
+    def record(self, reason):
+        self.blocked[reason] = self.blocked.get(reason, 0) + 1
+
+    def requests_saved(self):
+        return sum(self.blocked.values())
+
+    def bytes_saved(self):
+        """Estimated bytes not downloaded"""
+        return sum(ESTIMATED_BYTES.get(reason, 0) * count for reason, count in self.blocked.items())
+
+    def summary(self):
+        return {
+            "requests_allowed": self.allowed,
+            "requests_saved": self.requests_saved(),
+            "bytes_saved_estimate": self.bytes_saved(),
+            "blocked": dict(self.blocked),
+        }
+
+    def print_summary(self):
+        if not self.blocked:
+            return
+        details = ", ".join(f"{count} {reason}" for reason, count in self.blocked.items())
+        print(f"🚫 Blocked {self.requests_saved()} requests ({details}), "
+              f"~{self.bytes_saved() / (1024 * 1024):.1f} MB saved, {self.allowed} allowed")
+
+
+class ResourceBlocker:
+    """Route filter aborting images, media, fonts and trackers a scraper never reads
+
+    allow is a list of resource types (e.g. "image") or URL substrings that must still
+    load. Attach it to a browser context to cover every tab, or to single pages.
+    """
+
+    def __init__(self, resource_types=None, tracker_domains=None, allow=None):
+        self.resource_types = set(BLOCKED_RESOURCE_TYPES if resource_types is None else resource_types)
+        self.tracker_domains = list(TRACKER_DOMAINS if tracker_domains is None else tracker_domains)
+        self.allow = list(allow or [])
+        self.stats = BlockStats()
+        self.attached = []
+
+    def block_reason(self, request):
+        """Why request should be aborted, or None to let it through"""
+        url = request.url
+        resource_type = request.resource_type
+        if resource_type in self.allow or any(part in url for part in self.allow if part):
+            return None
+        if resource_type in self.resource_types:
+            return resource_type
+        if any(domain in url for domain in self.tracker_domains):
+            return "tracker"
+        return None
+
+    async def handle(self, route):
+        reason = self.block_reason(route.request)
+        if reason is None:
+            self.stats.allowed += 1
+            # Other route handlers (MockRouter) still get the request, then the network
+            await route.fallback()
+        else:
+            self.stats.record(reason)
+            await route.abort()
+
+    async def attach(self, target):
+        """Start filtering the requests of a page or browser context (once per target)"""
+        context = getattr(target, "context", None)
+        if any(attached is target or attached is context for attached in self.attached):
+            return
+        await target.route("**/*", self.handle)
+        self.attached.append(target)
+
+
+def resource_blocker(adapter):
+    """ResourceBlocker for an adapter's block_resources / allowed_resources, or None"""
+    if not adapter.block_resources:
+        return None
+    return ResourceBlocker(allow=adapter.allowed_resources)
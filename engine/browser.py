@@ -0,0 +1,124 @@
+import os
+import re
+
+from playwright.async_api import async_playwright
+
+from engine.config import (
+    BASE_BROWSER_ARGS,
+    CHROME_PROFILE_DIRECTORY,
+    CHROME_USER_DATA_DIR,
+    DEFAULT_TIMEOUT,
+    STORAGE_STATE_DIR,
+    USER_AGENT,
+)
+
+
+def storage_state_path(name):
+    """File holding the cookies / localStorage saved for a site"""
+    return os.path.join(STORAGE_STATE_DIR, f"{re.sub(r'[^A-Za-z0-9_.-]+', '_', name)}.json")
+
+
+def site_name(adapter):
+    """Key under which an adapter's browser state is kept"""
+    return adapter.domain or adapter.name
+
+
+async def save_storage_state(context, path):
+    """Write a context's cookies and localStorage to path"""
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        await context.storage_state(path=path)
+        print(f"🍪 Browser state saved to {path}")
+        return True
+    except Exception as e:
+        print(f"⚠️  Could not save browser state to {path}: {e}")
+        return False
+
+
+async def get_browser_and_page(headless=True, persistent=False, user_data_dir=None, profile_directory=None,
+                         extra_args=None, context_options=None, timeout=DEFAULT_TIMEOUT, storage_state=None):
+    """Initialize Playwright browser with Chromium
+
+    Returns (browser, page, playwright). By default "browser" is a fresh Chromium instance
+    with one context, seeded from the storage_state file when it exists. With
+    persistent=True it is the persistent context opened on the Chrome profile instead.
+    """
+    user_data_dir = user_data_dir or CHROME_USER_DATA_DIR
+    profile_directory = profile_directory or CHROME_PROFILE_DIRECTORY
+
+    print("🔒 Using Chromium browser with Playwright")
+    if persistent:
+        print(f"📁 Profile Path: {user_data_dir}/{profile_directory}")
+    print(f"🖥️  Headless mode: {'ON' if headless else 'OFF'}")
+
+    playwright = await async_playwright().start()
+
+    try:
+        print("🚀 Initializing Playwright with Chromium...")
+
+        args = list(BASE_BROWSER_ARGS)
+        if persistent:
+            args.insert(0, f"--profile-directory={profile_directory}")
+        if not headless:
+            args.append("--start-maximized")
+        for arg in extra_args or []:
+            if arg not in args:
+                args.append(arg)
+
+        options = {"user_agent": USER_AGENT}
+        options.update(context_options or {})
+
+        if persistent:
+            browser = await playwright.chromium.launch_persistent_context(
+                user_data_dir=user_data_dir,
+                headless=headless,
+                args=args,
+                **options
+            )
+            # Get the first page (or create a new one)
+            page = browser.pages[0] if browser.pages else await browser.new_page()
+        else:
+            if storage_state and os.path.exists(storage_state):
+                options["storage_state"] = storage_state
+                print(f"🍪 Reusing saved browser state: {storage_state}")
+            browser = await playwright.chromium.launch(headless=headless, args=args)
+            context = await browser.new_context(**options)
+            page = await context.new_page()
+
+        print("✅ Playwright initialized with Chromium!")
+
+        # Set timeouts
+        page.set_default_timeout(timeout)
+        page.set_default_navigation_timeout(timeout)
+
+        return browser, page, playwright
+
+    except Exception as e:
+        print(f"❌ CRITICAL ERROR: Failed to initialize Playwright with Chromium!")
+        print(f"Error details: {e}")
+        print("\n🔧 TROUBLESHOOTING STEPS:")
+        print("1. Make sure Chrome is completely closed")
+        print("2. Check if the profile path exists:")
+        print(f"   {user_data_dir}/{profile_directory}")
+        print("3. Try running Chrome manually first to ensure the profile works")
+        print("4. Check if you have permission to access the Chrome profile directory")
+        print("5. Install Playwright: pip install playwright && playwright install chromium")
+        print("\n❌ This scraper uses Chromium with your Chrome profile.")
+        await playwright.stop()
+        raise Exception("Cannot initialize Playwright with Chromium. Please fix the installation and try again.")
+
+
+async def close_browser(browser, playwright=None):
+    """Close the browser (or persistent context) and stop Playwright"""
+    if browser:
+        try:
+            await browser.close()
+            print("✅ Browser closed.")
+        except Exception as e:
+            print(f"⚠️  Error closing browser: {e}")
+
+    if playwright:
+        try:
+            await playwright.stop()
+        except Exception as e:
+            print(f"⚠️  Error stopping Playwright: {e}")
@@ -0,0 +1,94 @@
+from engine.incremental import SEEN_MARKER
+
+# Reads every card's fields inside the page and returns only the row dicts.
+# fields: [[name, [selectors...], kind]] where kind is "text" (first non-empty text),
+# "texts" (every text, joined) or "@attribute"; cards matched by the first selector that
+# matches anything. With a marker only cards without it are read (and then marked).
+EXTRACT_ROWS_SCRIPT = """
+([cardSelectors, fields, emptyValue, separator, marker, required]) => {
+    const cardSelector = cardSelectors.find(s => document.querySelector(s));
+    if (!cardSelector) {
+        return [];
+    }
+    const text = element => (element.textContent || "").trim();
+    const readField = (card, selectors, kind) => {
+        for (const selector of selectors) {
+            const elements = selector ? Array.from(card.querySelectorAll(selector)) : [card];
+            if (kind === "texts") {
+                const texts = elements.map(text).filter(Boolean);
+                if (texts.length) {
+                    return texts.join(separator);
+                }
+            } else if (kind.startsWith("@")) {
+                for (const element of elements) {
+                    const value = (element.getAttribute(kind.slice(1)) || "").trim();
+                    if (value) {
+                        return value;
+                    }
+                }
+            } else if (elements.length && text(elements[0])) {
+                return text(elements[0]);
+            }
+        }
+        return emptyValue;
+    };
+
+    const query = marker ? `${cardSelector}:not([${marker}])` : cardSelector;
+    const rows = [];
+    for (const card of document.querySelectorAll(query)) {
+        if (marker && !text(card)) {
+            continue;
+        }
+        const row = {};
+        for (const [name, selectors, kind] of fields) {
+            row[name] = readField(card, selectors, kind);
+        }
+        if (marker) {
+            // A card still rendering is left for the next read instead of being lost
+            if (required.some(name => row[name] === emptyValue)) {
+                continue;
+            }
+            card.setAttribute(marker, "");
+        }
+        rows.push(row);
+    }
+    return rows;
+}
+"""
+
+PAGE_HAS_TEXT_SCRIPT = "marker => document.documentElement.outerHTML.toLowerCase().includes(marker)"
+
+
+def compile_fields(js_fields):
+    """Turn {field: selector | [selectors] | (selector(s), kind)} into the script's field list"""
+    compiled = []
+    for name, spec in js_fields.items():
+        selectors, kind = spec if isinstance(spec, tuple) else (spec, "text")
+        if isinstance(selectors, str):
+            selectors = [selectors]
+        compiled.append([name, list(selectors), kind])
+    return compiled
+
+
+async def extract_rows_in_browser(page, card_selectors, js_fields, empty_value="-", separator=", ",
+                                  only_new=False, required=()):
+    """Row dicts of every card, read by one page.evaluate call
+
+    Only the values cross the Playwright pipe, so the cost follows the data rather than
+    the markup. With only_new the cards already read on this page are skipped, and a card
+    whose `required` fields are still empty is not returned nor marked as read, so the
+    next call reads it again once it has rendered.
+    """
+    return await page.evaluate(EXTRACT_ROWS_SCRIPT, [
+        list(card_selectors),
+        compile_fields(js_fields),
+        empty_value,
+        separator,
+        SEEN_MARKER if only_new else None,
+        [name for name in required if name in js_fields],
+    ])
+
+
+async def page_has_text(page, marker):
+    """True when the page's HTML contains marker (case-insensitive), checked in the browser"""
+    return await page.evaluate(PAGE_HAS_TEXT_SCRIPT, marker.lower())
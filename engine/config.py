@@ -0,0 +1,81 @@
+import os
+
+# <<<<<<< SHARED BROWSER CONFIGURATION >>>>>>>
+# Settings every site used to copy into its own get_browser_and_page()
+
+# Your Chrome profile path (automatically configured based on your system)
+# Profile Path: /Users/Nomercya/Library/Application Support/Google/Chrome/Profile 1
+CHROME_USER_DATA_DIR = "/Users/Nomercya/Library/Application Support/Google/Chrome"
+CHROME_PROFILE_DIRECTORY = "Profile 1"
+
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36"
+
+# Arguments passed to Chromium for every site
+BASE_BROWSER_ARGS = [
+    "--disable-blink-features=AutomationControlled",
+    "--disable-dev-shm-usage"
+]
+
+# BrowserManager: where each site's cookies / localStorage are kept between runs, and how
+# many pages a context may load before it is replaced by a fresh one
+STORAGE_STATE_DIR = "browser_state"
+CONTEXT_MAX_PAGES = 200
+# Pages one tab of a PagePool loads before it is closed and replaced (0 = never)
+POOL_TAB_MAX_PAGES = 100
+
+# Sites run without a window unless they need an interactive login that has not been
+# saved yet (python login.py <site>)
+HEADLESS = True
+
+# Default Playwright timeouts (milliseconds)
+DEFAULT_TIMEOUT = 60000  # 60 seconds
+
+# Encoding used for every CSV we write (Excel friendly)
+CSV_ENCODING = "utf-8-sig"
+
+# BeautifulSoup backend used when an adapter does not pick one: "html.parser", "lxml"
+# or "selectolax" (see engine/extract.py)
+HTML_PARSER = "html.parser"
+
+# Recorded pages used by the offline benchmarks: snapshots/<site>/<page>.html
+SNAPSHOT_DIR = "snapshots"
+
+# Answer every site from the local mock server instead of the live site, e.g.
+# "http://127.0.0.1:8765" (see mock_server.py). None = the real sites; the
+# SCRAPER_BASE_URL environment variable sets it without editing a script.
+BASE_URL_OVERRIDE = os.environ.get("SCRAPER_BASE_URL") or None
+
+# Each run writes <output_filename>_run_report.json (rows/sec, time per stage, waits);
+# LIVE_STATS replaces the progress prints by one status line refreshed every second
+RUN_REPORT = True
+LIVE_STATS = False
+
+# Rows are buffered and written every CSV_BATCH_SIZE rows or CSV_FLUSH_INTERVAL seconds
+CSV_BATCH_SIZE = 25
+CSV_FLUSH_INTERVAL = 5.0
+
+# Resource types aborted by the request filter (see engine/blocking.py)
+BLOCKED_RESOURCE_TYPES = ["image", "media", "font"]
+
+# Third-party analytics / ad hosts aborted by the request filter
+TRACKER_DOMAINS = [
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googleadservices.com",
+    "doubleclick.net",
+    "connect.facebook.net",
+    "facebook.com/tr",
+    "snap.licdn.com",
+    "ads-twitter.com",
+    "static.hotjar.com",
+    "script.hotjar.com",
+    "cdn.segment.com",
+    "api.segment.io",
+    "cdn.mxpnl.com",
+    "js.hs-scripts.com",
+    "js.hs-analytics.net",
+    "fullstory.com",
+    "clarity.ms",
+    "widget.intercom.io",
+    "js.intercomcdn.com"
+]
@@ -0,0 +1,66 @@
+import json
+import os
+import time
+
+
+class CrawlCursor:
+    """Last completed pagination position of one site, kept next to its CSV
+
+    <output_filename>_cursor.json holds the position kind ("next_page", "load_more",
+    "hash_offset", "page_param", "api_page"), the position itself, the dedup watermark
+    (records saved so far and the last saved key) and the rows still waiting for their
+    profile pass. It is rewritten at every page boundary through a temporary file and a
+    rename, so a crash leaves either the previous or the new cursor on disk.
+    """
+
+    def __init__(self, filename):
+        self.path = f"{filename}_cursor.json"
+        self.state = None
+
+    def load(self):
+        """Saved cursor, or None"""
+        if not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                self.state = json.load(f)
+        except Exception as e:
+            print(f"⚠️ Could not read crawl cursor {self.path}: {e} - starting from the beginning")
+            self.state = None
+        return self.state
+
+    def position(self, kind):
+        """Last completed position of this kind (None when the cursor holds another kind)"""
+        if self.state is None or self.state.get("kind") != kind:
+            return None
+        return self.state.get("position")
+
+    def save(self, kind, position, saved_rows, last_key=None, pending=None):
+        """Atomically replace the cursor on disk"""
+        self.state = {
+            "kind": kind,
+            "position": position,
+            "saved_rows": saved_rows,
+            "last_key": last_key,
+            "pending": pending or [],
+            "updated_at": time.time(),
+        }
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.state, f, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            print(f"⚠️ Could not save crawl cursor {self.path}: {e}")
+
+    def clear(self):
+        """Forget the cursor (the crawl reached the end of the list)"""
+        self.state = None
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"⚠️ Could not remove crawl cursor {self.path}: {e}")
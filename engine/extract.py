@@ -0,0 +1,154 @@
+from bs4 import BeautifulSoup
+
+from engine.config import HTML_PARSER
+
+try:
+    import lxml  # noqa: F401
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# Backends understood by parse_html / parse_page
+PARSERS = ["html.parser", "lxml", "selectolax"]
+
+_warned = set()
+
+
+def resolve_parser(parser=None):
+    """Backend actually used for parser (None = HTML_PARSER), falling back when not installed"""
+    parser = parser or HTML_PARSER
+    if parser == "selectolax" and LexborHTMLParser is None:
+        parser = _fall_back("selectolax", "lxml", "pip install selectolax")
+    if parser == "selectolax" and not HAS_LXML and "selectolax+lxml" not in _warned:
+        # lexbor still finds the cards; their BeautifulSoup trees come from html.parser
+        _warned.add("selectolax+lxml")
+        print("⚠️ selectolax builds its BeautifulSoup trees with lxml, which is not installed "
+              "(pip install lxml) - using html.parser for them")
+    if parser == "lxml" and not HAS_LXML:
+        parser = _fall_back("lxml", "html.parser", "pip install lxml")
+    if parser not in PARSERS:
+        parser = _fall_back(parser, "html.parser", f"choose one of {', '.join(PARSERS)}")
+    return parser
+
+
+def _fall_back(wanted, used, hint):
+    if wanted not in _warned:
+        _warned.add(wanted)
+        print(f"⚠️ HTML parser '{wanted}' not available ({hint}) - using {used}")
+    return used
+
+
+def soup_builder(parser):
+    """BeautifulSoup tree builder for a resolved backend ("selectolax" has none of its own)"""
+    if parser == "selectolax":
+        return "lxml" if HAS_LXML else "html.parser"
+    return parser
+
+
+def parse_html(html, parser=None):
+    """Parse an HTML string into a BeautifulSoup tree
+
+    parser picks the tree builder ("html.parser" or "lxml"); "selectolax" builds a
+    BeautifulSoup tree with lxml (html.parser without it), since only parse_page can hand
+    cards out of lexbor.
+    """
+    return BeautifulSoup(html, soup_builder(resolve_parser(parser)))
+
+
+class CardBatch:
+    """A list of card elements standing in for the whole-page soup
+
+    Each card is parsed on its own from its outer HTML; SiteAdapter.select_cards() returns
+    them as they are, so parse_card() sees the same BeautifulSoup elements as usual.
+    """
+
+    def __init__(self, fragments, parser=None):
+        self.cards = []
+        for fragment in fragments:
+            soup = parse_html(fragment, parser)
+            # lxml wraps a fragment in <html><body>, html.parser does not
+            card = (soup.body if soup.body is not None else soup).find()
+            if card is not None:
+                self.cards.append(card)
+
+    def __len__(self):
+        return len(self.cards)
+
+
+def parse_page(html, card_selectors=(), parser=None):
+    """Parse a list page for its cards
+
+    With the selectolax backend lexbor parses the whole page and only the cards matched
+    by the first selector that matches anything are turned into BeautifulSoup elements
+    (a CardBatch); otherwise the whole page becomes a BeautifulSoup tree.
+    """
+    parser = resolve_parser(parser)
+    if parser != "selectolax" or not card_selectors:
+        return parse_html(html, parser)
+
+    tree = LexborHTMLParser(html)
+    for selector in card_selectors:
+        nodes = tree.css(selector)
+        if nodes:
+            return CardBatch([node.html for node in nodes], soup_builder(parser))
+    return CardBatch([])
+
+
+def text_of(node, selector, default="-"):
+    """Return the stripped text of the first element matching selector, or default"""
+    element = node.select_one(selector)
+    if element:
+        text = element.get_text().strip()
+        if text:
+            return text
+    return default
+
+
+def texts_of(node, selector, separator=", ", default="-"):
+    """Join the stripped texts of every element matching selector, or default"""
+    texts = [element.get_text().strip() for element in node.select(selector)]
+    texts = [text for text in texts if text]
+    return separator.join(texts) if texts else default
+
+
+def attr_of(node, selector, attribute="href", default="-"):
+    """Return an attribute of the first element matching selector, or default"""
+    element = node.select_one(selector)
+    if element and element.has_attr(attribute):
+        value = element[attribute].strip()
+        if value:
+            return value
+    return default
+
+
+def absolute_url(href, base_url):
+    """Turn a relative link into an absolute one on base_url"""
+    if not href or href.startswith('http'):
+        return href
+    if href.startswith('/'):
+        return f"{base_url}{href}"
+    return f"{base_url}/{href}"
+
+
+def select_first(soup, selectors):
+    """Return the elements of the first selector that matches anything"""
+    for selector in selectors:
+        elements = soup.select(selector)
+        if elements:
+            return elements
+    return []
+
+
+def select_largest(soup, selectors):
+    """Return the largest element list produced by any of the selectors"""
+    best = []
+    for selector in selectors:
+        elements = soup.select(selector)
+        if len(elements) > len(best):
+            best = elements
+    return best
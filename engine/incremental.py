@@ -0,0 +1,30 @@
+from engine.extract import CardBatch
+
+# Attribute put on every card already handed to the scraper
+SEEN_MARKER = "data-scraped"
+
+# Returns the outerHTML of the cards not marked yet (for the first selector matching anything)
+# and marks them. Cards without text are left unmarked so they are read once they render.
+NEW_CARDS_SCRIPT = """
+([selectors, marker]) => {
+    const selector = selectors.find(s => document.querySelector(s));
+    if (!selector) {
+        return [];
+    }
+    const fresh = [];
+    for (const card of document.querySelectorAll(`${selector}:not([${marker}])`)) {
+        if (!card.textContent.trim()) {
+            continue;
+        }
+        card.setAttribute(marker, "");
+        fresh.push(card.outerHTML);
+    }
+    return fresh;
+}
+"""
+
+
+async def new_cards(page, card_selectors, parser=None):
+    """CardBatch of the cards that appeared since the last call on this page"""
+    fragments = await page.evaluate(NEW_CARDS_SCRIPT, [list(card_selectors), SEEN_MARKER])
+    return CardBatch(fragments, parser)
@@ -0,0 +1,65 @@
+import signal
+import sys
+import threading
+import time
+
+
+def get_key():
+    """Get a single keypress from the user (cross-platform)"""
+    try:
+        # For Unix-like systems (macOS, Linux)
+        if sys.platform != 'win32':
+            import termios
+            import tty
+            fd = sys.stdin.fileno()
+            old_settings = termios.tcgetattr(fd)
+            try:
+                tty.setraw(sys.stdin.fileno())
+                ch = sys.stdin.read(1)
+            finally:
+                termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+            return ch
+        else:
+            # For Windows
+            import msvcrt
+            return msvcrt.getch().decode('utf-8')
+    except:
+        return None
+
+
+def start_keyboard_listener(runs):
+    """Stop the runs (and save progress) when any key is pressed"""
+    if not sys.stdin.isatty():
+        return None
+
+    def keyboard_listener():
+        print("\n⌨️  Press any key to stop scraping and save progress...")
+        while not all(run.stop_requested for run in runs):
+            try:
+                key = get_key()
+                if key:
+                    print(f"\n🛑 Key '{key}' pressed! Stopping scraping and saving progress...")
+                    for run in runs:
+                        run.stop_requested = True
+                    break
+            except:
+                time.sleep(0.1)
+                continue
+
+    thread = threading.Thread(target=keyboard_listener, daemon=True)
+    thread.start()
+    return thread
+
+
+def install_signal_handlers(runs, on_interrupt):
+    """Handle Ctrl+C and other interruption signals for every run of this process"""
+
+    def signal_handler(signum, frame):
+        print("\n🛑 Script interrupted! Saving collected data...")
+        for run in runs:
+            run.stop_requested = True
+            on_interrupt(run)
+        sys.exit(0)
+
+    signal.signal(signal.SIGINT, signal_handler)  # Ctrl+C
+    signal.signal(signal.SIGTERM, signal_handler)  # Termination signal
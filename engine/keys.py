@@ -0,0 +1,87 @@
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that only track where a click came from: these names, and any utm_*
+TRACKING_PARAMS = ("fbclid", "gclid", "ref", "ref_src")
+TRACKING_PREFIXES = ("utm_",)
+
+
+def fold_text(value):
+    """Case- and whitespace-insensitive form of a text key ("  ACME  Ventures" -> "acme ventures")"""
+    return " ".join(str(value).split()).casefold()
+
+
+def canonical_url(url):
+    """One spelling per URL: https, lower-case host without www., no trailing slash,
+    fragment or tracking parameters, remaining query parameters sorted"""
+    parts = urlsplit(str(url).strip())
+    scheme = parts.scheme.lower()
+    if scheme in ("http", "https"):
+        scheme = "https"
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    )
+    return urlunsplit((scheme, host, parts.path.rstrip("/"), urlencode(query), ""))
+
+
+def normalize_key(value):
+    """Dedup form of a key: canonical URL for links, folded text otherwise"""
+    text = str(value).strip()
+    if text.lower().startswith(("http://", "https://", "www.")):
+        return canonical_url(text if "://" in text else f"https://{text}")
+    return fold_text(text)
+
+
+class RecordIndex:
+    """Insertion-ordered records keyed on a normalized key
+
+    Membership tests and inserts are dict lookups, so checking a key costs the same with
+    ten records or ten thousand. Keys are passed raw and normalized by the index.
+    """
+
+    def __init__(self, normalize=normalize_key):
+        self.normalize = normalize
+        self.records = {}  # normalized key -> record (None for a bare key)
+
+    def key(self, key):
+        """Normalized form of key (None for a missing key or one that normalizes to nothing)"""
+        if key is None:
+            return None
+        return self.normalize(key) or None
+
+    def __contains__(self, key):
+        normalized = self.key(key)
+        return normalized is not None and normalized in self.records
+
+    def __len__(self):
+        return len(self.records)
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def add(self, key, record=None):
+        """Store record under key unless the key is already known; True when it was added
+
+        A row without a key cannot be deduplicated: it is never stored, and always added.
+        """
+        normalized = self.key(key)
+        if normalized is None:
+            return True
+        if normalized in self.records:
+            return False
+        self.records[normalized] = record
+        return True
+
+    def update(self, keys):
+        for key in keys:
+            self.add(key)
+
+    def get(self, key, default=None):
+        normalized = self.key(key)
+        return default if normalized is None else self.records.get(normalized, default)
+
+    def values(self):
+        return self.records.values()
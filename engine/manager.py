@@ -0,0 +1,163 @@
+import asyncio
+import os
+
+from playwright.async_api import async_playwright
+
+from engine.browser import save_storage_state, site_name, storage_state_path
+from engine.config import BASE_BROWSER_ARGS, CONTEXT_MAX_PAGES, USER_AGENT
+from engine.interrupt import install_signal_handlers, start_keyboard_listener
+from engine.runner import RunState, run_adapter_async, save_partial_data
+
+
+class ManagedContext:
+    """An isolated browser context lent out by a BrowserManager
+
+    The context is seeded from the site's saved storage state (when there is one) and
+    counts the main-frame navigations of every tab opened in it, so the manager can swap
+    it for a fresh one once it has loaded max_pages pages.
+    """
+
+    def __init__(self, browser, name, context_options=None, keep_state=True):
+        self.browser = browser
+        self.name = name
+        self.context_options = context_options or {}
+        self.keep_state = keep_state
+        self.context = None
+        self.navigations = 0
+
+    async def open(self):
+        options = {"user_agent": USER_AGENT}
+        options.update(self.context_options)
+        state_path = storage_state_path(self.name)
+        if self.keep_state and os.path.exists(state_path):
+            options["storage_state"] = state_path
+            print(f"🍪 Seeding {self.name} context from {state_path}")
+        self.context = await self.browser.new_context(**options)
+        self.navigations = 0
+        self.context.on("page", self.watch_page)
+
+    def watch_page(self, page):
+        page.on("framenavigated", lambda frame: self.count_navigation(page, frame))
+
+    def count_navigation(self, page, frame):
+        if frame == page.main_frame:
+            self.navigations += 1
+
+    async def save_state(self):
+        """Write the context's cookies / localStorage for the next context of this site"""
+        if not self.keep_state or self.context is None:
+            return
+        await save_storage_state(self.context, storage_state_path(self.name))
+
+    async def recycle(self):
+        """Replace the context by a fresh one carrying the same storage state"""
+        print(f"♻️  Recycling {self.name} context after {self.navigations} page loads")
+        await self.close()
+        await self.open()
+
+    async def close(self):
+        if self.context is None:
+            return
+        await self.save_state()
+        try:
+            await self.context.close()
+        except Exception:
+            pass
+        self.context = None
+
+
+class BrowserManager:
+    """One warm Chromium process shared by many scraping jobs
+
+    Jobs borrow isolated contexts with acquire() and hand them back with release(). A
+    released context is kept for the next job on the same site until it has loaded
+    max_pages pages; it is then recycled as it comes back, when none of its tabs is in
+    use, to cap memory growth. No Chrome profile is locked, so any number of jobs (and
+    processes) can run side by side.
+    """
+
+    def __init__(self, headless=True, extra_args=None, max_pages=CONTEXT_MAX_PAGES):
+        self.headless = headless
+        self.extra_args = extra_args or []
+        self.max_pages = max_pages
+        self.playwright = None
+        self.browser = None
+        self.idle = {}  # site name -> [ManagedContext]
+        self.lent = []
+
+    async def start(self):
+        if self.browser is not None:
+            return
+        print("🚀 Starting shared Chromium...")
+        args = list(BASE_BROWSER_ARGS)
+        for arg in self.extra_args:
+            if arg not in args:
+                args.append(arg)
+        self.playwright = await async_playwright().start()
+        self.browser = await self.playwright.chromium.launch(headless=self.headless, args=args)
+        print(f"✅ Chromium ready (headless: {'ON' if self.headless else 'OFF'})")
+
+    async def acquire(self, name, context_options=None, keep_state=True):
+        """A context for site name: an idle one if available, otherwise a new one"""
+        await self.start()
+        idle = self.idle.get(name, [])
+        if idle:
+            managed = idle.pop()
+        else:
+            managed = ManagedContext(self.browser, name, context_options, keep_state)
+            await managed.open()
+        self.lent.append(managed)
+        return managed
+
+    async def release(self, managed):
+        """Give a context back; its storage state is saved for the site"""
+        if managed in self.lent:
+            self.lent.remove(managed)
+        if managed.navigations >= self.max_pages:
+            # Nothing runs in it any more - the safe moment to swap it (saves its state too)
+            await managed.recycle()
+        else:
+            await managed.save_state()
+        self.idle.setdefault(managed.name, []).append(managed)
+
+    async def stop(self):
+        """Close every context and the browser"""
+        for managed in self.lent + [m for contexts in self.idle.values() for m in contexts]:
+            await managed.close()
+        self.lent = []
+        self.idle = {}
+        if self.browser is not None:
+            try:
+                await self.browser.close()
+            except Exception:
+                pass
+            self.browser = None
+        if self.playwright is not None:
+            await self.playwright.stop()
+            self.playwright = None
+        print("✅ Shared Chromium closed.")
+
+    async def run_adapter(self, adapter, run=None):
+        """Run one site in a borrowed context"""
+        # A mock run's cookies must not replace the site's real saved state
+        keep_state = adapter.keep_state and not adapter.base_url_override
+        managed = await self.acquire(site_name(adapter), adapter.context_options, keep_state)
+        try:
+            return await run_adapter_async(adapter, managed.context, run)
+        finally:
+            await self.release(managed)
+
+    async def run_adapters(self, adapters, concurrency=4):
+        """Run many sites, at most `concurrency` at a time; returns each adapter's rows in order"""
+        runs = [RunState(adapter) for adapter in adapters]
+        install_signal_handlers(runs, save_partial_data)
+        if any(adapter.keyboard_stop for adapter in adapters):
+            start_keyboard_listener(runs)
+
+        slots = asyncio.Semaphore(max(1, concurrency))
+
+        async def job(adapter, run):
+            async with slots:
+                return await self.run_adapter(adapter, run)
+
+        return await asyncio.gather(*(job(adapter, run) for adapter, run in zip(adapters, runs)))
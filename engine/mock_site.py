@@ -0,0 +1,354 @@
+import json
+import re
+import zlib
+from urllib.parse import parse_qs, urlsplit
+
+from engine.extract import parse_html
+from engine.pagination import HashOffset, LoadMore, NextButton, PageParam, SinglePage
+from engine.snapshots import detail_snapshots, list_snapshots, read_snapshot
+
+SCRIPT_TAG = re.compile(r"<script\b[^>]*>.*?</script\s*>", re.IGNORECASE | re.DOTALL)
+SEEN_ATTRIBUTE = re.compile(r'\sdata-scraped(="")?')
+
+# Injected into every replayed list page in place of the site's own scripts. It plays the
+# pagination back from /__mock/ endpoints: "load_more" / "next_page" answer clicks on the
+# adapter's buttons (appending / swapping cards, removing the button after the last page),
+# "scroll" appends cards near the bottom, "hash_offset" swaps cards on hash changes and
+# modal opens a recorded modal on a card click (closed with Escape).
+EMULATION_SCRIPT = """
+(() => {
+    const mock = __MOCK_CONFIG__;
+    let page = 1;
+    let busy = false;
+
+    const parse = html => {
+        const template = document.createElement("template");
+        template.innerHTML = html;
+        return Array.from(template.content.children);
+    };
+    const cardSelector = mock.cardSelectors.find(s => document.querySelector(s)) || mock.cardSelectors[0];
+    const cards = () => cardSelector ? Array.from(document.querySelectorAll(cardSelector)) : [];
+    const first = cards()[0];
+    const slot = document.createComment("mock cards");
+    if (first) {
+        first.before(slot);
+    } else {
+        document.body.append(slot);
+    }
+
+    const insert = (fragments, replace) => {
+        const current = cards();
+        if (replace) {
+            current.forEach(card => card.remove());
+        }
+        let anchor = !replace && current.length ? current[current.length - 1] : slot;
+        for (const fragment of fragments) {
+            for (const element of parse(fragment)) {
+                anchor.after(element);
+                anchor = element;
+            }
+        }
+    };
+    const load = async (pageNum, replace) => {
+        const response = await fetch(`/__mock/cards?page=${pageNum}`);
+        if (!response.ok) {
+            throw new Error(`HTTP ${response.status}`);
+        }
+        insert(await response.json(), replace);
+        page = pageNum;
+    };
+    const more = async replace => {
+        if (busy || page >= mock.pages) {
+            return;
+        }
+        busy = true;
+        try {
+            await load(page + 1, replace);
+        } catch (e) {
+            console.warn("mock: page failed", e);
+        } finally {
+            busy = false;
+        }
+    };
+
+    const buttons = () => {
+        const found = [];
+        for (const selector of mock.buttons) {
+            if (selector.startsWith("/") || selector.startsWith("(")) {
+                const nodes = document.evaluate(selector, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                for (let i = 0; i < nodes.snapshotLength; i++) {
+                    found.push(nodes.snapshotItem(i));
+                }
+            } else {
+                found.push(...document.querySelectorAll(selector));
+            }
+        }
+        return found;
+    };
+    const dropButtons = () => {
+        if (page >= mock.pages) {
+            buttons().forEach(button => button.remove());
+        }
+    };
+
+    if (mock.mode === "load_more" || mock.mode === "next_page") {
+        dropButtons();
+        document.addEventListener("click", async event => {
+            if (!buttons().some(button => button.contains(event.target))) {
+                return;
+            }
+            event.preventDefault();
+            event.stopPropagation();
+            await more(mock.mode === "next_page");
+            dropButtons();
+        }, true);
+    } else if (mock.mode === "scroll") {
+        const nearBottom = () => {
+            if (window.innerHeight + window.scrollY >= document.body.scrollHeight - 300) {
+                more(false);
+            }
+        };
+        window.addEventListener("scroll", nearBottom);
+        window.addEventListener("wheel", nearBottom);
+        document.addEventListener("keydown", () => setTimeout(nearBottom, 50));
+    } else if (mock.mode === "hash_offset") {
+        const showHash = async () => {
+            const match = window.location.hash.match(new RegExp(mock.hashPattern));
+            const pageNum = match ? Math.floor(Number(match[1]) / mock.pageSize) + 1 : 1;
+            if (pageNum === page) {
+                return;
+            }
+            try {
+                await load(pageNum, true);
+            } catch (e) {
+                console.warn("mock: page failed", e);
+            }
+        };
+        window.addEventListener("hashchange", showHash);
+        showHash();
+    }
+
+    if (mock.modal) {
+        let opened = 0;
+        const closeModals = () => document.querySelectorAll("[data-mock-modal]").forEach(modal => modal.remove());
+        document.addEventListener("click", async event => {
+            if (!cardSelector || !event.target.closest(cardSelector) || event.target.closest("[data-mock-modal]")) {
+                return;
+            }
+            event.preventDefault();
+            const response = await fetch(`/__mock/modal?i=${opened++}`);
+            if (!response.ok) {
+                return;
+            }
+            closeModals();
+            const [modal] = parse(await response.text());
+            if (modal) {
+                modal.setAttribute("data-mock-modal", "");
+                document.body.append(modal);
+            }
+        }, true);
+        document.addEventListener("keydown", event => {
+            if (event.key === "Escape") {
+                closeModals();
+            }
+        });
+    }
+})();
+"""
+
+
+def emulation_mode(pagination):
+    """How the mock plays a pagination strategy back"""
+    if isinstance(pagination, NextButton):
+        return "next_page"
+    if isinstance(pagination, LoadMore):
+        return "load_more"
+    if isinstance(pagination, HashOffset):
+        return "hash_offset"
+    if isinstance(pagination, PageParam):
+        return "page_param"
+    if isinstance(pagination, SinglePage):
+        return "single"
+    return "scroll"  # InfiniteScroll and the site-specific scrollers
+
+
+def strip_scripts(html):
+    """A recorded page without the site's scripts (they would re-render or call the real APIs)"""
+    return SEEN_ATTRIBUTE.sub("", SCRIPT_TAG.sub("", html))
+
+
+class MockSite:
+    """One site's recorded snapshots served the way the live site would serve them
+
+    Page 1 is the first list snapshot with EMULATION_SCRIPT in place of the site's scripts;
+    the cards of the later snapshots are handed out page by page (only the ones a page added,
+    for strategies that append). Any other path of the site gets one of the recorded profile
+    pages, picked by the path so the same URL always gets the same page.
+    """
+
+    def __init__(self, site, adapter, modal_selector=None):
+        self.site = site
+        self.adapter = adapter
+        self.mode = emulation_mode(adapter.pagination)
+        self.list_path = urlsplit(adapter.url).path.rstrip("/")
+        self.list_pages = [strip_scripts(read_snapshot(path)) for path in list_snapshots(site)]
+        self.details = [strip_scripts(read_snapshot(path)) for path in detail_snapshots(site)]
+        self.cards = [self.page_cards(html) for html in self.list_pages]
+        self.modals = []
+        if modal_selector:
+            for html in self.details:
+                modal = parse_html(html).select_one(modal_selector)
+                if modal is not None:
+                    self.modals.append(str(modal))
+
+    def page_cards(self, html):
+        return [str(card) for card in self.adapter.select_cards(parse_html(html, self.adapter.html_parser))]
+
+    def card_page(self, page_num):
+        """Card fragments the mock hands out for a page (empty past the recorded pages)"""
+        if not 1 <= page_num <= len(self.cards):
+            return []
+        cards = self.cards[page_num - 1]
+        if self.mode in ("load_more", "scroll") and page_num > 1:
+            # The snapshots of appending lists hold every card so far
+            known = set(self.cards[page_num - 2])
+            cards = [card for card in cards if card not in known]
+        return cards
+
+    def card_selectors(self):
+        """CSS selectors the emulation script finds the cards with"""
+        if self.adapter.card_selectors:
+            return list(self.adapter.card_selectors)
+        pagination = self.adapter.pagination
+        for selector in (getattr(pagination, "wait_selector", None), getattr(pagination, "count_selector", None)):
+            if selector:
+                return [selector]
+        # select_cards() is Python only - describe the first recorded card instead
+        for html in self.list_pages:
+            cards = self.adapter.select_cards(parse_html(html, self.adapter.html_parser))
+            if cards:
+                return [".".join([cards[0].name] + cards[0].get("class", []))]
+        return []
+
+    def config(self):
+        pagination = self.adapter.pagination
+        config = {
+            "mode": self.mode,
+            "pages": len(self.list_pages),
+            "cardSelectors": self.card_selectors(),
+            "buttons": [],
+            "modal": bool(self.modals),
+        }
+        if self.mode == "next_page":
+            config["buttons"] = [pagination.selector]
+        elif self.mode == "load_more":
+            config["buttons"] = list(pagination.button_selectors)
+        elif self.mode == "hash_offset":
+            config["hashPattern"] = re.escape(pagination.template).replace(re.escape("{offset}"), r"(\d+)")
+            config["pageSize"] = pagination.page_size
+        return config
+
+    def with_emulation(self, html):
+        script = f"<script>{EMULATION_SCRIPT.replace('__MOCK_CONFIG__', json.dumps(self.config()))}</script>"
+        if "</body>" in html:
+            return html.replace("</body>", f"{script}</body>", 1)
+        return html + script
+
+    def empty_list_page(self):
+        """The first list page with its cards taken out (a page number past the end)"""
+        soup = parse_html(self.list_pages[0], self.adapter.html_parser)
+        for card in self.adapter.select_cards(soup):
+            card.decompose()
+        return str(soup)
+
+    def list_page(self, query):
+        if self.mode == "page_param":
+            pagination = self.adapter.pagination
+            values = query.get(pagination.param)
+            if values and values[0].isdigit():
+                index = int(values[0]) - pagination.start_page
+                if not 0 <= index < len(self.list_pages):
+                    return self.empty_list_page()
+                return self.list_pages[index]
+        return self.with_emulation(self.list_pages[0])
+
+    def respond(self, path, query_string=""):
+        """(status, content type, body) for a request to this site"""
+        query = parse_qs(query_string)
+        if path == "/__mock/cards":
+            page_num = int(query.get("page", ["1"])[0])
+            return 200, "application/json", json.dumps(self.card_page(page_num))
+        if path == "/__mock/modal":
+            if not self.modals:
+                return 404, "text/plain", "no recorded modal"
+            return 200, "text/html", self.modals[int(query.get("i", ["0"])[0]) % len(self.modals)]
+        if path.rstrip("/") == self.list_path and self.list_pages:
+            return 200, "text/html", self.list_page(query)
+        if self.details:
+            return 200, "text/html", self.details[zlib.crc32(path.encode()) % len(self.details)]
+        return 404, "text/plain", f"nothing recorded for {path}"
+
+
+class MockRouter:
+    """Route filter sending a site's own requests to the local mock server (mock_server.py)
+
+    Tabs keep the site's real URLs, so relative links, domain checks and detail_url() work
+    as usual; only the responses come from <base_url>/<host><path>. Requests to other
+    hosts fall through to the other route handlers (ResourceBlocker) and the network.
+    """
+
+    def __init__(self, base_url, host):
+        self.base_url = base_url.rstrip("/")
+        self.host = host
+        self.forwarded = 0
+        self.failed = 0
+        self.attached = []
+
+    def handles(self, url):
+        return self.host in (urlsplit(url).hostname or "")
+
+    def mock_url(self, url):
+        parts = urlsplit(url)
+        query = f"?{parts.query}" if parts.query else ""
+        return f"{self.base_url}/{parts.netloc}{parts.path or '/'}{query}"
+
+    async def handle(self, route):
+        url = route.request.url
+        if not self.handles(url):
+            await route.fallback()
+            return
+        try:
+            response = await route.fetch(url=self.mock_url(url))
+            self.forwarded += 1
+            await route.fulfill(response=response)
+        except Exception:
+            self.failed += 1
+            await route.abort()
+
+    async def attach(self, target):
+        """Start forwarding the requests of a page or browser context (once per target)"""
+        if any(attached is target for attached in self.attached):
+            return
+        await target.route("**/*", self.handle)
+        self.attached.append(target)
+        print(f"🧪 Requests to {self.host} are answered by the mock server at {self.base_url}")
+
+    async def detach(self):
+        """Stop forwarding (a shared context outlives the run)"""
+        for target in self.attached:
+            try:
+                await target.unroute("**/*", self.handle)
+            except Exception:
+                pass  # the context is already closed
+        self.attached = []
+
+    def print_summary(self):
+        print(f"🧪 Mock server answered {self.forwarded} requests ({self.failed} failed to reach it)")
+
+
+def mock_router(adapter):
+    """MockRouter for an adapter's base_url_override, or None to use the live site"""
+    if not adapter.base_url_override:
+        return None
+    host = adapter.domain or urlsplit(adapter.url).hostname
+    return MockRouter(adapter.base_url_override, host)
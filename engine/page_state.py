@@ -0,0 +1,149 @@
+import asyncio
+import json
+
+# Everything the page already holds as data: framework globals (Nuxt / Next / Redux style),
+# JSON <script> blocks and the state of the Vue components around anchor (Vue 2 __vue__,
+# Vue 3 __vueParentComponent). Cycles, DOM nodes and functions are dropped and nesting is
+# cut at maxDepth so reactive proxies serialize safely.
+PAGE_STATE_SCRIPT = """
+([anchorSelector, maxDepth]) => {
+    const seen = new WeakSet();
+    const plain = (value, depth) => {
+        if (value === null || typeof value !== "object") {
+            return typeof value === "function" || typeof value === "symbol" ? undefined : value;
+        }
+        if (depth > maxDepth || seen.has(value) || value instanceof Node || value === window) {
+            return undefined;
+        }
+        seen.add(value);
+        if (Array.isArray(value)) {
+            return value.map(item => plain(item, depth + 1)).filter(item => item !== undefined);
+        }
+        const copy = {};
+        for (const key of Object.keys(value)) {
+            if (key.startsWith("_") || key.startsWith("$")) {
+                continue;
+            }
+            let item;
+            try {
+                item = plain(value[key], depth + 1);
+            } catch (e) {
+                continue;
+            }
+            if (item !== undefined) {
+                copy[key] = item;
+            }
+        }
+        return copy;
+    };
+
+    const sources = [];
+    for (const name of ["__NUXT__", "__NEXT_DATA__", "__INITIAL_STATE__", "__PRELOADED_STATE__", "__APOLLO_STATE__"]) {
+        if (window[name]) {
+            sources.push(plain(window[name], 0));
+        }
+    }
+    for (const script of document.querySelectorAll('script[type="application/json"], script[type="application/ld+json"]')) {
+        try {
+            sources.push(JSON.parse(script.textContent));
+        } catch (e) {
+        }
+    }
+
+    let element = anchorSelector ? document.querySelector(anchorSelector) : null;
+    while (element) {
+        const vue2 = element.__vue__;
+        if (vue2) {
+            sources.push(plain(vue2.$data, 0), plain(vue2.$props, 0));
+            if (vue2.$store) {
+                sources.push(plain(vue2.$store.state, 0));
+            }
+        }
+        const vue3 = element.__vueParentComponent;
+        if (vue3) {
+            sources.push(plain(vue3.props, 0), plain(vue3.setupState, 0), plain(vue3.data, 0));
+        }
+        element = element.parentElement;
+    }
+    return sources.filter(source => source && typeof source === "object");
+}
+"""
+
+
+async def read_page_state(page, anchor_selector=None, max_depth=12):
+    """Data the page already holds (see PAGE_STATE_SCRIPT), as a list of JSON-like objects"""
+    try:
+        return await page.evaluate(PAGE_STATE_SCRIPT, [anchor_selector, max_depth])
+    except Exception as e:
+        print(f"⚠️ Could not read the page state: {e}")
+        return []
+
+
+class JsonResponses:
+    """Keeps the JSON bodies of the XHR / fetch responses a page receives
+
+    attach() before navigating; payloads() once the page is loaded returns every body that
+    parsed, bodies larger than max_bytes are skipped.
+    """
+
+    def __init__(self, max_bytes=20 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.bodies = []
+        self.tasks = []
+
+    def attach(self, page):
+        page.on("response", self.on_response)
+
+    def on_response(self, response):
+        if response.request.resource_type not in ("xhr", "fetch"):
+            return
+        if "json" not in response.headers.get("content-type", ""):
+            return
+        self.tasks.append(asyncio.ensure_future(self.read(response)))
+
+    async def read(self, response):
+        try:
+            body = await response.body()
+            if len(body) <= self.max_bytes:
+                self.bodies.append(json.loads(body))
+        except Exception:
+            pass  # the page navigated away or the body was not JSON after all
+
+    async def payloads(self):
+        if self.tasks:
+            await asyncio.gather(*self.tasks, return_exceptions=True)
+            self.tasks = []
+        return list(self.bodies)
+
+
+def record_lists(data):
+    """Every list of dicts inside a JSON-like value (the candidate record sets)"""
+    found = []
+
+    def walk(value):
+        if isinstance(value, dict):
+            for item in value.values():
+                walk(item)
+        elif isinstance(value, list):
+            records = [item for item in value if isinstance(item, dict)]
+            if records:
+                found.append(records)
+            for item in value:
+                walk(item)
+
+    walk(data)
+    return found
+
+
+def flatten(record, prefix=""):
+    """(dotted key path, leaf value) pairs of a nested record; list items keep their parent's path"""
+    pairs = []
+    if isinstance(record, dict):
+        for key, value in record.items():
+            pairs.extend(flatten(value, f"{prefix}.{key}" if prefix else str(key)))
+    elif isinstance(record, list):
+        for value in record:
+            pairs.extend(flatten(value, prefix))
+    elif record is not None:
+        pairs.append((prefix, record))
+    return pairs
@@ -0,0 +1,502 @@
+import random
+
+from engine.incremental import SEEN_MARKER
+from engine.pool import PagePool
+from engine.timing import span
+from engine.waits import (
+    is_near_bottom,
+    wait_for_count_growth,
+    wait_for_dom_settle,
+    wait_for_height_growth,
+)
+
+
+class SinglePage:
+    """Everything is on the first page - extract once"""
+
+    async def steps(self, page, run):
+        yield 1
+
+
+class NextButton:
+    """Classic numbered pages reached by clicking a "next" link (OpenVC)
+
+    With content_selector the strategy waits for the rows under that element to be swapped
+    and settle (settle_ms is then only the ceiling); without it it sleeps settle_ms per page.
+    A resumed crawl clicks through the pages it already scraped without extracting them.
+    """
+
+    cursor_kind = "next_page"
+
+    def __init__(self, selector, settle_ms=5000, scroll_key="End", scroll_wait_ms=3000,
+                 delay_range=(4, 7), max_pages=0, content_selector=None, quiet_ms=500):
+        self.selector = selector
+        self.settle_ms = settle_ms
+        self.scroll_key = scroll_key
+        self.scroll_wait_ms = scroll_wait_ms
+        self.delay_range = delay_range
+        self.max_pages = max_pages
+        self.content_selector = content_selector
+        self.quiet_ms = quiet_ms
+
+    async def wait_for_page(self, page):
+        """Wait for the rows of the page a click on "next" brought in"""
+        if self.content_selector:
+            await wait_for_dom_settle(page, self.content_selector, quiet_ms=self.quiet_ms,
+                                      timeout_ms=self.settle_ms, label="next page rows")
+
+    async def skip_pages(self, page, run, pages):
+        """Click past pages scraped by a previous run; returns the page number reached"""
+        print(f"⏩ Skipping {pages} already scraped pages...")
+        page_number = 1
+        while page_number <= pages and not run.stop_requested:
+            try:
+                next_button = page.locator(self.selector)
+                if not (await next_button.is_visible() and await next_button.is_enabled()):
+                    print(f"⚠️ Next page button gone on page {page_number} - continuing from there")
+                    break
+                await next_button.click()
+                if self.content_selector is None:
+                    with span("sleep"):
+                        await page.wait_for_timeout(self.settle_ms)
+                await self.wait_for_page(page)
+                page_number += 1
+            except Exception as e:
+                print(f"❌ Error skipping to page {page_number + 1}: {e}")
+                break
+        return page_number
+
+    async def steps(self, page, run, resume_from=None):
+        page_number = await self.skip_pages(page, run, resume_from) if resume_from else 1
+        while not run.stop_requested:
+            print(f"📄 Processing page {page_number}...")
+
+            if self.content_selector is None:
+                # Wait for table to load
+                with span("sleep"):
+                    await page.wait_for_timeout(self.settle_ms)
+
+            if self.scroll_key:
+                # Scroll to ensure all content is loaded
+                print("📜 Scrolling to load all content...")
+                await page.keyboard.press(self.scroll_key)
+                if self.content_selector is None:
+                    with span("sleep"):
+                        await page.wait_for_timeout(self.scroll_wait_ms)
+                else:
+                    await wait_for_dom_settle(page, quiet_ms=300, timeout_ms=self.scroll_wait_ms,
+                                              require_change=False, label="scroll settle")
+
+            yield page_number
+
+            if self.max_pages > 0 and page_number >= self.max_pages:
+                print(f"✅ Reached page limit of {self.max_pages}")
+                return
+
+            # Try to go to next page
+            print("🔄 Looking for next page button...")
+            try:
+                next_button = page.locator(self.selector)
+                if not (await next_button.is_visible() and await next_button.is_enabled()):
+                    print("❌ Next page button not found or disabled. Reached end of pages.")
+                    return
+
+                # Add longer delay between pages to be more human-like
+                delay = random.uniform(*self.delay_range)
+                print(f"⏳ Waiting {delay:.1f} seconds before next page...")
+                with span("sleep"):
+                    await page.wait_for_timeout(int(delay * 1000))
+
+                print(f"➡️ Clicking next page button...")
+                await next_button.click()
+                await self.wait_for_page(page)
+                page_number += 1
+            except Exception as e:
+                print(f"❌ Error clicking next page: {e}")
+                return
+
+
+class LoadMore:
+    """A "Load more" button appends the next batch of cards (signal.nfx, GrowthMentor, CodeMentor)
+
+    A resumed crawl repeats the clicks of the previous run before the first extraction.
+    With count_rows (incremental adapters only) nothing is counted in the DOM once the
+    crawl is live: a click waits for a card not read yet, and the list ends when a step
+    adds no new key to the run's index.
+    """
+
+    cursor_kind = "load_more"
+
+    def __init__(self, button_selectors, wait_ms=3000, max_clicks=100, count_selector=None,
+                 scroll_into_view=False, yield_each_step=True, count_rows=False):
+        self.button_selectors = button_selectors
+        self.wait_ms = wait_ms
+        self.max_clicks = max_clicks
+        self.count_selector = count_selector
+        self.scroll_into_view = scroll_into_view
+        self.yield_each_step = yield_each_step
+        self.count_rows = count_rows and yield_each_step
+
+    async def find_button(self, page):
+        """Return the first visible and enabled load more button, or None"""
+        for selector in self.button_selectors:
+            try:
+                button = page.locator(selector).first
+                if await button.is_visible() and await button.is_enabled():
+                    return button
+            except:
+                continue
+        return None
+
+    async def steps(self, page, run, resume_from=None):
+        resume_from = resume_from or 0
+        if resume_from:
+            print(f"⏩ Repeating {resume_from} 'Load more' clicks of the previous run...")
+        elif self.yield_each_step:
+            yield 0
+
+        click_count = 0
+        rows_seen = len(run.seen_keys)
+        previous_count = None
+        if self.count_selector and (resume_from or not self.count_rows):
+            previous_count = await page.locator(self.count_selector).count()
+
+        while click_count < self.max_clicks and not run.stop_requested:
+            button = await self.find_button(page)
+            if button is None:
+                print("❌ Load more button not found or not visible")
+                break
+
+            # Every card on the page has been read once the previous step was extracted
+            from_index = self.count_rows and click_count >= resume_from
+            try:
+                if self.scroll_into_view:
+                    await button.scroll_into_view_if_needed()
+                    await page.evaluate("window.scrollBy(0, -100)")
+
+                print("🔄 Clicking 'Load More' button...")
+                try:
+                    await button.click()
+                except Exception:
+                    # Fallback to JavaScript click
+                    await button.evaluate("element => element.click()")
+                click_count += 1
+
+                # Wait for new content to load
+                if from_index and self.count_selector:
+                    await wait_for_count_growth(page, f"{self.count_selector}:not([{SEEN_MARKER}])", 0,
+                                                self.wait_ms, label="load more")
+                elif self.count_selector:
+                    await wait_for_count_growth(page, self.count_selector, previous_count, self.wait_ms,
+                                                label="load more")
+                else:
+                    with span("sleep"):
+                        await page.wait_for_timeout(self.wait_ms)
+            except Exception as e:
+                print(f"❌ Error clicking load more button: {e}")
+                break
+
+            if self.count_selector and not from_index:
+                current_count = await page.locator(self.count_selector).count()
+                if current_count <= previous_count:
+                    print("⚠️ No new items loaded, stopping load more attempts")
+                    break
+                print(f"✅ Loaded more items! Now have {current_count} total")
+                previous_count = current_count
+
+            if self.yield_each_step and click_count >= resume_from:
+                yield click_count
+
+                if self.count_rows:
+                    if len(run.seen_keys) <= rows_seen:
+                        print("⚠️ No new items loaded, stopping load more attempts")
+                        break
+                    print(f"✅ Loaded more items! Now have {len(run.seen_keys)} total")
+                    rows_seen = len(run.seen_keys)
+
+        if click_count >= self.max_clicks:
+            print(f"⚠️  Reached maximum click limit ({self.max_clicks})")
+
+        if not self.yield_each_step or click_count < resume_from:
+            # Nothing extracted yet (single step, or the list ended before the saved position)
+            yield click_count
+
+
+class InfiniteScroll:
+    """New cards appear as the page is scrolled (DealRoom, VC Sheet, PIF, Re-Create)
+
+    key scrolls with a keyboard press (e.g. "PageDown"), otherwise the window is scrolled to
+    the bottom. Once the bottom is reached each scroll waits up to wait_ms for more cards
+    (count_selector) or a taller page; scrolls in the middle of the page only wait for the
+    DOM to settle. Scrolling stops once the page height has not grown for stall_limit scrolls
+    (0 = never stop on height alone).
+    """
+
+    def __init__(self, key=None, wait_ms=3000, max_scrolls=5000, stall_limit=0, yield_each_step=True,
+                 count_selector=None, settle_ms=100):
+        self.key = key
+        self.wait_ms = wait_ms
+        self.max_scrolls = max_scrolls
+        self.stall_limit = stall_limit
+        self.yield_each_step = yield_each_step
+        self.count_selector = count_selector
+        self.settle_ms = settle_ms
+
+    async def wait_for_more(self, page, last_height, last_count):
+        """Wait for the content a scroll triggers, ceiling wait_ms"""
+        if not await is_near_bottom(page):
+            await wait_for_dom_settle(page, quiet_ms=self.settle_ms, timeout_ms=self.wait_ms,
+                                      require_change=False, label="scroll settle")
+        elif self.count_selector:
+            await wait_for_count_growth(page, self.count_selector, last_count, self.wait_ms, label="scroll load")
+        else:
+            await wait_for_height_growth(page, last_height, self.wait_ms, label="scroll load")
+
+    async def steps(self, page, run):
+        if self.yield_each_step:
+            yield 0
+
+        last_height = await page.evaluate("document.body.scrollHeight")
+        last_count = await page.locator(self.count_selector).count() if self.count_selector else 0
+        stalled = 0
+        scroll_count = 0
+
+        while scroll_count < self.max_scrolls and not run.stop_requested:
+            print("📜 Scrolling down...")
+            if self.key:
+                await page.keyboard.press(self.key)
+            else:
+                await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+            await self.wait_for_more(page, last_height, last_count)
+            scroll_count += 1
+
+            new_height = await page.evaluate("document.body.scrollHeight")
+            if new_height == last_height:
+                stalled += 1
+                if self.stall_limit and stalled >= self.stall_limit:
+                    print("✅ Reached end of page (no new content loaded)")
+                    break
+            else:
+                stalled = 0
+            last_height = new_height
+            if self.count_selector:
+                last_count = await page.locator(self.count_selector).count()
+
+            if self.yield_each_step:
+                yield scroll_count
+
+        if not self.yield_each_step:
+            yield scroll_count
+
+
+class HashOffset:
+    """Pages addressed by an item offset in the URL hash (PIF: #ourportfolio_e=18, 36, ...)
+
+    After a hash change the strategy waits for the list under content_selector to be swapped
+    and settle, wait_ms being the ceiling. With workers > 1 the page range is split over a
+    PagePool: each tab opens the list once and then moves between offsets, and the pages
+    are handed back in page order (see documents()).
+    """
+
+    cursor_kind = "hash_offset"
+
+    def __init__(self, template, page_size, start_page=1, end_page=1, wait_ms=5000, wait_selector=None,
+                 content_selector=None, quiet_ms=500, workers=1):
+        self.template = template
+        self.page_size = page_size
+        self.start_page = start_page
+        self.end_page = end_page
+        self.wait_ms = wait_ms
+        self.wait_selector = wait_selector
+        self.content_selector = content_selector
+        self.quiet_ms = quiet_ms
+        self.workers = workers
+
+    @property
+    def parallel(self):
+        return self.workers > 1
+
+    def offset(self, page_num):
+        """Hash fragment for a page number"""
+        return self.template.format(offset=(page_num - 1) * self.page_size)
+
+    async def wait_for_list(self, page):
+        if self.wait_selector:
+            try:
+                await page.wait_for_selector(self.wait_selector, timeout=10000)
+            except:
+                pass  # Continue even if selector not found
+
+    async def show_page(self, page, page_num):
+        """Move an open list to page_num through the hash and wait for its items"""
+        await page.evaluate(f"window.location.hash = '{self.offset(page_num)}'")
+        await wait_for_dom_settle(page, self.content_selector, quiet_ms=self.quiet_ms,
+                                  timeout_ms=self.wait_ms, label="hash page")
+        await self.wait_for_list(page)
+
+    def documents(self, page, run, resume_from=None):
+        """(page_num, html) of each page in page order, the pages being loaded by `workers` tabs at once"""
+        first_page = max(self.start_page, resume_from + 1) if resume_from else self.start_page
+
+        async def read_page(tab, page_num):
+            # A fresh tab shows page 1 first; the list must be up before the hash moves it
+            await self.wait_for_list(tab)
+            await self.show_page(tab, page_num)
+            with span("content"):
+                return await tab.content()
+
+        return load_pages_in_order(page, run, self.workers, first_page, self.end_page,
+                                   lambda page_num: run.adapter.url, read_page, reload=False)
+
+    async def steps(self, page, run, resume_from=None):
+        first_page = max(self.start_page, resume_from + 1) if resume_from else self.start_page
+        for page_num in range(first_page, self.end_page + 1):
+            if run.stop_requested:
+                break
+
+            fragment = self.offset(page_num)
+            print(f"📄 Processing page {page_num} (#{fragment})...")
+
+            # Page 1 is the page we just opened, no hash change needed
+            if page_num > 1:
+                try:
+                    # Use JavaScript to navigate to the hash and wait for the next items
+                    await self.show_page(page, page_num)
+                except Exception as e:
+                    print(f"❌ Error loading page {page_num}: {e}")
+                    run.page_failed(page_num)
+                    continue
+
+            yield page_num
+
+
+class PageParam:
+    """Pages addressed by a query parameter (Re-Create: ?results=2, 3, ...)
+
+    With workers > 1 the pages are loaded by a PagePool and handed back in page order
+    (see documents()).
+    """
+
+    cursor_kind = "page_param"
+
+    def __init__(self, param, start_page=1, end_page=1, settle_ms=1000, idle_timeout=8000, workers=1):
+        self.param = param
+        self.start_page = start_page
+        self.end_page = end_page
+        self.settle_ms = settle_ms
+        self.idle_timeout = idle_timeout
+        self.workers = workers
+
+    @property
+    def parallel(self):
+        return self.workers > 1
+
+    def page_url(self, base_url, page_num):
+        """URL of a page number"""
+        separator = '&' if '?' in base_url else '?'
+        return f"{base_url}{separator}{self.param}={page_num}"
+
+    async def settle(self, page):
+        """Wait for a freshly loaded result page to go quiet"""
+        try:
+            await page.wait_for_load_state("networkidle", timeout=self.idle_timeout)
+        except:
+            pass
+        await wait_for_dom_settle(page, quiet_ms=250, timeout_ms=self.settle_ms,
+                                  require_change=False, label="page settle")
+
+    def documents(self, page, run, resume_from=None):
+        """(page_num, html) of each page in page order, the pages being loaded by `workers` tabs at once"""
+        first_page = max(self.start_page, resume_from + 1) if resume_from else self.start_page
+
+        async def read_page(tab, page_num):
+            await self.settle(tab)
+            with span("content"):
+                return await tab.content()
+
+        return load_pages_in_order(page, run, self.workers, first_page, self.end_page,
+                                   lambda page_num: self.page_url(run.adapter.url, page_num),
+                                   read_page)
+
+    async def steps(self, page, run, resume_from=None):
+        first_page = max(self.start_page, resume_from + 1) if resume_from else self.start_page
+        for page_num in range(first_page, self.end_page + 1):
+            if run.stop_requested:
+                break
+
+            print(f"📄 Processing page {page_num}...")
+
+            # Page 1 is the page we just opened
+            if page_num > 1:
+                try:
+                    with span("navigate"):
+                        await page.goto(self.page_url(run.adapter.url, page_num), wait_until="domcontentloaded")
+                    await self.settle(page)
+                except Exception as e:
+                    print(f"❌ Error loading page {page_num}: {e}")
+                    run.page_failed(page_num)
+                    continue
+
+            yield page_num
+
+
+async def load_pages_in_order(page, run, workers, first_page, last_page, url_of, read_page, reload=True):
+    """Yield (page_num, html) for first_page..last_page in page order, loaded by `workers` tabs at once
+
+    Page 1 is read from the page the run opened; url_of(page_num) is the URL a pool tab
+    opens and read_page(tab, page_num) returns the page's HTML once it is there. Pages that
+    finish early are held back until the ones before them are in. A page that fails to
+    load is skipped and reported with run.page_failed(), so the crawl cursor stays before it.
+    """
+    if first_page == 1:
+        print("📄 Processing page 1...")
+        with span("content"):
+            html = await page.content()
+        yield 1, html
+        first_page = 2
+    if first_page > last_page or run.stop_requested:
+        return
+
+    pool = PagePool(page.context, size=workers, timeout_ms=run.adapter.timeout, blocker=run.blocker, reload=reload)
+    print(f"📑 Loading pages {first_page}-{last_page} with {pool.size} tabs...")
+    jobs = [(page_num, url_of(page_num)) for page_num in range(first_page, last_page + 1)]
+    ready = {}
+    next_page = first_page
+    try:
+        async for page_num, html in pool.run(jobs, read_page, lambda: run.stop_requested):
+            ready[page_num] = html
+            while next_page in ready:
+                html = ready.pop(next_page)
+                if html is None:
+                    print(f"❌ Error loading page {next_page}")
+                    run.page_failed(next_page)
+                else:
+                    print(f"📄 Processing page {next_page}...")
+                    yield next_page, html
+                next_page += 1
+    finally:
+        await pool.close()
+
+
+async def scroll_until_stable(page, max_attempts=15, wait_ms=2000, run=None):
+    """Scroll to the bottom until the page height stops growing (lazy-loaded first pages)"""
+    print("📜 Scrolling to load all content...")
+    last_height = await page.evaluate("document.body.scrollHeight")
+    scroll_attempts = 0
+
+    while scroll_attempts < max_attempts:
+        if run is not None and run.stop_requested:
+            break
+
+        await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+        await wait_for_height_growth(page, last_height, wait_ms, label="scroll until stable")
+
+        new_height = await page.evaluate("document.body.scrollHeight")
+        if new_height == last_height:
+            print("✅ Reached end of page (no new content loaded)")
+            break
+
+        last_height = new_height
+        scroll_attempts += 1
+
+    return scroll_attempts
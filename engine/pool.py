@@ -0,0 +1,216 @@
+import asyncio
+import time
+from urllib.parse import urlparse
+
+from engine.config import POOL_TAB_MAX_PAGES
+from engine.timing import span
+from engine.waits import wait_for_selector_or_settle, wait_for_selector_state
+
+
+class HostLimiter:
+    """Per-host concurrency and request-rate caps shared by the tabs of a pool"""
+
+    def __init__(self, host_limit=4, min_interval=0):
+        self.host_limit = max(1, host_limit)
+        self.min_interval = min_interval
+        self.semaphores = {}  # host -> Semaphore(host_limit)
+        self.locks = {}  # host -> Lock guarding last_request
+        self.last_request = {}  # host -> monotonic time of the last request
+
+    def slot(self, host):
+        """Semaphore limiting how many tabs load host at once"""
+        if host not in self.semaphores:
+            self.semaphores[host] = asyncio.Semaphore(self.host_limit)
+        return self.semaphores[host]
+
+    async def wait_turn(self, host):
+        """Sleep until min_interval seconds have passed since the last request to host"""
+        if host not in self.locks:
+            self.locks[host] = asyncio.Lock()
+        async with self.locks[host]:
+            wait = self.last_request.get(host, 0) + self.min_interval - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self.last_request[host] = time.monotonic()
+
+
+class PagePool:
+    """A fixed set of tabs in one browser context that load pages side by side
+
+    Each tab is driven by its own task pulling (item, url) jobs from a shared queue, so up
+    to `size` pages load at once. host_limit caps how many tabs may be loading the same host
+    at a time and min_interval is the minimum number of seconds between two requests to one
+    host. With reload=False a tab already showing the job's document (ignoring the #fragment)
+    is handed to the handler as it is, for lists addressed through the URL hash.
+    wait_selector makes each loaded tab wait (up to wait_ms) for client-rendered content
+    before the handler reads it; with wait_quiet_ms the wait also ends once the page has
+    been quiet that long without the element (pages that may not have it at all).
+    A tab that has loaded max_loads pages is replaced by a fresh one between two jobs, so a
+    long run does not keep growing the same renderers.
+    """
+
+    def __init__(self, context, size=4, host_limit=4, min_interval=0, settle_ms=0,
+                 timeout_ms=30000, wait_until="domcontentloaded", blocker=None, reload=True,
+                 wait_selector=None, wait_ms=10000, wait_quiet_ms=None, max_loads=POOL_TAB_MAX_PAGES):
+        self.context = context
+        self.size = max(1, size)
+        self.limiter = HostLimiter(host_limit, min_interval)
+        self.settle_ms = settle_ms
+        self.timeout_ms = timeout_ms
+        self.wait_until = wait_until
+        self.blocker = blocker
+        self.reload = reload
+        self.wait_selector = wait_selector
+        self.wait_ms = wait_ms
+        self.wait_quiet_ms = wait_quiet_ms
+        self.max_loads = max_loads
+        self.pages = []
+        self.loads = {}  # tab -> pages it has loaded
+
+    async def new_tab(self):
+        page = await self.context.new_page()
+        page.set_default_timeout(self.timeout_ms)
+        if self.blocker is not None:
+            await self.blocker.attach(page)
+        self.loads[page] = 0
+        return page
+
+    async def open(self):
+        """Create the tabs (once)"""
+        while len(self.pages) < self.size:
+            self.pages.append(await self.new_tab())
+
+    async def renew(self, page):
+        """The tab to use for the next job: page, or a fresh tab once page has loaded max_loads pages"""
+        if not self.max_loads or self.loads.get(page, 0) < self.max_loads:
+            return page
+        try:
+            fresh = await self.new_tab()
+        except Exception as e:
+            print(f"⚠️ Could not replace a pool tab: {e}")
+            return page
+        self.pages[self.pages.index(page)] = fresh
+        self.loads.pop(page, None)
+        try:
+            await page.close()
+        except:
+            pass
+        return fresh
+
+    async def close(self):
+        """Close every tab of the pool"""
+        for page in self.pages:
+            try:
+                await page.close()
+            except:
+                pass
+        self.pages = []
+        self.loads = {}
+
+    async def load(self, page, item, url, handler):
+        """Open url in page and return handler(page, item), or None if either fails"""
+        if not self.reload and page.url.split("#")[0] == url.split("#")[0]:
+            try:
+                return await handler(page, item)
+            except Exception as e:
+                print(f"❌ Error reading {url}: {e}")
+                return None
+
+        host = urlparse(url).netloc
+        async with self.limiter.slot(host):
+            await self.limiter.wait_turn(host)
+            try:
+                self.loads[page] = self.loads.get(page, 0) + 1
+                with span("navigate"):
+                    await page.goto(url, wait_until=self.wait_until, timeout=self.timeout_ms)
+                if self.wait_selector and self.wait_quiet_ms:
+                    await wait_for_selector_or_settle(page, self.wait_selector, self.wait_quiet_ms, self.wait_ms,
+                                                      label="pool page ready")
+                elif self.wait_selector:
+                    await wait_for_selector_state(page, self.wait_selector, "attached", self.wait_ms,
+                                                  label="pool page ready")
+                if self.settle_ms:
+                    with span("sleep"):
+                        await page.wait_for_timeout(self.settle_ms)
+            except Exception as e:
+                print(f"❌ Could not load {url}: {e}")
+                return None
+
+        try:
+            return await handler(page, item)
+        except Exception as e:
+            print(f"❌ Error reading {url}: {e}")
+            return None
+
+    async def run(self, jobs, handler, should_stop=None):
+        """Load each (item, url) job in a free tab and yield (item, result) as tabs finish
+
+        handler is a coroutine function called as handler(page, item) on the loaded tab. A
+        job whose page fails to load, or whose handler raises, yields None as its result.
+        Once should_stop() turns true no new job is started; pages already loading finish.
+
+        jobs may also be an asyncio.Queue that is still being filled: the tabs then wait for
+        more jobs until a None is put in the queue.
+        """
+        await self.open()
+        streaming = isinstance(jobs, asyncio.Queue)
+        if streaming:
+            queue = jobs
+        else:
+            queue = asyncio.Queue()
+            for job in jobs:
+                queue.put_nowait(job)
+        results = asyncio.Queue()
+        worker_done = object()
+
+        async def worker(page):
+            try:
+                while not (should_stop is not None and should_stop()):
+                    if streaming:
+                        job = await queue.get()
+                        if job is None:
+                            queue.put_nowait(None)  # let the other tabs see the end too
+                            return
+                    else:
+                        try:
+                            job = queue.get_nowait()
+                        except asyncio.QueueEmpty:
+                            return
+                    item, url = job
+                    page = await self.renew(page)
+                    results.put_nowait((item, await self.load(page, item, url, handler)))
+            finally:
+                results.put_nowait(worker_done)
+
+        workers = [asyncio.create_task(worker(page)) for page in self.pages]
+        finished = 0
+        try:
+            while finished < len(workers):
+                entry = await results.get()
+                if entry is worker_done:
+                    finished += 1
+                    continue
+                yield entry
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        if should_stop is not None and should_stop() and not queue.empty():
+            print("🛑 Stop requested - leaving unfinished pages")
+
+
+def detail_pool(page, adapter, blocker=None):
+    """PagePool for an adapter's profile pass, opened next to its main page"""
+    return PagePool(
+        page.context,
+        size=adapter.detail_workers,
+        host_limit=adapter.detail_host_limit,
+        min_interval=adapter.detail_min_interval,
+        settle_ms=adapter.detail_settle_ms,
+        timeout_ms=adapter.timeout,
+        blocker=blocker,
+        wait_selector=adapter.detail_wait_selector,
+        wait_ms=adapter.detail_wait_ms,
+        wait_quiet_ms=adapter.detail_wait_quiet_ms,
+    )
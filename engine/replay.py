@@ -0,0 +1,259 @@
+import asyncio
+import json
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+from engine.pool import HostLimiter
+
+# Requests that can carry the next page of a list
+REPLAY_RESOURCE_TYPES = ("xhr", "fetch", "document")
+
+
+def html_from_payload(text, content_type=""):
+    """HTML carried by a response: the body itself, or the HTML strings inside a JSON body"""
+    if "json" not in content_type and not text.lstrip().startswith(("{", "[")):
+        return text
+    try:
+        data = json.loads(text)
+    except ValueError:
+        return text
+
+    fragments = []
+
+    def collect(value):
+        if isinstance(value, str):
+            if "<" in value and ">" in value:
+                fragments.append(value)
+        elif isinstance(value, dict):
+            for item in value.values():
+                collect(item)
+        elif isinstance(value, list):
+            for item in value:
+                collect(item)
+
+    collect(data)
+    return "\n".join(fragments)
+
+
+class PageRequestTemplate:
+    """Rebuilds the request behind page N from one captured page request
+
+    The page number lives in a query parameter, a form / JSON body field or a path segment
+    (location), and its value is first + (page - page_number) * step: step 1 for page
+    numbers, the page size for item offsets.
+    """
+
+    def __init__(self, method, url, headers, post_data, location, name, page_number, first, step):
+        self.method = method
+        self.url = url
+        self.headers = headers
+        self.post_data = post_data
+        self.location = location
+        self.name = name
+        self.page_number = page_number
+        self.first = first
+        self.step = step
+
+    @classmethod
+    def find(cls, request, page_number, page_size=None):
+        """Template for a captured request of page_number, or None when no page field is found"""
+        method = request.method
+        url = request.url
+        post_data = request.post_data
+        headers = {
+            key: value for key, value in request.headers.items()
+            if key.lower() not in ("cookie", "content-length", "host")
+        }
+
+        # (value, step) pairs a page field may hold
+        expected = [(str(page_number), 1)]
+        if page_size:
+            expected.append((str((page_number - 1) * page_size), page_size))
+
+        def match(value):
+            for candidate, step in expected:
+                if value == candidate:
+                    return step
+            return None
+
+        parsed = urlparse(url)
+        for key, value in parse_qsl(parsed.query, keep_blank_values=True):
+            step = match(value)
+            if step:
+                return cls(method, url, headers, post_data, "query", key, page_number, int(value), step)
+
+        if post_data:
+            try:
+                body = json.loads(post_data)
+            except ValueError:
+                body = None
+            if isinstance(body, dict):
+                for key, value in body.items():
+                    step = match(str(value))
+                    if step:
+                        return cls(method, url, headers, post_data, "json", key, page_number, int(value), step)
+            else:
+                for key, value in parse_qsl(post_data, keep_blank_values=True):
+                    step = match(value)
+                    if step:
+                        return cls(method, url, headers, post_data, "form", key, page_number, int(value), step)
+
+        segments = parsed.path.split("/")
+        for index, segment in enumerate(segments):
+            step = match(segment)
+            if step:
+                return cls(method, url, headers, post_data, "path", index, page_number, int(segment), step)
+
+        return None
+
+    def value(self, page_num):
+        return self.first + (page_num - self.page_number) * self.step
+
+    def build(self, page_num):
+        """(method, url, headers, post_data) of page_num"""
+        value = str(self.value(page_num))
+        parsed = urlparse(self.url)
+        url = self.url
+        post_data = self.post_data
+
+        if self.location == "query":
+            query = [(key, value if key == self.name else old) for key, old in parse_qsl(parsed.query, keep_blank_values=True)]
+            url = urlunparse(parsed._replace(query=urlencode(query)))
+        elif self.location == "path":
+            segments = parsed.path.split("/")
+            segments[self.name] = value
+            url = urlunparse(parsed._replace(path="/".join(segments)))
+        elif self.location == "json":
+            body = json.loads(self.post_data)
+            body[self.name] = int(value) if isinstance(body[self.name], int) else value
+            post_data = json.dumps(body)
+        elif self.location == "form":
+            form = [(key, value if key == self.name else old) for key, old in parse_qsl(self.post_data, keep_blank_values=True)]
+            post_data = urlencode(form)
+
+        return self.method, url, self.headers, post_data
+
+    def describe(self):
+        return f"{self.method} {urlparse(self.url).path} ({self.location} '{self.name}')"
+
+
+async def capture_page_request(page, trigger, parse_payload, page_number=2, page_size=None):
+    """Run trigger() (e.g. click "next") and find the request that loaded the new rows
+
+    parse_payload(text, content_type) turns a response body into rows. Returns a
+    PageRequestTemplate for the first captured request whose response has rows and whose
+    URL or body carries page_number, or None.
+    """
+    requests = []
+
+    def remember(request):
+        if request.resource_type in REPLAY_RESOURCE_TYPES:
+            requests.append(request)
+
+    page.on("request", remember)
+    try:
+        await trigger()
+    finally:
+        page.remove_listener("request", remember)
+
+    for request in requests:
+        try:
+            response = await request.response()
+            if response is None or not response.ok:
+                continue
+            rows = parse_payload(await response.text(), response.headers.get("content-type", ""))
+        except Exception:
+            continue
+        if not rows:
+            continue
+        template = PageRequestTemplate.find(request, page_number, page_size)
+        if template is not None:
+            print(f"📡 Captured page request: {template.describe()}")
+            return template
+
+    return None
+
+
+class ApiReplayer:
+    """Fetches list pages straight from the captured request, without rendering them
+
+    Requests go through the browser context's APIRequestContext: one pooled HTTP client
+    that shares the browser's cookies. `workers` pages are fetched at once, spaced by
+    min_interval seconds. A failed request is retried `retries` times, waiting
+    retry_delay, 2 * retry_delay, ... seconds in between; pages that still fail end
+    pages() and are kept in failed_pages.
+    """
+
+    def __init__(self, context, template, parse_payload, workers=4, min_interval=0, timeout_ms=30000,
+                 retries=3, retry_delay=2.0):
+        self.request = context.request
+        self.template = template
+        self.parse_payload = parse_payload
+        self.workers = max(1, workers)
+        self.limiter = HostLimiter(self.workers, min_interval)
+        self.timeout_ms = timeout_ms
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.failed_pages = []
+
+    async def fetch_once(self, page_num):
+        """Rows of page_num, [] for an empty page, None when the request fails"""
+        method, url, headers, post_data = self.template.build(page_num)
+        host = urlparse(url).netloc
+        async with self.limiter.slot(host):
+            await self.limiter.wait_turn(host)
+            try:
+                response = await self.request.fetch(
+                    url, method=method, headers=headers, data=post_data, timeout=self.timeout_ms
+                )
+                if not response.ok:
+                    print(f"⚠️ Page {page_num} returned HTTP {response.status}")
+                    return None
+                return self.parse_payload(await response.text(), response.headers.get("content-type", ""))
+            except Exception as e:
+                print(f"⚠️ Error fetching page {page_num}: {e}")
+                return None
+
+    async def fetch_page(self, page_num):
+        """fetch_once with retries; None when every attempt failed"""
+        for attempt in range(self.retries + 1):
+            if attempt:
+                delay = self.retry_delay * 2 ** (attempt - 1)
+                print(f"🔄 Retrying page {page_num} in {delay:.0f}s ({attempt}/{self.retries})")
+                await asyncio.sleep(delay)
+            rows = await self.fetch_once(page_num)
+            if rows is not None:
+                return rows
+        print(f"❌ Page {page_num} failed after {self.retries + 1} attempts")
+        return None
+
+    async def pages(self, start_page, end_page=0, should_stop=None):
+        """Yield (page_num, rows) in page order until a page comes back empty or fails
+
+        end_page 0 means no last page is known. A page identical to the one before also ends
+        the list (sites that answer every page past the end with the last one). A page that
+        fails every retry ends it too, without reaching the end: check failed_pages.
+        """
+        page_num = start_page
+        previous = None
+        while not (should_stop is not None and should_stop()):
+            batch = list(range(page_num, page_num + self.workers))
+            if end_page:
+                batch = [number for number in batch if number <= end_page]
+            if not batch:
+                return
+
+            results = await asyncio.gather(*(self.fetch_page(number) for number in batch))
+            for number, rows in zip(batch, results):
+                if rows is None:
+                    self.failed_pages.append(number)
+                    print(f"🛑 Stopping at page {number} - the pages after it are not read")
+                    return
+                if not rows:
+                    print(f"✅ Page {number} is empty - reached the end of the list")
+                    return
+                if rows == previous:
+                    print(f"✅ Page {number} repeats page {number - 1} - reached the end of the list")
+                    return
+                previous = rows
+                yield number, rows
+            page_num += len(batch)
@@ -0,0 +1,605 @@
+import asyncio
+import random
+import time
+
+from engine.blocking import resource_blocker
+from engine.browser import close_browser, get_browser_and_page, save_storage_state
+from engine.browser_extract import page_has_text
+from engine.cursor import CrawlCursor
+from engine.extract import parse_html
+from engine.interrupt import install_signal_handlers, start_keyboard_listener
+from engine.mock_site import mock_router
+from engine.incremental import new_cards
+from engine.pool import detail_pool
+from engine.storage import StreamingCsvWriter, load_existing_keys, save_data
+from engine.store import open_store
+from engine.timing import LiveStats, now_iso, span, timings, write_run_report
+from engine.waits import wait_for_selector_state, wait_stats
+
+
+class RunState:
+    """Everything one run has collected so far (shared with the interrupt handlers)"""
+
+    def __init__(self, adapter):
+        self.adapter = adapter
+        self.rows = []  # rows saved to the CSV this session
+        self.pending = []  # rows waiting for their profile visit
+        self.existing_keys = adapter.key_index()  # keys already in the CSV
+        self.seen_keys = adapter.key_index()  # keys met during this run
+        self.skipped_existing = 0
+        self.stop_requested = False
+        self.completed = False
+        self.incomplete = False  # a list page could not be read (the cursor is kept for the next run)
+        self.failed_pages = []  # numbers of the list pages that could not be loaded
+        self.browser = None
+        self.playwright = None
+        self.blocker = None  # ResourceBlocker filtering this run's requests
+        self.router = None  # MockRouter when the adapter has a base_url_override
+        self.writer = StreamingCsvWriter(adapter.output_filename, extra_fields=adapter.detail_fields)
+        self.store = None  # SqliteStore when the adapter has use_sqlite
+        self.prepared = False  # adapter.prepare succeeded (the session is worth saving)
+        self.cursor = None  # CrawlCursor when the adapter has resume_cursor
+        self.detail_queue = None  # asyncio.Queue feeding the tab pool while profiles are streamed
+        self.started_at = now_iso()
+        self.started = time.monotonic()
+
+    def remaining(self):
+        """How many more rows the run may collect (None = no limit)"""
+        adapter = self.adapter
+        if adapter.max_items <= 0:
+            return None
+        done = len(self.rows) + len(self.pending)
+        if adapter.limit_includes_existing:
+            done += self.existing_count()
+        return adapter.max_items - done
+
+    def is_existing(self, key):
+        """True when a previous run already saved a row with this key (never for a missing key)"""
+        normalized = self.existing_keys.key(key)
+        if normalized is None:
+            return False
+        if normalized in self.existing_keys.records:
+            return True
+        return self.store is not None and self.store.exists(normalized)
+
+    def existing_count(self):
+        """Rows saved by previous runs"""
+        if self.store is not None:
+            return self.store.count() - len(self.rows)
+        return len(self.existing_keys)
+
+
+    def load_cursor(self):
+        """Pick up where an interrupted run stopped (its position and unvisited profiles)"""
+        adapter = self.adapter
+        self.cursor = CrawlCursor(adapter.output_filename)
+        if not adapter.resume:
+            self.cursor.clear()
+            return
+        state = self.cursor.load()
+        if state is None:
+            return
+
+        saved = self.existing_count()
+        if state.get("saved_rows", 0) > saved:
+            # The CSV lost records the cursor has already walked past
+            print(f"⚠️ Crawl cursor expects {state['saved_rows']} saved records but only {saved} found - "
+                  f"starting from the beginning")
+            self.cursor.clear()
+            return
+
+        for row in state.get("pending", []):
+            key = adapter.row_key(row)
+            if key in self.seen_keys or self.is_existing(key):
+                continue
+            self.seen_keys.add(key)
+            self.pending.append(row)
+        print(f"⏩ Resuming after {state['kind']} {state['position']} (last saved: {state.get('last_key')}, "
+              f"{len(self.pending)} profiles still to visit)")
+
+    def resume_position(self, kind):
+        """Last completed position of a restarted crawl (None = start from the beginning)"""
+        if self.cursor is None or kind is None:
+            return None
+        return self.cursor.position(kind)
+
+    def page_failed(self, page_num):
+        """Note a list page that could not be loaded; the cursor stays before it so the next run retries it"""
+        self.failed_pages.append(page_num)
+        self.incomplete = True
+
+    def save_cursor(self, kind, position):
+        """Record a completed page; a stopped run may have cut the page short, so it is not saved"""
+        if self.cursor is None or kind is None or self.stop_requested:
+            return
+        if self.failed_pages:
+            # Only the pages before the first failed one are all done
+            position = min(position, min(self.failed_pages) - 1)
+        last_key = self.adapter.row_key(self.rows[-1]) if self.rows else (self.cursor.state or {}).get("last_key")
+        self.cursor.save(kind, position, self.existing_count() + len(self.rows), last_key, self.pending)
+
+
+def run_report(run):
+    """Machine-readable summary of a run: rows, rows/sec and where the time went
+
+    Stage and wait figures are kept per process, so with several sites in one process
+    they cover all of them.
+    """
+    adapter = run.adapter
+    elapsed = time.monotonic() - run.started
+    return {
+        "site": adapter.name,
+        "url": adapter.url,
+        "started_at": run.started_at,
+        "finished_at": now_iso(),
+        "completed": run.completed,
+        "incomplete": run.incomplete,
+        "failed_pages": run.failed_pages,
+        "elapsed_s": round(elapsed, 1),
+        "rows_saved": len(run.rows),
+        "rows_pending": len(run.pending),
+        "skipped_existing": run.skipped_existing,
+        "rows_per_sec": round(len(run.rows) / elapsed, 3) if elapsed else 0,
+        "stages": timings.summary(),
+        "waits": wait_stats.summary(),
+        "blocked": run.blocker.stats.summary() if run.blocker is not None else None,
+        "mock_server": {
+            "url": run.router.base_url,
+            "forwarded": run.router.forwarded,
+            "failed": run.router.failed,
+        } if run.router is not None else None,
+    }
+
+
+def save_partial_data(run):
+    """Save any collected data when browser closes or script is interrupted"""
+    # Rows still buffered for the CSV go to disk first (the store commits every row and is
+    # exported and closed by run_adapter_async once the run unwinds)
+    run.writer.close()
+    rows = run.rows + run.pending
+    if rows:
+        print("💾 Saving partial data before closing...")
+        save_data(rows, f"{run.adapter.output_filename}_partial")
+        print(f"✅ Partial data saved: {len(rows)} records")
+    else:
+        print("📝 No data to save.")
+
+
+async def open_site(page, adapter):
+    """Navigate to the adapter's list page and wait for it to settle"""
+    print(f"🚀 Loading {adapter.name}: {adapter.url}")
+
+    try:
+        print(f"📍 Navigating to {adapter.name}...")
+        with span("navigate"):
+            await page.goto(adapter.url, wait_until=adapter.wait_until)
+
+        current_url = page.url
+        print(f"✅ Page loaded successfully!")
+        print(f"📍 Current URL: {current_url}")
+        print(f"📄 Page Title: {await page.title()}")
+
+        if adapter.domain:
+            if adapter.domain in current_url:
+                print(f"✅ Confirmed: On {adapter.name} website!")
+            else:
+                print(f"⚠️  Warning: Not on {adapter.name} page. Current URL: {current_url}")
+
+    except Exception as e:
+        print(f"❌ Error loading {adapter.name}: {e}")
+        raise Exception(f"Failed to load {adapter.name}: {e}")
+
+    # Additional wait to ensure page is fully loaded
+    print("⏳ Waiting for page to fully load...")
+    if adapter.card_selectors:
+        # Cards showing up is the signal, open_wait_ms only the ceiling
+        await wait_for_selector_state(page, ", ".join(adapter.card_selectors), "attached",
+                                      adapter.open_wait_ms, label="page ready")
+    else:
+        with span("sleep"):
+            await page.wait_for_timeout(adapter.open_wait_ms)
+
+    if adapter.ready_marker:
+        try:
+            # Checked inside the page - no need to ship the whole DOM over
+            if await page_has_text(page, adapter.ready_marker):
+                print("✅ Page content looks correct")
+            else:
+                print("⚠️  Page content might not be loading correctly")
+        except Exception as e:
+            print(f"Could not check page content: {e}")
+
+
+def commit_row(run, row):
+    """Persist one finished row"""
+    with span("write"):
+        run.writer.write(row)
+        if run.store is not None:
+            run.store.upsert(row)
+    run.rows.append(row)
+    print(f"✅ Processed {len(run.rows)}: {row.get(run.adapter.key_field, 'Unknown')}")
+
+
+async def steps_without_html(steps):
+    async for step in steps:
+        yield step, None
+
+
+def page_steps(page, run, resume_from=None):
+    """Async iterator of (step, html) for each pagination step; html is None when the step is read from page
+
+    Strategies with parallel set load their pages in other tabs and hand the HTML back.
+    """
+    pagination = run.adapter.pagination
+    options = {"resume_from": resume_from} if resume_from else {}
+    if getattr(pagination, "parallel", False):
+        return pagination.documents(page, run, **options)
+    return steps_without_html(pagination.steps(page, run, **options))
+
+
+async def collect_rows(page, run):
+    """Walk the pagination and dedup every row that shows up
+
+    Returns True when the list was walked to its end.
+    """
+    adapter = run.adapter
+    cursor_kind = getattr(adapter.pagination, "cursor_kind", None)
+    resume_from = run.resume_position(cursor_kind)
+
+    steps = page_steps(page, run, resume_from)
+    waiting_since = time.perf_counter()
+    try:
+        async for step, html in steps:
+            # Time the strategy took to bring the next page (clicks, scrolls, hash changes)
+            timings.record("paginate", time.perf_counter() - waiting_since)
+            if run.stop_requested:
+                break
+
+            if html is not None:
+                with span("parse"):
+                    soup = adapter.parse_page(html)
+            elif adapter.js_fields:
+                soup = None  # extract_rows reads the fields inside the page
+            elif adapter.incremental and adapter.card_selectors:
+                # Only the cards added since the last step leave the browser
+                with span("content"):
+                    soup = await new_cards(page, adapter.card_selectors, adapter.html_parser)
+                print(f"🆕 {len(soup)} new cards")
+            else:
+                with span("content"):
+                    html = await page.content()
+                with span("parse"):
+                    soup = adapter.parse_page(html)
+            extract_started = time.perf_counter()
+            async for row in adapter.extract_rows(page, soup, run):
+                if adapter.is_empty(row):
+                    print(f"⏭️ Skipped empty row")
+                    continue
+
+                key = adapter.row_key(row)
+                if key in run.seen_keys:
+                    continue
+                if run.is_existing(key):
+                    run.skipped_existing += 1
+                    run.seen_keys.add(key)
+                    print(f"⏭️ Skipping existing record: {key}")
+                    continue
+                run.seen_keys.add(key)
+
+                if adapter.has_detail():
+                    queue_detail(run, row)
+                else:
+                    commit_row(run, row)
+
+                remaining = run.remaining()
+                if remaining is not None and remaining <= 0:
+                    print(f"✅ Reached target limit of {adapter.max_items} records!")
+                    return False
+            # Cards to rows, dedup and saving (the saving is also counted under "write")
+            timings.record("extract", time.perf_counter() - extract_started)
+
+            print(f"📊 Total unique records collected: {len(run.rows) + len(run.pending)}")
+            with span("write"):
+                run.writer.checkpoint()
+                run.save_cursor(cursor_kind, step)
+
+            if run.stop_requested:
+                break
+            waiting_since = time.perf_counter()
+    finally:
+        # Stops tabs a parallel strategy still has loading
+        await steps.aclose()
+
+    return not run.stop_requested
+
+
+def detail_job(run, row):
+    """(row, url) job for the tab pool, or None once a row with no profile to visit is saved"""
+    url = run.adapter.detail_url(row)
+    if url:
+        return row, url
+    # Nothing to visit - keep the row as it is
+    run.pending.remove(row)
+    commit_row(run, row)
+    return None
+
+
+def queue_detail(run, row):
+    """Hold a row for its profile visit (handed straight to the tab pool while streaming)"""
+    run.pending.append(row)
+    if run.detail_queue is not None:
+        job = detail_job(run, row)
+        if job is not None:
+            run.detail_queue.put_nowait(job)
+
+
+async def read_details(page, run, jobs, total=None):
+    """Load the profile of every (row, url) job in a tab pool and save each row as it finishes"""
+    adapter = run.adapter
+    pool = detail_pool(page, adapter, run.blocker)
+
+    async def read_profile(tab, row):
+        with span("profile"):
+            with span("content"):
+                html = await tab.content()
+            with span("parse"):
+                return adapter.parse_detail(parse_html(html, adapter.html_parser), row)
+
+    try:
+        index = 0
+        async for row, fields in pool.run(jobs, read_profile, lambda: run.stop_requested):
+            index += 1
+            progress = f"{index}/{total}" if total is not None else index
+            print(f"🔍 Finished {progress}: {row.get(adapter.key_field, 'Unknown')}")
+            if fields:
+                row.update(fields)
+            run.pending.remove(row)
+            commit_row(run, row)
+    finally:
+        await pool.close()
+
+
+async def visit_details_pooled(page, run):
+    """Second pass with a tab pool: rows are saved in the order their profile finishes"""
+    adapter = run.adapter
+    total = len(run.pending)
+    jobs = [job for job in (detail_job(run, row) for row in list(run.pending)) if job is not None]
+    print(f"🎯 LEVEL 2: Extracting profile data for {total} records with {adapter.detail_workers} tabs...")
+    await read_details(page, run, jobs, len(jobs))
+
+
+async def collect_rows_streaming(page, run):
+    """Walk the pagination while a tab pool reads the profiles of the rows found so far
+
+    Each row is saved as soon as its profile is read instead of after the whole list.
+    Returns what collect_rows returns.
+    """
+    adapter = run.adapter
+    queue = asyncio.Queue()
+    print(f"🎯 Profiles are read with {adapter.detail_workers} tabs while the list is walked")
+    for row in list(run.pending):
+        # Rows a previous run left unvisited (crawl cursor)
+        job = detail_job(run, row)
+        if job is not None:
+            queue.put_nowait(job)
+
+    run.detail_queue = queue
+    reader = asyncio.create_task(read_details(page, run, queue))
+    try:
+        return await collect_rows(page, run)
+    finally:
+        run.detail_queue = None
+        queue.put_nowait(None)
+        await reader
+
+
+async def visit_details(page, run):
+    """Second pass: open each collected row's profile page"""
+    adapter = run.adapter
+    total = len(run.pending)
+    if not total:
+        return
+
+    if adapter.uses_detail_pool():
+        await visit_details_pooled(page, run)
+        return
+
+    print(f"🎯 LEVEL 2: Extracting profile data for {total} records...")
+    index = 0
+    while run.pending and not run.stop_requested:
+        row = run.pending[0]
+        index += 1
+        print(f"🔍 Processing {index}/{total}: {row.get(adapter.key_field, 'Unknown')}")
+        try:
+            with span("profile"):
+                row.update(await adapter.enrich(page, row))
+        except Exception as e:
+            print(f"Error extracting profile data: {e}")
+        run.pending.pop(0)
+        commit_row(run, row)
+
+        if adapter.detail_delay_range and run.pending:
+            delay = random.uniform(*adapter.detail_delay_range)
+            print(f"⏳ Waiting {delay:.1f} seconds before next record...")
+            with span("sleep"):
+                await page.wait_for_timeout(int(delay * 1000))
+
+
+async def scrape(page, run):
+    """List, paginate, extract, dedup and persist one site"""
+    adapter = run.adapter
+
+    if not await adapter.prepare(page):
+        print("❌ Preparation failed. Cannot proceed with scraping.")
+        return []
+    run.prepared = True
+
+    await open_site(page, adapter)
+
+    if not await adapter.after_open(page):
+        print("❌ Page check failed. Cannot proceed with scraping.")
+        return []
+
+    if adapter.resume:
+        if run.store is not None:
+            # Existence checks go to the store's key index, nothing to load
+            print(f"📁 Found {run.store.count()} stored records")
+        else:
+            run.existing_keys.update(load_existing_keys(adapter.output_filename, adapter.key_field))
+
+    remaining = run.remaining()
+    if remaining is not None and remaining <= 0:
+        print(f"✅ Already have {run.existing_count()} records, target reached!")
+        return []
+
+    if adapter.resume_cursor:
+        run.load_cursor()
+
+    if adapter.max_items > 0:
+        print(f"🎯 Target: Collecting up to {adapter.max_items} records")
+    else:
+        print("🎯 Target: Collecting all available records")
+
+    if adapter.stream_details and adapter.uses_detail_pool():
+        finished = await collect_rows_streaming(page, run)
+    else:
+        finished = await collect_rows(page, run)
+    await visit_details(page, run)
+    if finished and not run.incomplete and run.cursor is not None and not run.stop_requested:
+        # Next run walks the list from the top again to find new records
+        run.cursor.clear()
+    elif run.incomplete and run.cursor is not None:
+        print("⚠️ Some list pages could not be read - the next run resumes from the crawl cursor")
+
+    print(f"🎉 Scraping completed! {len(run.rows)} new records, {run.skipped_existing} already in CSV")
+    return run.rows
+
+
+async def run_adapter_async(adapter, context=None, run=None):
+    """Run one site end to end with the shared browser, storage and interrupt handling
+
+    With context the run opens its own tab in that (already launched) browser context
+    instead of launching a browser; the caller then owns the browser and the interrupt
+    handlers (see run_adapters_async).
+    """
+    print(f"--- {adapter.name} Scraper ---")
+    print(f"🎯 Target URL: {adapter.url}")
+    if adapter.max_items > 0:
+        print(f"📊 Limit: {adapter.max_items} records")
+    else:
+        print("📊 Limit: No limit (collect all)")
+    print()
+
+    run = run or RunState(adapter)
+    live = None
+    if context is None:
+        install_signal_handlers([run], save_partial_data)
+        if adapter.keyboard_stop:
+            start_keyboard_listener([run])
+        timings.reset()
+        if adapter.live_stats:
+            live = LiveStats(lambda: len(run.rows))
+            live.start()
+
+    page = None
+    try:
+        if context is None:
+            print("🚀 Starting Playwright with Chromium...")
+            run.browser, page, run.playwright = await get_browser_and_page(**adapter.browser_options())
+        else:
+            page = await context.new_page()
+            page.set_default_timeout(adapter.timeout)
+            page.set_default_navigation_timeout(adapter.timeout)
+
+        # Own browser: filter the whole context; shared browser: only this run's tabs
+        run.blocker = resource_blocker(adapter)
+        if run.blocker is not None:
+            await run.blocker.attach(page.context if context is None else page)
+        run.router = mock_router(adapter)
+        if run.router is not None:
+            # On the context so pooled tabs are answered by the mock as well
+            await run.router.attach(page.context)
+
+        run.store = open_store(adapter)
+        scraped_data = await scrape(page, run)
+        run.completed = not run.stop_requested
+
+        if scraped_data:
+            print(f"✅ All data has been saved incrementally to {adapter.output_filename}.csv")
+            # Also save final JSON backup
+            save_data(scraped_data, f"{adapter.output_filename}_final")
+        else:
+            print("✅ No new records found - all data is already up to date!")
+
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        print("Make sure Chrome is closed and Playwright is installed:")
+        print("pip install playwright && playwright install chromium")
+
+    finally:
+        run.stop_requested = True
+        run.writer.close()
+        if run.store is not None:
+            # The CSV / JSON are regenerated from the store: every record once, in order
+            run.store.export()
+        if not run.completed:
+            # Save any partial data before closing
+            save_partial_data(run)
+        if live is not None:
+            await live.stop()
+        wait_stats.print_summary()
+        timings.print_summary()
+        if adapter.run_report:
+            write_run_report(f"{adapter.output_filename}_run_report.json", run_report(run))
+        if run.blocker is not None:
+            run.blocker.stats.print_summary()
+        if run.router is not None:
+            run.router.print_summary()
+        if run.store is not None:
+            run.store.close()
+        if context is None:
+            if (page is not None and run.prepared and adapter.keep_state and not adapter.persistent
+                    and run.router is None):
+                # Next run starts (headless) with these cookies / localStorage - never a mock run's
+                await save_storage_state(page.context, adapter.state_path())
+            await close_browser(run.browser, run.playwright)
+        elif page is not None:
+            try:
+                await page.close()
+            except:
+                pass
+            if run.router is not None:
+                await run.router.detach()
+
+    return run.rows
+
+
+async def run_adapters_async(adapters):
+    """Run several sites at once, each in its own tab of one browser
+
+    The browser is launched with the first adapter's options. Returns the rows of each
+    adapter, in order.
+    """
+    runs = [RunState(adapter) for adapter in adapters]
+    install_signal_handlers(runs, save_partial_data)
+    if any(adapter.keyboard_stop for adapter in adapters):
+        start_keyboard_listener(runs)
+
+    print("🚀 Starting Playwright with Chromium...")
+    browser, page, playwright = await get_browser_and_page(**adapters[0].browser_options())
+    try:
+        return await asyncio.gather(*(
+            run_adapter_async(adapter, page.context, run) for adapter, run in zip(adapters, runs)
+        ))
+    finally:
+        await close_browser(browser, playwright)
+
+
+def run_adapter(adapter):
+    """Blocking entry point for the `python x.py` scripts"""
+    return asyncio.run(run_adapter_async(adapter))
+
+
+def run_adapters(adapters):
+    """Blocking entry point that scrapes several sites concurrently in one browser"""
+    return asyncio.run(run_adapters_async(adapters))
@@ -0,0 +1,96 @@
+import glob
+import json
+import os
+
+from engine.config import SNAPSHOT_DIR
+from engine.extract import parse_html, parse_page
+
+# snapshots/<site>/*.html          list pages
+# snapshots/<site>/detail/*.html   profile pages (or modals)
+# snapshots/<site>/har/*.har       network recordings of the pages above
+# snapshots/<site>/golden/*.json   expected rows of every snapshot (*.js.json: read in the browser)
+DETAIL_DIR = "detail"
+HAR_DIR = "har"
+GOLDEN_DIR = "golden"
+
+
+def site_dir(site, *parts):
+    """Snapshot directory of a site (or a subdirectory of it)"""
+    return os.path.join(SNAPSHOT_DIR, site, *parts)
+
+
+def list_snapshots(site):
+    return sorted(glob.glob(os.path.join(site_dir(site), "*.html")))
+
+
+def detail_snapshots(site):
+    return sorted(glob.glob(os.path.join(site_dir(site, DETAIL_DIR), "*.html")))
+
+
+def save_snapshot(path, html):
+    """Write a recorded page, creating its directory"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(html)
+
+
+def read_snapshot(path):
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def extract_list(adapter, html, parser=None):
+    """Rows the adapter's parse_card finds in a list page (None when it has no parse_card)"""
+    soup = parse_page(html, adapter.card_selectors, parser)
+    rows = []
+    for card in adapter.select_cards(soup):
+        try:
+            row = adapter.parse_card(card)
+        except NotImplementedError:
+            return None
+        except Exception:
+            continue
+        if row:
+            rows.append(row)
+    return rows
+
+
+def extract_detail(parse, html, parser=None):
+    """Fields a detail parser (soup -> dict) reads from a profile page, as a one-row list"""
+    return [parse(parse_html(html, parser))]
+
+
+def golden_path(site, snapshot_path, variant=None):
+    """Golden file of a snapshot: list and detail pages, and each extraction variant, are kept apart"""
+    name = os.path.splitext(os.path.basename(snapshot_path))[0]
+    if os.path.basename(os.path.dirname(snapshot_path)) == DETAIL_DIR:
+        name = f"{DETAIL_DIR}_{name}"
+    if variant:
+        name = f"{name}.{variant}"
+    return site_dir(site, GOLDEN_DIR, f"{name}.json")
+
+
+def load_golden(path):
+    """Expected rows of a snapshot, or None when no golden file was written yet"""
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_golden(path, rows):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(rows, f, ensure_ascii=False, indent=2)
+
+
+def diff_rows(rows, golden):
+    """Readable differences between extracted rows and the golden rows (empty when equal)"""
+    differences = []
+    if len(rows) != len(golden):
+        differences.append(f"{len(rows)} rows instead of {len(golden)}")
+    for index, (row, expected) in enumerate(zip(rows, golden)):
+        for field in sorted(set(row) | set(expected)):
+            if row.get(field) != expected.get(field):
+                differences.append(f"row {index} {field}: {expected.get(field)!r} -> {row.get(field)!r}")
+    return differences
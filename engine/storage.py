@@ -0,0 +1,197 @@
+import csv
+import os
+import time
+
+import pandas as pd
+
+from engine.config import CSV_BATCH_SIZE, CSV_ENCODING, CSV_FLUSH_INTERVAL
+from engine.timing import span
+
+
+def save_data(data, filename, append_mode=False, dedup_key=None):
+    """Save scraped data to CSV and JSON formats
+
+    With append_mode the rows are added to an existing CSV instead of replacing it and the
+    JSON is rewritten from the combined file. dedup_key drops duplicate rows on that column
+    (first occurrence wins) before writing.
+    """
+    if not data:
+        print("No data found to save.")
+        return
+
+    with span("write"):
+        df = pd.DataFrame(data)
+        csv_path = f"{filename}.csv"
+        json_path = f"{filename}.json"
+
+        if append_mode and os.path.exists(csv_path):
+            try:
+                existing_df = pd.read_csv(csv_path, encoding=CSV_ENCODING)
+                df = pd.concat([existing_df, df], ignore_index=True)
+            except Exception as e:
+                print(f"⚠️ Error reading existing CSV: {e} - saving new data only")
+
+        if dedup_key and dedup_key in df.columns:
+            df = df.drop_duplicates(subset=[dedup_key], keep='first')
+
+        df.to_csv(csv_path, index=False, encoding=CSV_ENCODING)
+        print(f"✅ Data successfully saved to {csv_path}")
+
+        df.to_json(json_path, orient='records', indent=4, force_ascii=False)
+        print(f"✅ Data successfully saved to {json_path}")
+
+
+def save_incremental_data(row, filename, backup=True):
+    """Save a single row incrementally to CSV (append mode)
+
+    One-off appends only: a run writes its rows through a StreamingCsvWriter.
+    """
+    csv_path = f"{filename}.csv"
+
+    try:
+        df_new = pd.DataFrame([row])
+        if os.path.exists(csv_path):
+            # Append to existing CSV
+            df_new.to_csv(csv_path, mode='a', header=False, index=False, encoding=CSV_ENCODING)
+        else:
+            # Create new CSV with header
+            df_new.to_csv(csv_path, index=False, encoding=CSV_ENCODING)
+
+    except Exception as e:
+        print(f"❌ Error saving row: {e}")
+        if not backup:
+            return
+        # Fallback: try to save to a backup file
+        backup_path = f"{filename}_backup.csv"
+        try:
+            df_new = pd.DataFrame([row])
+            df_new.to_csv(backup_path, mode='a', header=not os.path.exists(backup_path), index=False, encoding=CSV_ENCODING)
+            print(f"💾 Saved to backup file: {backup_path}")
+        except Exception as backup_e:
+            print(f"❌ Backup save also failed: {backup_e}")
+
+
+class StreamingCsvWriter:
+    """Long-lived CSV appender for a run's rows
+
+    The file stays open and rows go through the csv module under a fixed header: the
+    existing file's header, or for a new file the first row's keys followed by any
+    extra_fields it lacks (fields outside the header are dropped, missing ones left blank).
+    extra_fields are the columns later rows may add, e.g. the adapter's detail_fields when
+    the first row's profile could not be read. Rows are buffered and written once
+    batch_size rows are waiting or flush_interval seconds have passed; checkpoint() also
+    fsyncs so the rows survive a crash.
+    """
+
+    def __init__(self, filename, batch_size=CSV_BATCH_SIZE, flush_interval=CSV_FLUSH_INTERVAL, extra_fields=()):
+        self.filename = filename
+        self.extra_fields = list(extra_fields)
+        self.csv_path = f"{filename}.csv"
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.fieldnames = None
+        self.file = None
+        self.writer = None
+        self.buffer = []
+        self.last_flush = time.monotonic()
+        self.rows_written = 0
+        self.dropped_fields = set()
+
+    def read_header(self):
+        """Header of the existing CSV file, or None for a missing / empty file"""
+        if not os.path.exists(self.csv_path) or os.path.getsize(self.csv_path) == 0:
+            return None
+        with open(self.csv_path, newline='', encoding=CSV_ENCODING) as f:
+            return next(csv.reader(f), None)
+
+    def open(self, first_row):
+        """Open the file for appending, writing the header for a new file"""
+        self.fieldnames = self.read_header()
+        new_file = self.fieldnames is None
+        if new_file:
+            self.fieldnames = list(first_row.keys())
+            self.fieldnames += [field for field in self.extra_fields if field not in self.fieldnames]
+        self.file = open(self.csv_path, 'a', newline='', encoding=CSV_ENCODING)
+        self.writer = csv.DictWriter(self.file, fieldnames=self.fieldnames, restval='', extrasaction='ignore')
+        if new_file:
+            self.writer.writeheader()
+
+    def write(self, row):
+        """Queue one row; flushes when the batch is full or the interval has passed"""
+        self.buffer.append(row)
+        if len(self.buffer) >= self.batch_size or time.monotonic() - self.last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        """Write the queued rows to the file"""
+        if not self.buffer:
+            return
+        rows, self.buffer = self.buffer, []
+        try:
+            if self.file is None:
+                self.open(rows[0])
+            for row in rows:
+                extra = set(row) - set(self.fieldnames) - self.dropped_fields
+                if extra:
+                    print(f"⚠️ Fields not in the CSV header are not saved: {', '.join(sorted(extra))}")
+                    self.dropped_fields |= extra
+            self.writer.writerows(rows)
+            self.file.flush()
+            self.rows_written += len(rows)
+        except Exception as e:
+            print(f"❌ Error saving rows: {e}")
+            # Fallback: try to save to a backup file
+            for row in rows:
+                save_incremental_data(row, f"{self.filename}_backup", backup=False)
+        self.last_flush = time.monotonic()
+
+    def checkpoint(self):
+        """Flush and fsync so everything written so far is on disk"""
+        self.flush()
+        if self.file is not None:
+            try:
+                os.fsync(self.file.fileno())
+            except Exception as e:
+                print(f"⚠️ Could not sync {self.csv_path}: {e}")
+
+    def close(self):
+        """Checkpoint and close the file (the writer reopens it on the next write)"""
+        self.checkpoint()
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+            self.writer = None
+
+
+def load_existing_keys(filename, key_field):
+    """Load the key column of an existing CSV file to avoid duplicates"""
+    csv_path = f"{filename}.csv"
+    existing_keys = set()
+
+    if not os.path.exists(csv_path):
+        print("📝 No existing CSV found - will create new file")
+        return existing_keys
+
+    try:
+        df = pd.read_csv(csv_path, encoding=CSV_ENCODING)
+        if key_field in df.columns:
+            existing_keys = set(df[key_field].dropna().astype(str))
+            print(f"📁 Found existing CSV with {len(existing_keys)} records")
+        else:
+            print(f"⚠️ Existing CSV found but no '{key_field}' column - will process all records")
+    except Exception as e:
+        print(f"⚠️ Error reading existing CSV: {e} - will process all records")
+
+    return existing_keys
+
+
+def count_rows(filename):
+    """Return the number of rows in an existing CSV file (0 if missing)"""
+    csv_path = f"{filename}.csv"
+    if not os.path.exists(csv_path):
+        return 0
+    try:
+        return len(pd.read_csv(csv_path, encoding=CSV_ENCODING))
+    except Exception as e:
+        print(f"❌ Error reading CSV: {e}")
+        return 0
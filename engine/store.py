@@ -0,0 +1,164 @@
+import csv
+import json
+import os
+import sqlite3
+import sys
+import time
+
+import pandas as pd
+
+from engine.config import CSV_ENCODING
+
+CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS rows (
+    key TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    updated_at REAL NOT NULL
+)
+"""
+
+UPSERT = """
+INSERT INTO rows (key, data, updated_at) VALUES (?, ?, ?)
+ON CONFLICT(key) DO UPDATE SET data = excluded.data, updated_at = excluded.updated_at
+"""
+
+
+class SqliteStore:
+    """One site's rows in a SQLite file (WAL mode), unique on the adapter's key field
+
+    Existence checks and upserts go through the primary key index, so resuming never has
+    to reload the whole result set. Rows keep the order they were first stored in; CSV and
+    JSON files are exported from the store on demand.
+    """
+
+    def __init__(self, filename, key_field, normalize=str):
+        self.filename = filename
+        self.db_path = f"{filename}.db"
+        self.key_field = key_field
+        self.normalize = normalize
+        self.connection = sqlite3.connect(self.db_path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(CREATE_TABLE)
+        self.connection.commit()
+
+    def key_of(self, row):
+        value = row.get(self.key_field)
+        return (self.normalize(value) or None) if value is not None else None
+
+    def exists(self, key):
+        """True when a row with this (normalized) key is stored"""
+        if key is None:
+            return False
+        return self.connection.execute("SELECT 1 FROM rows WHERE key = ?", (str(key),)).fetchone() is not None
+
+    def upsert(self, row):
+        """Insert the row, or replace the stored row with the same key"""
+        key = self.key_of(row)
+        if key is None:
+            print(f"⚠️ Row without '{self.key_field}' not stored")
+            return False
+        self.connection.execute(UPSERT, (key, json.dumps(row, ensure_ascii=False), time.time()))
+        self.connection.commit()
+        return True
+
+    def count(self):
+        return self.connection.execute("SELECT COUNT(*) FROM rows").fetchone()[0]
+
+    def rows(self):
+        """Every stored row, in the order it was first stored"""
+        for (data,) in self.connection.execute("SELECT data FROM rows ORDER BY rowid"):
+            yield json.loads(data)
+
+    def import_csv(self, filename=None):
+        """Seed the store from an existing CSV (rows whose key is already stored are kept)"""
+        csv_path = f"{filename or self.filename}.csv"
+        if not os.path.exists(csv_path):
+            return 0
+        try:
+            df = pd.read_csv(csv_path, encoding=CSV_ENCODING, dtype=str, keep_default_na=False)
+        except Exception as e:
+            print(f"⚠️ Error reading existing CSV: {e} - store starts empty")
+            return 0
+        if self.key_field not in df.columns:
+            print(f"⚠️ Existing CSV found but no '{self.key_field}' column - store starts empty")
+            return 0
+
+        imported = 0
+        now = time.time()
+        for row in df.to_dict('records'):
+            key = self.key_of(row)
+            if key:
+                cursor = self.connection.execute(
+                    "INSERT OR IGNORE INTO rows (key, data, updated_at) VALUES (?, ?, ?)",
+                    (key, json.dumps(row, ensure_ascii=False), now)
+                )
+                imported += cursor.rowcount
+        self.connection.commit()
+        print(f"📥 Imported {imported} records from {csv_path} into {self.db_path}")
+        return imported
+
+    def export(self, filename=None):
+        """Write every stored row to <filename>.csv and <filename>.json"""
+        filename = filename or self.filename
+        try:
+            rows = list(self.rows())
+        except sqlite3.ProgrammingError:
+            print(f"⚠️ {self.db_path} is already closed - nothing exported")
+            return 0
+        if not rows:
+            print("No data found to export.")
+            return 0
+
+        fieldnames = []
+        for row in rows:
+            for field in row:
+                if field not in fieldnames:
+                    fieldnames.append(field)
+
+        csv_path = f"{filename}.csv"
+        with open(csv_path, 'w', newline='', encoding=CSV_ENCODING) as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames, restval='')
+            writer.writeheader()
+            writer.writerows(rows)
+        print(f"✅ Data successfully saved to {csv_path}")
+
+        json_path = f"{filename}.json"
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(rows, f, indent=4, ensure_ascii=False)
+        print(f"✅ Data successfully saved to {json_path}")
+        return len(rows)
+
+    def close(self):
+        try:
+            self.connection.commit()
+            self.connection.close()
+        except sqlite3.ProgrammingError:
+            pass  # already closed
+
+
+def open_store(adapter):
+    """SqliteStore for an adapter with use_sqlite, seeded from its CSV on first use, or None"""
+    if not adapter.use_sqlite:
+        return None
+    store = SqliteStore(adapter.output_filename, adapter.key_field, adapter.normalize_key)
+    if store.count() == 0:
+        store.import_csv()
+    print(f"🗄️  Using {store.db_path} ({store.count()} records)")
+    return store
+
+
+def main():
+    """python -m engine.store <output_filename> <key field> - export a store to CSV and JSON"""
+    if len(sys.argv) < 2:
+        print("Usage: python -m engine.store <output_filename> [key field]")
+        return
+    store = SqliteStore(sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else "Name")
+    try:
+        store.export()
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+import asyncio
+import json
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+# Lines still printed while LiveStats owns the console
+KEEP_MARKERS = ("❌", "⚠️", "🛑", "Error", "error")
+
+# Stages shown on the live status line
+LIVE_STAGES = ("paginate", "navigate", "content", "parse", "profile", "write", "wait", "sleep")
+
+
+class StageTimings:
+    """Wall time spent in each stage of a run
+
+    The engine records: paginate (waiting for the next list page), navigate (page.goto),
+    content (page.content() and in-page card reads), parse (HTML parsing), extract (cards to
+    saved rows), write (CSV / store / pandas), profile (one profile read), wait (the
+    condition waits of engine/waits.py) and sleep (fixed page.wait_for_timeout pauses).
+    Stages are timed with span() around the code they cover; spans may nest, so a stage's
+    total includes the stages opened inside it.
+    """
+
+    def __init__(self):
+        self.durations = {}  # stage -> [seconds, ...] in the order they were recorded
+        self.started = time.monotonic()
+
+    def record(self, stage, seconds):
+        self.durations.setdefault(stage, []).append(seconds)
+
+    @contextmanager
+    def span(self, stage):
+        """Time the body of a with block as one occurrence of stage (also for async code)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - started)
+
+    def total(self, stage):
+        return sum(self.durations.get(stage, []))
+
+    def elapsed(self):
+        return time.monotonic() - self.started
+
+    def summary(self):
+        """One dict per stage, in the order the stages were first used"""
+        stages = []
+        for stage, durations in self.durations.items():
+            ordered = sorted(durations)
+            stages.append({
+                "stage": stage,
+                "count": len(ordered),
+                "total_s": round(sum(ordered), 3),
+                "mean_ms": round(sum(ordered) / len(ordered) * 1000, 1),
+                "p50_ms": round(percentile(ordered, 50) * 1000, 1),
+                "p90_ms": round(percentile(ordered, 90) * 1000, 1),
+                "p99_ms": round(percentile(ordered, 99) * 1000, 1),
+                "max_ms": round(ordered[-1] * 1000, 1),
+            })
+        return stages
+
+    def print_summary(self):
+        if not self.durations:
+            return
+        print("⏱️  Stage summary:")
+        for item in self.summary():
+            print(f"   {item['stage']}: {item['count']}x, {item['total_s']:.1f}s total, "
+                  f"p50 {item['p50_ms']:.0f} ms, p90 {item['p90_ms']:.0f} ms, max {item['max_ms']:.0f} ms")
+
+    def reset(self):
+        self.durations = {}
+        self.started = time.monotonic()
+
+
+def percentile(ordered, percent):
+    """Nearest-rank percentile of an already sorted list"""
+    if not ordered:
+        return 0
+    index = max(0, min(len(ordered) - 1, round(percent / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+timings = StageTimings()
+
+
+def span(stage):
+    """timings.span(stage) - `with span("parse"): ...`"""
+    return timings.span(stage)
+
+
+def write_run_report(path, report):
+    """Write a run report (see run_report in engine/runner.py) as JSON"""
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"📈 Run report saved to {path}")
+    except Exception as e:
+        print(f"⚠️ Could not write the run report {path}: {e}")
+
+
+def now_iso():
+    return datetime.now().isoformat(timespec="seconds")
+
+
+class QuietStdout:
+    """stdout stand-in that only lets warnings and errors through (see KEEP_MARKERS)"""
+
+    def __init__(self, stream, live):
+        self.stream = stream
+        self.live = live
+
+    def write(self, text):
+        if any(marker in text for marker in KEEP_MARKERS):
+            self.live.clear_line()
+            self.stream.write(text if text.endswith("\n") else f"{text}\n")
+        return len(text)
+
+    def flush(self):
+        self.stream.flush()
+
+
+class LiveStats:
+    """One status line rewritten every `interval` seconds in place of the progress prints
+
+    rows is a callable returning the rows saved so far. While running, print() output is
+    reduced to warnings and errors.
+    """
+
+    def __init__(self, rows, interval=1.0, stages=LIVE_STAGES):
+        self.rows = rows
+        self.interval = interval
+        self.stages = stages
+        self.stream = sys.stdout
+        self.task = None
+        self.width = 0
+
+    def line(self):
+        elapsed = timings.elapsed()
+        rows = self.rows()
+        parts = [f"⏱️ {elapsed:6.0f}s", f"{rows} rows ({rows / elapsed if elapsed else 0:.1f}/s)"]
+        parts += [f"{stage} {timings.total(stage):.1f}s" for stage in self.stages if stage in timings.durations]
+        return " | ".join(parts)
+
+    def clear_line(self):
+        if self.width:
+            self.stream.write("\r" + " " * self.width + "\r")
+            self.width = 0
+
+    def draw(self):
+        line = self.line()
+        self.clear_line()
+        self.stream.write(line)
+        self.stream.flush()
+        self.width = len(line)
+
+    async def refresh(self):
+        while True:
+            self.draw()
+            await asyncio.sleep(self.interval)
+
+    def start(self):
+        self.stream = sys.stdout
+        sys.stdout = QuietStdout(self.stream, self)
+        self.task = asyncio.create_task(self.refresh())
+
+    async def stop(self):
+        if self.task is None:
+            return
+        self.task.cancel()
+        await asyncio.gather(self.task, return_exceptions=True)
+        self.task = None
+        self.draw()
+        self.stream.write("\n")
+        sys.stdout = self.stream
@@ -0,0 +1,210 @@
+import time
+
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from engine.timing import timings
+
+# Resolves once no mutation has been seen under root for quietMs (after the first one when
+# requireChange is set), or with false when the ceiling is reached
+DOM_SETTLE_SCRIPT = """
+([selector, quietMs, timeoutMs, requireChange]) => new Promise(resolve => {
+    const root = (selector && document.querySelector(selector)) || document.body;
+    let changed = false;
+    let quietTimer = null;
+    const finish = result => {
+        observer.disconnect();
+        clearTimeout(quietTimer);
+        clearTimeout(ceilingTimer);
+        resolve(result);
+    };
+    const armQuietTimer = () => {
+        clearTimeout(quietTimer);
+        quietTimer = setTimeout(() => finish(true), quietMs);
+    };
+    const observer = new MutationObserver(() => {
+        changed = true;
+        armQuietTimer();
+    });
+    observer.observe(root, {childList: true, subtree: true, characterData: true});
+    const ceilingTimer = setTimeout(() => finish(changed), timeoutMs);
+    if (!requireChange) {
+        armQuietTimer();
+    }
+})
+"""
+
+# Resolves "found" as soon as selector matches, "absent" once the DOM has been quiet for
+# quietMs without it, or "timeout" at the ceiling
+SELECTOR_OR_SETTLE_SCRIPT = """
+([selector, quietMs, timeoutMs]) => new Promise(resolve => {
+    if (document.querySelector(selector)) {
+        resolve("found");
+        return;
+    }
+    let quietTimer = null;
+    const finish = result => {
+        observer.disconnect();
+        clearTimeout(quietTimer);
+        clearTimeout(ceilingTimer);
+        resolve(result);
+    };
+    const armQuietTimer = () => {
+        clearTimeout(quietTimer);
+        quietTimer = setTimeout(() => finish("absent"), quietMs);
+    };
+    const observer = new MutationObserver(() => {
+        if (document.querySelector(selector)) {
+            finish("found");
+        } else {
+            armQuietTimer();
+        }
+    });
+    observer.observe(document.documentElement, {childList: true, subtree: true});
+    const ceilingTimer = setTimeout(() => finish("timeout"), timeoutMs);
+    armQuietTimer();
+})
+"""
+
+COUNT_GROWTH_SCRIPT = "([selector, previous]) => document.querySelectorAll(selector).length > previous"
+HEIGHT_GROWTH_SCRIPT = "previous => document.body.scrollHeight > previous"
+NEAR_BOTTOM_SCRIPT = "margin => window.scrollY + window.innerHeight >= document.body.scrollHeight - margin"
+
+
+class WaitStats:
+    """How long each kind of wait actually took compared to the fixed sleep it replaced"""
+
+    def __init__(self):
+        self.entries = {}  # label -> [waits, condition met, waited ms, budget ms]
+
+    def record(self, label, waited_ms, budget_ms, met):
+        entry = self.entries.setdefault(label, [0, 0, 0, 0])
+        entry[0] += 1
+        entry[1] += 1 if met else 0
+        entry[2] += waited_ms
+        entry[3] += budget_ms
+
+    def summary(self):
+        """One dict per wait label, in the order the labels were first used"""
+        return [
+            {
+                "wait": label,
+                "count": waits,
+                "met": met,
+                "waited_ms": int(waited),
+                "budget_ms": int(budget),
+                "saved_ms": int(budget - waited),
+            }
+            for label, (waits, met, waited, budget) in self.entries.items()
+        ]
+
+    def print_summary(self):
+        if not self.entries:
+            return
+        print("⏱️  Wait summary (actual vs. old fixed budget):")
+        for item in self.summary():
+            print(f"   {item['wait']}: {item['count']} waits, {item['met']} met early, "
+                  f"{item['waited_ms'] / 1000:.1f}s waited vs {item['budget_ms'] / 1000:.1f}s budget "
+                  f"({item['saved_ms'] / 1000:.1f}s saved)")
+
+    def reset(self):
+        self.entries = {}
+
+
+wait_stats = WaitStats()
+
+
+def _record(label, started, budget_ms, met):
+    waited_ms = (time.monotonic() - started) * 1000
+    wait_stats.record(label, waited_ms, budget_ms, met)
+    timings.record("wait", waited_ms / 1000)
+    return met
+
+
+async def wait_for_count_growth(page, selector, previous, timeout_ms, label="count growth", budget_ms=None):
+    """Wait until more than `previous` elements match selector (True) or the ceiling passes (False)"""
+    started = time.monotonic()
+    try:
+        await page.wait_for_function(COUNT_GROWTH_SCRIPT, arg=[selector, previous], timeout=timeout_ms)
+        met = True
+    except Exception:
+        met = False
+    return _record(label, started, budget_ms if budget_ms is not None else timeout_ms, met)
+
+
+async def wait_for_height_growth(page, previous, timeout_ms, label="height growth", budget_ms=None):
+    """Wait until the page is taller than `previous` pixels (True) or the ceiling passes (False)"""
+    started = time.monotonic()
+    try:
+        await page.wait_for_function(HEIGHT_GROWTH_SCRIPT, arg=previous, timeout=timeout_ms)
+        met = True
+    except Exception:
+        met = False
+    return _record(label, started, budget_ms if budget_ms is not None else timeout_ms, met)
+
+
+async def is_near_bottom(page, margin=200):
+    """True when the viewport is within margin pixels of the end of the page"""
+    try:
+        return await page.evaluate(NEAR_BOTTOM_SCRIPT, margin)
+    except Exception:
+        return True
+
+
+async def wait_for_dom_settle(page, selector=None, quiet_ms=500, timeout_ms=5000, require_change=True,
+                              label="dom settle", budget_ms=None):
+    """Wait until the DOM under selector stops changing for quiet_ms
+
+    With require_change the wait first needs at least one mutation (content being swapped
+    in); returns False when the ceiling passes without that.
+    """
+    started = time.monotonic()
+    try:
+        met = await page.evaluate(DOM_SETTLE_SCRIPT, [selector, quiet_ms, timeout_ms, require_change])
+    except Exception:
+        # Navigation replaced the document - that is a change that has settled
+        met = True
+    return _record(label, started, budget_ms if budget_ms is not None else timeout_ms, met)
+
+
+async def wait_for_selector_or_settle(page, selector, quiet_ms=750, timeout_ms=10000, label=None, budget_ms=None):
+    """Wait until selector shows up, or the page has settled for quiet_ms without it
+
+    Returns True when the element is there, False when the page is confirmed to have none
+    (or the ceiling passed first).
+    """
+    started = time.monotonic()
+    try:
+        outcome = await page.evaluate(SELECTOR_OR_SETTLE_SCRIPT, [selector, quiet_ms, timeout_ms])
+    except Exception:
+        outcome = "timeout"
+    _record(label or f"{selector} or settle", started, budget_ms if budget_ms is not None else timeout_ms,
+            outcome != "timeout")
+    return outcome == "found"
+
+
+async def wait_for_selector_state(page, selector, state="visible", timeout_ms=5000, label=None, budget_ms=None):
+    """Wait for selector to reach state ("visible", "hidden", "attached", ...)"""
+    started = time.monotonic()
+    try:
+        await page.wait_for_selector(selector, state=state, timeout=timeout_ms)
+        met = True
+    except Exception:
+        met = False
+    return _record(label or f"{selector} {state}", started, budget_ms if budget_ms is not None else timeout_ms, met)
+
+
+async def run_and_wait_for_response(page, action, url_part, timeout_ms=10000, label="network response", budget_ms=None):
+    """Run the coroutine function action() and wait for a response whose URL contains url_part
+
+    Returns the response, or None when the ceiling passes first.
+    """
+    started = time.monotonic()
+    response = None
+    try:
+        async with page.expect_response(lambda r: url_part in r.url, timeout=timeout_ms) as response_info:
+            await action()
+        response = await response_info.value
+    except PlaywrightTimeoutError:
+        response = None
+    _record(label, started, budget_ms if budget_ms is not None else timeout_ms, response is not None)
+    return response
@@ -0,0 +1,38 @@
+import asyncio
+import sys
+
+from engine.browser import close_browser, get_browser_and_page, save_storage_state
+from sites import SITE_ADAPTERS, adapter_class
+
+# --- Configuration ---
+# Log in once with a browser window; the cookies and localStorage are saved to
+# browser_state/<site>.json and every later run of that site reuses them headless.
+# Usage: `python login.py codementor`
+
+
+async def login(site):
+    """Open the site with a window, wait for a manual login and save the browser state"""
+    adapter = adapter_class(site)()
+    options = adapter.browser_options()
+    options.update(headless=False, persistent=False)
+
+    browser, page, playwright = await get_browser_and_page(**options)
+    try:
+        print(f"🌐 Opening {adapter.url}")
+        await page.goto(adapter.url, wait_until="domcontentloaded")
+        print("🔐 Log in in the browser window, then press ENTER here to save the session...")
+        await asyncio.to_thread(input)
+        await save_storage_state(page.context, adapter.state_path())
+    finally:
+        await close_browser(browser, playwright)
+
+
+def main():
+    """Save a logged-in browser state for one site"""
+    if len(sys.argv) != 2 or sys.argv[1] not in SITE_ADAPTERS:
+        print(f"Usage: python login.py <site> (one of {', '.join(SITE_ADAPTERS)})")
+        return
+    asyncio.run(login(sys.argv[1]))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+import random
+import sys
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+from engine.config import SNAPSHOT_DIR
+from engine.mock_site import MockSite
+from engine.snapshots import list_snapshots
+from sites import SITE_ADAPTERS, adapter_class
+from sites.a16z import MODAL_SELECTOR
+
+# --- Configuration ---
+# Serves the pages saved by record_snapshots.py as if they were the live sites, so
+# concurrency, waits and pagination can be tuned offline. Point a run at it with
+# `SCRAPER_BASE_URL=http://127.0.0.1:8765 python PIF.py` (or base_url_override=...).
+# Usage: `python mock_server.py [sites...]`
+SITES = list(SITE_ADAPTERS)
+
+# Sites whose cards open a recorded modal (selector of the modal in the detail snapshots)
+MODAL_SELECTORS = {
+    "a16z": MODAL_SELECTOR,
+}
+
+# <<<<<<< MOCK SERVER CONFIGURATION >>>>>>>
+HOST = "127.0.0.1"
+PORT = 8765
+LATENCY_MS = (50, 300)  # every response is delayed by a random time in this range
+FAILURE_RATE = 0.0  # share of requests answered with "503 Service Unavailable" (e.g. 0.05)
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    """Answers /<host><path> with the MockSite registered for that host"""
+
+    sites = {}  # domain -> MockSite
+    served = 0
+    failed = 0
+
+    def site_for(self, host):
+        for domain, site in self.sites.items():
+            if domain in host:
+                return site
+        return None
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        host, _, path = parts.path.lstrip("/").partition("/")
+        site = self.site_for(host)
+
+        if LATENCY_MS:
+            time.sleep(random.uniform(*LATENCY_MS) / 1000)
+        if site is None:
+            self.reply(404, "text/plain", f"no snapshots for {host}")
+            return
+        if random.random() < FAILURE_RATE:
+            MockHandler.failed += 1
+            self.reply(503, "text/plain", "injected failure")
+            return
+        MockHandler.served += 1
+        self.reply(*site.respond(f"/{path}", parts.query))
+
+    do_POST = do_GET
+
+    def reply(self, status, content_type, body):
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass  # one line per request would drown the scraper's own output
+
+
+def load_sites(sites):
+    """MockSite of every requested site that has snapshots, keyed by its domain"""
+    loaded = {}
+    for site in sites:
+        if not list_snapshots(site):
+            continue
+        adapter = adapter_class(site)()
+        domain = adapter.domain or urlsplit(adapter.url).hostname
+        loaded[domain] = MockSite(site, adapter, MODAL_SELECTORS.get(site))
+        mock = loaded[domain]
+        print(f"🧪 {site}: {len(mock.list_pages)} list pages ({mock.mode}), {len(mock.details)} profiles, "
+              f"{len(mock.modals)} modals")
+    return loaded
+
+
+def main():
+    """Replay recorded snapshots as local copies of the sites"""
+    sites = sys.argv[1:] or SITES
+    unknown = [site for site in sites if site not in SITE_ADAPTERS]
+    if unknown:
+        print(f"❌ Unknown sites: {', '.join(unknown)} (choose from {', '.join(SITE_ADAPTERS)})")
+        return
+
+    MockHandler.sites = load_sites(sites)
+    if not MockHandler.sites:
+        print(f"❌ No snapshots found in {SNAPSHOT_DIR}/<site>/ - record some with record_snapshots.py")
+        return
+
+    server = ThreadingHTTPServer((HOST, PORT), MockHandler)
+    print(f"🚀 Mock server on http://{HOST}:{PORT} (latency {LATENCY_MS[0]}-{LATENCY_MS[1]} ms, "
+          f"failure rate {FAILURE_RATE:.0%})")
+    print(f"   Run a scraper against it with SCRAPER_BASE_URL=http://{HOST}:{PORT}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"\n📊 Served {MockHandler.served} requests, {MockHandler.failed} injected failures")
+
+if __name__ == "__main__":
+    main()
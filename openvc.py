@@ -0,0 +1,38 @@
+from engine import run_adapters, save_data
+from sites.openvc import INVESTOR_LISTS, OpenVCIndex, multi_list_adapters
+
+# --- Configuration ---
+# Investor lists crawled together in one browser (one tab each)
+LIST_URLS = [
+    INVESTOR_LISTS["pre-seed"][0],
+    INVESTOR_LISTS["seed"][0],
+    INVESTOR_LISTS["series-a"][0],
+    INVESTOR_LISTS["series-b"][0],
+]
+
+# <<<<<<< OUTPUT CONFIGURATION >>>>>>>
+# Every list always gets its own CSV (used to resume). With MERGED_OUTPUT the run also
+# writes one file with each investor once and all the lists it appeared in.
+MERGED_OUTPUT = True
+MERGED_FILENAME = "openvc_all_investors"
+
+# <<<<<<< API REPLAY CONFIGURATION >>>>>>>
+# True = the browser only opens page 1 of each list; the remaining pages are fetched from
+# the request behind the "next" button. Falls back to clicking if it cannot be captured.
+REPLAY_API = True
+
+# No credentials needed for OpenVC (public site)
+
+
+def main():
+    """Crawl every OpenVC investor list at once with a shared investor index"""
+    index = OpenVCIndex()
+    adapters = multi_list_adapters(LIST_URLS, index, replay_api=REPLAY_API)
+    run_adapters(adapters)
+
+    print(f"📊 {len(index.rows)} distinct investors across {len(adapters)} lists")
+    if MERGED_OUTPUT:
+        save_data(index.merged_rows(), MERGED_FILENAME)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+import asyncio
+import os
+import sys
+
+from engine.browser import close_browser, get_browser_and_page
+from engine.config import SNAPSHOT_DIR
+from engine.runner import RunState, open_site, page_steps
+from engine.snapshots import DETAIL_DIR, HAR_DIR, extract_list, save_snapshot, site_dir
+from engine.waits import wait_for_selector_state
+from sites import SITE_ADAPTERS, adapter_class
+from sites.a16z import CARD_SELECTOR as A16Z_CARD_SELECTOR, MODAL_SELECTOR as A16Z_MODAL_SELECTOR
+
+# --- Configuration ---
+# Saves the rendered list and profile pages of each site to snapshots/<site>/ so
+# benchmark_extract.py and benchmark_parsers.py can run without the live sites.
+# Usage: `python record_snapshots.py [sites...]`
+SITES = list(SITE_ADAPTERS)
+
+# Sites whose profiles open in a modal on a card click: (card selector, modal selector)
+MODALS = {
+    "a16z": (A16Z_CARD_SELECTOR, A16Z_MODAL_SELECTOR),
+}
+
+# <<<<<<< RECORDING CONFIGURATION >>>>>>>
+LIST_PAGES = 2  # pagination steps saved per site (page 1 = the page as opened)
+PROFILE_PAGES = 3  # profile pages (or modals) saved per site (0 = none)
+RECORD_HAR = False  # also keep the network traffic in snapshots/<site>/har/<site>.har
+
+
+async def record_list_pages(page, run, site):
+    """Save the first LIST_PAGES steps of the site's pagination; returns the rows found on them"""
+    adapter = run.adapter
+    rows = []
+    saved = 0
+    steps = page_steps(page, run)
+    try:
+        async for step, html in steps:
+            html = html if html is not None else await page.content()
+            saved += 1
+            path = os.path.join(site_dir(site), f"list_{saved:02d}.html")
+            save_snapshot(path, html)
+
+            found = extract_list(adapter, html) or []
+            for row in found:
+                # Strategies that stop once nothing new shows up count the keys seen
+                run.seen_keys.add(adapter.row_key(row))
+            rows.extend(found)
+            print(f"📸 {path} ({len(html) / 1024:.0f} KB, {len(found)} rows)")
+            if saved >= LIST_PAGES:
+                break
+    finally:
+        await steps.aclose()
+    return rows
+
+
+async def record_profiles(page, adapter, site, rows):
+    """Save the profile pages of the first PROFILE_PAGES rows that have one"""
+    urls = []
+    for row in rows:
+        url = adapter.detail_url(row)
+        if url and url not in urls:
+            urls.append(url)
+    for index, url in enumerate(urls[:PROFILE_PAGES], 1):
+        try:
+            await page.goto(url, wait_until="domcontentloaded")
+            await page.wait_for_timeout(adapter.detail_settle_ms or 1000)
+            path = os.path.join(site_dir(site, DETAIL_DIR), f"profile_{index:02d}.html")
+            save_snapshot(path, await page.content())
+            print(f"📸 {path} ({url})")
+        except Exception as e:
+            print(f"⚠️  Could not record {url}: {e}")
+
+
+async def record_modals(page, site, card_selector, modal_selector):
+    """Open the modal of the first PROFILE_PAGES cards and save the page with each one open"""
+    cards = page.locator(card_selector)
+    for index in range(min(await cards.count(), PROFILE_PAGES)):
+        path = os.path.join(site_dir(site, DETAIL_DIR), f"modal_{index + 1:02d}.html")
+        try:
+            await cards.nth(index).click()
+            if not await wait_for_selector_state(page, modal_selector, "visible", 10000, label="modal open"):
+                print(f"⚠️  Card {index + 1} opened no modal")
+                continue
+            save_snapshot(path, await page.content())
+            print(f"📸 {path} (card {index + 1})")
+        except Exception as e:
+            print(f"⚠️  Could not record the modal of card {index + 1}: {e}")
+        finally:
+            try:
+                await page.keyboard.press("Escape")
+                await wait_for_selector_state(page, modal_selector, "hidden", 2000, label="modal close")
+            except:
+                pass
+
+
+async def record_site(site):
+    """Open one site like a scraping run would and save its pages"""
+    adapter = adapter_class(site)()
+    run = RunState(adapter)
+    options = adapter.browser_options()
+    if RECORD_HAR:
+        har_path = os.path.join(site_dir(site, HAR_DIR), f"{site}.har")
+        os.makedirs(os.path.dirname(har_path), exist_ok=True)
+        options["context_options"] = dict(options["context_options"], record_har_path=har_path)
+
+    print(f"\n--- {site} ---")
+    browser, page, playwright = await get_browser_and_page(**options)
+    try:
+        if not await adapter.prepare(page):
+            print(f"❌ {site}: preparation failed (python login.py {site}?)")
+            return
+        await open_site(page, adapter)
+        if not await adapter.after_open(page):
+            print(f"❌ {site}: page check failed")
+            return
+
+        rows = await record_list_pages(page, run, site)
+        if PROFILE_PAGES and site in MODALS:
+            await record_modals(page, site, *MODALS[site])
+        elif PROFILE_PAGES and adapter.visit_profiles:
+            await record_profiles(page, adapter, site, rows)
+    except Exception as e:
+        print(f"❌ Error recording {site}: {e}")
+    finally:
+        if RECORD_HAR:
+            # The HAR file is written when its context closes
+            await page.context.close()
+        await close_browser(browser, playwright)
+
+
+async def record(sites):
+    for site in sites:
+        await record_site(site)
+    print(f"\n✅ Snapshots saved to {SNAPSHOT_DIR}/ - run benchmark_extract.py to measure them")
+
+
+def main():
+    """Record offline page snapshots of every (or the given) site"""
+    sites = sys.argv[1:] or SITES
+    unknown = [site for site in sites if site not in SITE_ADAPTERS]
+    if unknown:
+        print(f"❌ Unknown sites: {', '.join(unknown)} (choose from {', '.join(SITE_ADAPTERS)})")
+        return
+    asyncio.run(record(sites))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+import asyncio
+import sys
+
+from engine.manager import BrowserManager
+from sites import SITE_ADAPTERS, adapter_class
+
+# --- Configuration ---
+# Sites scraped in one process with one shared browser (see sites.SITE_ADAPTERS).
+# Pass site names on the command line to override, e.g. `python run_sites.py openvc vcsheet`
+SITES = ["openvc", "vcsheet", "pif", "recreate"]
+
+# <<<<<<< BROWSER CONFIGURATION >>>>>>>
+HEADLESS = True
+MAX_CONCURRENT_SITES = 4  # sites scraped at the same time
+CONTEXT_MAX_PAGES = 200  # tabs a context may open before it is recycled
+
+
+async def run_sites(sites):
+    """Scrape every site with one warm Chromium, one isolated context per site"""
+    manager = BrowserManager(headless=HEADLESS, max_pages=CONTEXT_MAX_PAGES)
+    try:
+        results = await manager.run_adapters([adapter_class(site)() for site in sites], MAX_CONCURRENT_SITES)
+    finally:
+        await manager.stop()
+
+    for site, rows in zip(sites, results):
+        print(f"📊 {site}: {len(rows)} new records")
+
+
+def main():
+    """Run several scrapers in one long-lived browser process"""
+    sites = sys.argv[1:] or SITES
+    unknown = [site for site in sites if site not in SITE_ADAPTERS]
+    if unknown:
+        print(f"❌ Unknown sites: {', '.join(unknown)} (choose from {', '.join(SITE_ADAPTERS)})")
+        return
+    asyncio.run(run_sites(sites))
+
+if __name__ == "__main__":
+    main()
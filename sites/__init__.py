@@ -0,0 +1,27 @@
+"""Per-site adapters for the shared scraper engine
+
+Each module describes one site (selectors, pagination, profile pass) as a SiteAdapter;
+the top-level scripts only hold the run configuration.
+"""
+
+from importlib import import_module
+
+# Site name -> (module, adapter class), imported on demand
+SITE_ADAPTERS = {
+    "a16z": ("sites.a16z", "A16zAdapter"),
+    "codementor": ("sites.codementor", "CodementorAdapter"),
+    "dealroom": ("sites.dealroom", "DealroomAdapter"),
+    "growthmentor": ("sites.growthmentor", "GrowthMentorAdapter"),
+    "linuxfoundation": ("sites.linuxfoundation", "LinuxFoundationAdapter"),
+    "openvc": ("sites.openvc", "OpenVCAdapter"),
+    "pif": ("sites.pif", "PIFAdapter"),
+    "recreate": ("sites.recreate", "RecreateAdapter"),
+    "signalnfx": ("sites.signalnfx", "SignalNFXAdapter"),
+    "vcsheet": ("sites.vcsheet", "VCSheetAdapter"),
+}
+
+
+def adapter_class(site):
+    """SiteAdapter subclass registered under site"""
+    module_name, class_name = SITE_ADAPTERS[site]
+    return getattr(import_module(module_name), class_name)
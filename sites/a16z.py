@@ -0,0 +1,348 @@
+import random
+import re
+from urllib.parse import urlparse
+
+from engine.adapter import SiteAdapter
+from engine.extract import parse_html
+from engine.keys import fold_text
+from engine.page_state import JsonResponses, flatten, read_page_state, record_lists
+from engine.timing import span
+from engine.waits import wait_for_selector_state
+
+CARD_SELECTOR = "div.column.grid-item.company-grid-item"
+MODAL_SELECTOR = "div.portfolio-modal.show"
+MODAL_BODY = "div.portfolio-modal.show div.portfolio-modal-box div.inner div.portfolio-modal-body"
+
+EMPTY_COMPANY = {
+    "Name": "-",
+    "Website": "-",
+    "Milestones": "-",
+    "Social Links": "-",
+    "About": "-",
+    "Builders": "-"
+}
+
+
+# Key-path hints for reading a company out of the page state / JSON records
+WEBSITE_KEYS = ("website", "websiteurl", "homepage", "homepageurl", "companywebsite")  # exact key names
+MILESTONE_KEYS = ("milestone",)
+ABOUT_KEYS = ("about", "description", "overview", "summary")
+BUILDER_KEYS = ("builder", "founder")
+NAME_KEYS = ("name", "title")
+ASSET_KEYS = ("image", "logo", "icon", "asset", "thumbnail", "photo")  # keys of files, not fields
+SOCIAL_HOSTS = ("twitter.com", "x.com", "linkedin.com", "facebook.com", "instagram.com", "github.com",
+                "youtube.com", "medium.com", "crunchbase.com")
+OWN_HOSTS = ("a16z.com",)
+CDN_HOSTS = ("ctfassets.net", "cloudfront.net", "cloudinary.com", "imgix.net", "amazonaws.com",
+             "googleusercontent.com", "gravatar.com")
+
+
+def website_and_name(href):
+    """Strip the scheme and www. from a website and derive the company name from its domain"""
+    website = href.strip()
+    company_name = "-"
+    if not website:
+        return "-", company_name
+    if website.startswith('http://'):
+        website = website[7:]
+    elif website.startswith('https://'):
+        website = website[8:]
+    if website.startswith('www.'):
+        website = website[4:]
+    # Extract domain name (everything before first slash or dot)
+    domain_parts = website.split('/')[0].split('.')
+    if domain_parts:
+        company_name = domain_parts[0].title()
+    return website, company_name
+
+
+def parse_company_modal(soup):
+    """Extract the company fields from the open portfolio modal"""
+    company = dict(EMPTY_COMPANY)
+
+    # Website from div.modal-aside div.logo a
+    try:
+        logo_link = soup.select_one(f"{MODAL_BODY} div.modal-aside div.logo a")
+        if logo_link:
+            website, company_name = website_and_name(logo_link.get('href', ''))
+            company["Website"] = website
+            company["Name"] = company_name
+    except Exception as e:
+        print(f"Error extracting website: {e}")
+
+    # Milestones from div.modal-aside div.company-info div.info-list ul.list li
+    try:
+        info_list = soup.select_one(f"{MODAL_BODY} div.modal-aside div.company-info div.info-list ul.list")
+        if info_list:
+            milestone_texts = [li.text.strip() for li in info_list.select("li") if li.text.strip()]
+            company["Milestones"] = " | ".join(milestone_texts) if milestone_texts else "-"
+    except Exception as e:
+        print(f"Error extracting milestones: {e}")
+
+    # Social links from div.right ul.social-links li a
+    try:
+        social_container = soup.select_one(f"{MODAL_BODY} div.right ul.social-links")
+        if social_container:
+            social_hrefs = [a.get('href', '').strip() for a in social_container.select("li a") if a.get('href', '').strip()]
+            company["Social Links"] = " | ".join(social_hrefs) if social_hrefs else "-"
+    except Exception as e:
+        print(f"Error extracting social links: {e}")
+
+    # About text: div.block with an h3 "company profile" inside div.modal-content-inner
+    try:
+        modal_content = soup.select_one(f"{MODAL_BODY} div.modal-content div.modal-content-inner")
+        if modal_content:
+            for div in modal_content.select("div[data-v-49a33c22]"):
+                block_div = div.select_one("div.block")
+                if not block_div:
+                    continue
+                h3_tag = block_div.select_one("h3")
+                if h3_tag and "company profile" in h3_tag.text.lower():
+                    about_div = block_div.select_one("div[data-v-49a33c22]")
+                    if about_div:
+                        company["About"] = about_div.text.strip()
+                        break
+    except Exception as e:
+        print(f"Error extracting about text: {e}")
+
+    # Builders from div.right div.builders p
+    try:
+        builders_p = soup.select_one(f"{MODAL_BODY} div.right div.builders p")
+        if builders_p:
+            company["Builders"] = builders_p.text.strip()
+    except Exception as e:
+        print(f"Error extracting builders: {e}")
+
+    return company
+
+
+def host_of(url):
+    host = urlparse(url if "://" in url else f"https://{url}").netloc.lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+def plain_text(value):
+    """Text of a state value that may hold HTML"""
+    value = str(value).strip()
+    return parse_html(value).get_text(" ", strip=True) if "<" in value and ">" in value else value
+
+
+def looks_like_url(value):
+    return isinstance(value, str) and " " not in value.strip() and (
+        value.startswith(("http://", "https://", "www.")))
+
+
+def key_name(path):
+    """Last key of a flattened path, lowercased without separators ("company.website_url" -> "websiteurl")"""
+    return path.rsplit(".", 1)[-1].lower().replace("_", "").replace("-", "")
+
+
+def record_name(record):
+    """The company name a record carries under one of NAME_KEYS, or None"""
+    for name_key in NAME_KEYS:
+        for key, value in record.items():
+            if str(key).lower() == name_key and isinstance(value, str) and value.strip():
+                return plain_text(value)
+    return None
+
+
+def company_from_record(record):
+    """The modal fields of one company record from the page state / JSON, or None without a website"""
+    # Logos, images and other assets carry URLs and alt texts that are not company fields
+    pairs = [(path.lower(), value) for path, value in flatten(record)
+             if not any(key in path.lower() for key in ASSET_KEYS)]
+
+    def under(keys):
+        return [value for path, value in pairs if isinstance(value, str) and value.strip()
+                and any(key in path.rsplit(".", 1)[-1] for key in keys)]
+
+    website = next((value for path, value in pairs if key_name(path) in WEBSITE_KEYS and looks_like_url(value)
+                    and not host_of(value).endswith(SOCIAL_HOSTS + OWN_HOSTS + CDN_HOSTS)), None)
+    if website is None:
+        return None
+
+    company = dict(EMPTY_COMPANY)
+    company["Website"], company["Name"] = website_and_name(website)
+    company["Name"] = record_name(record) or company["Name"]
+
+    milestones = [plain_text(value) for path, value in pairs
+                  if isinstance(value, str) and value.strip() and any(key in path for key in MILESTONE_KEYS)]
+    if milestones:
+        company["Milestones"] = " | ".join(milestones)
+
+    social = []
+    for path, value in pairs:
+        if looks_like_url(value) and host_of(value).endswith(SOCIAL_HOSTS) and value not in social:
+            social.append(value.strip())
+    if social:
+        company["Social Links"] = " | ".join(social)
+
+    about = [plain_text(value) for value in under(ABOUT_KEYS) if not looks_like_url(value)]
+    if about:
+        company["About"] = max(about, key=len)
+
+    builders = [plain_text(value) for path, value in pairs
+                if isinstance(value, str) and value.strip() and any(key in path for key in BUILDER_KEYS)
+                and not looks_like_url(value)]
+    if builders:
+        company["Builders"] = " | ".join(builders)
+
+    return company
+
+
+def record_names(record, company):
+    """Folded names a grid card may show for a company (record names, website, domain name)"""
+    names = {fold_text(company["Website"]), fold_text(company["Name"])}
+    for key, value in record.items():
+        if isinstance(value, str) and str(key).lower() in NAME_KEYS and value.strip():
+            names.add(fold_text(plain_text(value)))
+    return names
+
+
+def companies_from_state(sources):
+    """Companies of the largest record list in the page state / JSON payloads, plus the names they go by"""
+    best = []
+    for records in (found for source in sources for found in record_lists(source)):
+        companies = []
+        for record in records:
+            company = company_from_record(record)
+            if company is not None:
+                companies.append((company, record_names(record, company)))
+        if len(companies) > len(best):
+            best = companies
+    # A single hit is more likely a page-level link than a portfolio list
+    return best if len(best) > 1 else []
+
+
+def card_names(card):
+    """Folded names a grid card can be matched on (linked website, logo alt text, visible text)"""
+    names = set()
+    for link in card.select("a[href]"):
+        href = link['href'].strip()
+        if looks_like_url(href) and not host_of(href).endswith(OWN_HOSTS):
+            website, company_name = website_and_name(href)
+            names.update((fold_text(website), fold_text(company_name)))
+    for image in card.select("img[alt]"):
+        if image['alt'].strip():
+            names.add(fold_text(image['alt']))
+    text = card.get_text(" ", strip=True)
+    if text:
+        names.add(fold_text(text))
+    return names
+
+
+def card_covered(card, known):
+    """True when the bulk pass already has the company behind a grid card (a card with nothing to match on is not)"""
+    names = card_names(card)
+    if not names:
+        return False
+    if names & known:
+        return True
+    # The card text may carry more than the name ("Acme Seed - Fintech"): match whole words,
+    # so "box" does not cover "Dropbox"
+    text = f" {' '.join(words(card.get_text(' ', strip=True)))} "
+    for name in known:
+        name_words = " ".join(words(name))
+        if len(name_words) > 2 and f" {name_words} " in text:
+            print(f"⏭️ Card \"{text.strip()[:60]}\" taken as bulk company \"{name}\"")
+            return True
+    return False
+
+
+def words(text):
+    """Folded words of a text ("Acme Seed - Fintech" -> ["acme", "seed", "fintech"])"""
+    return re.findall(r"\w+", fold_text(text))
+
+
+async def extract_company_modal_data(page, company_card):
+    """Extract detailed information from a16z company modal popup"""
+    try:
+        print(f"🔍 Clicking on company card to open modal...")
+
+        # Click on the company card to open modal
+        await company_card.click()
+
+        # Wait for modal to be visible
+        if await wait_for_selector_state(page, MODAL_SELECTOR, "visible", 10000,
+                                         label="modal open", budget_ms=2000):
+            print("✅ Modal opened successfully")
+        else:
+            print("⚠️ Modal might not have opened, continuing...")
+
+        company = parse_company_modal(parse_html(await page.content()))
+
+        # Close modal by pressing escape
+        try:
+            await page.keyboard.press("Escape")
+            await wait_for_selector_state(page, MODAL_SELECTOR, "hidden", 1000, label="modal close")
+        except:
+            pass
+
+        return company
+
+    except Exception as e:
+        print(f"Error extracting modal data: {e}")
+        return dict(EMPTY_COMPANY)
+
+
+class A16zAdapter(SiteAdapter):
+    """a16z portfolio grid - every company's details live in a modal"""
+
+    name = "a16z Portfolio"
+    url = "https://a16z.com/portfolio/"
+    domain = "a16z.com"
+    output_filename = "a16z_portfolio"
+    card_selectors = [CARD_SELECTOR]
+    ready_marker = "company-grid-item"
+    key_field = "Website"
+    bulk_extract = True  # read every company from the page state / JSON first, click only the cards it misses
+
+    async def prepare(self, page):
+        # The portfolio data may arrive as JSON while the grid loads
+        self.json_responses = JsonResponses()
+        self.json_responses.attach(page)
+        return True
+
+    async def bulk_companies(self, page):
+        """Every company the page state or its JSON responses already hold, with the names they go by"""
+        sources = await read_page_state(page, CARD_SELECTOR)
+        json_responses = getattr(self, "json_responses", None)
+        if json_responses is not None:
+            sources += await json_responses.payloads()
+        companies = companies_from_state(sources)
+        if companies:
+            print(f"📦 Bulk pass: {len(companies)} companies read from the page data")
+        else:
+            print("⚠️ Bulk pass found no company data - opening every modal instead")
+        return companies
+
+    async def extract_rows(self, page, soup, run):
+        company_cards = self.select_cards(soup)
+        print(f"📊 Found {len(company_cards)} company cards on the page")
+
+        to_click = list(range(len(company_cards)))
+        if self.bulk_extract:
+            companies = await self.bulk_companies(page)
+            known = set()
+            for company, names in companies:
+                known.update(names)
+                yield company
+            if companies:
+                to_click = [i for i, card in enumerate(company_cards) if not card_covered(card, known)]
+                print(f"🖱️ {len(to_click)} cards not covered by the bulk pass - opening their modals")
+
+        for position, i in enumerate(to_click):
+            if run.stop_requested:
+                break
+            print(f"🔍 Processing company card {i + 1}/{len(company_cards)}")
+
+            # Create a locator for this specific card to click on it
+            card_locator = page.locator(CARD_SELECTOR).nth(i)
+            yield await extract_company_modal_data(page, card_locator)
+
+            # Add delay between companies to avoid overwhelming the site
+            if position < len(to_click) - 1:
+                delay = random.uniform(1, 3)
+                print(f"⏳ Waiting {delay:.1f} seconds before next company...")
+                with span("sleep"):
+                    await page.wait_for_timeout(int(delay * 1000))
@@ -0,0 +1,281 @@
+import asyncio
+import threading
+import time
+
+from engine.adapter import SiteAdapter
+from engine.extract import absolute_url, parse_html
+from engine.pagination import LoadMore
+from engine.waits import wait_for_selector_or_settle
+
+BASE_URL = "https://www.codementor.io"
+SEARCH_URL = "https://www.codementor.io/search/mentors"
+CARD_SELECTOR = "div.jsx-d63913b6535ac8bc.mentor"
+SOCIAL_LINKS_SELECTOR = "div.social-links"
+
+
+async def check_login_status(page, url=SEARCH_URL):
+    """Open the search page and check if user is logged in to CodeMentor"""
+    try:
+        print("🔍 Checking login status...")
+        await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+        # Mentor cards mean logged in; a login page settles without them
+        await wait_for_selector_or_settle(page, CARD_SELECTOR, quiet_ms=750, timeout_ms=5000,
+                                          label="login check")
+    except Exception as e:
+        print(f"⚠️  Error checking login status: {e}")
+        return False
+    return await read_login_status(page)
+
+
+async def read_login_status(page):
+    """Check if user is logged in to CodeMentor, from the page already loaded"""
+    try:
+        current_url = page.url
+        print(f"📍 Current URL: {current_url}")
+        print(f"📄 Page Title: {await page.title()}")
+
+        # Check if we're on Arc.dev login page (CodeMentor's login service)
+        if "arc.dev" in current_url and "login" in current_url:
+            print("🔐 Redirected to Arc.dev login page - need to login with Google")
+            return False
+
+        # Check if we're on CodeMentor domain
+        if "codementor.io" not in current_url:
+            print("⚠️  Not on CodeMentor domain - may need to login")
+            return False
+
+        login_count = await page.locator("//a[contains(text(), 'Login') or contains(text(), 'Sign in')]").count()
+        profile_count = await page.locator("//a[contains(@href, '/profile') or contains(@href, '/dashboard')]").count()
+        logout_count = await page.locator("//a[contains(text(), 'Logout') or contains(text(), 'Sign out')]").count()
+        mentor_cards = await page.locator(CARD_SELECTOR).count()
+
+        print(f"🔍 Login elements found: {login_count}")
+        print(f"🔍 Profile elements found: {profile_count}")
+        print(f"🔍 Logout elements found: {logout_count}")
+        print(f"🔍 Mentor cards found: {mentor_cards}")
+
+        # If we find mentor cards, we're likely logged in and on the right page
+        if mentor_cards > 0:
+            print("✅ Found mentor cards - appears to be logged in to CodeMentor")
+            return True
+
+        # If we find login elements and no profile/logout elements, user is not logged in
+        if login_count > 0 and profile_count == 0 and logout_count == 0:
+            print("❌ User is NOT logged in to CodeMentor")
+            return False
+
+        print("✅ User appears to be logged in to CodeMentor")
+        return True
+
+    except Exception as e:
+        print(f"⚠️  Error checking login status: {e}")
+        # If we can't determine, assume not logged in for safety
+        return False
+
+
+async def prompt_for_login(seconds=30):
+    """Prompt user to login manually with delay"""
+    print("\n" + "="*60)
+    print("🔐 LOGIN REQUIRED")
+    print("="*60)
+    print("You need to log in to CodeMentor to access the mentor data.")
+    print("\n📋 INSTRUCTIONS:")
+    print("1. You'll be redirected to Arc.dev (CodeMentor's login service)")
+    print("2. Click 'Continue with Google' to login with your Google account")
+    print("3. Complete the Google authentication process")
+    print("4. You'll be redirected back to CodeMentor mentor search page")
+    print("5. Wait for the countdown to finish or press ENTER when ready")
+    print("="*60)
+
+    print(f"\n⏰ Waiting {seconds} seconds for you to login...")
+    print("   (You can press ENTER anytime to continue early)")
+
+    # Create a flag to track if user pressed enter
+    user_ready = threading.Event()
+
+    def wait_for_input():
+        try:
+            input()  # Wait for user input
+            user_ready.set()
+        except:
+            pass
+
+    threading.Thread(target=wait_for_input, daemon=True).start()
+
+    # Countdown with visual feedback
+    for i in range(seconds, 0, -1):
+        if user_ready.is_set():
+            print("\n✅ User ready! Proceeding immediately...")
+            break
+
+        # Print countdown every 5 seconds or in the last 10 seconds
+        if i % 5 == 0 or i <= 10:
+            print(f"   ⏳ {i} seconds remaining...")
+
+        await asyncio.sleep(1)
+    else:
+        print("\n⏰ Time's up! Proceeding with scraping...")
+
+    print("✅ Proceeding with scraping...")
+
+
+async def wait_for_codementor_redirect(page, max_wait_time=60):
+    """Wait for redirect back to CodeMentor after login"""
+    print("🔄 Waiting for redirect back to CodeMentor...")
+
+    start_time = time.time()
+    while time.time() - start_time < max_wait_time:
+        current_url = page.url
+        print(f"📍 Current URL: {current_url}")
+
+        # Check if we're back on CodeMentor
+        if "codementor.io" in current_url and "arc.dev" not in current_url:
+            print("✅ Successfully redirected back to CodeMentor!")
+            return True
+
+        # Check if we're still on login page
+        if "arc.dev" in current_url and "login" in current_url:
+            print("⏳ Still on login page, waiting for redirect...")
+
+        await asyncio.sleep(2)  # Check every 2 seconds
+
+    print("⚠️  Timeout waiting for redirect to CodeMentor")
+    return False
+
+
+def parse_mentor_card(card):
+    """Extract name, profile link, title and price from one mentor card"""
+    name_element = card.select_one("a h3.jsx-d63913b6535ac8bc")
+    link_element = card.select_one("a")
+    if not name_element or not link_element or not link_element.has_attr('href'):
+        return None
+
+    title_element = card.select_one("div.jsx-d63913b6535ac8bc.headline.section")
+    price_element = card.select_one("div.jsx-d63913b6535ac8bc.rate")
+
+    return {
+        "Name": name_element.get_text().strip(),
+        "Profile Link": absolute_url(link_element['href'], BASE_URL),
+        "Title": title_element.get_text().strip() if title_element else "N/A",
+        "Price": price_element.get_text().strip() if price_element else "N/A",
+        "Social Links": "N/A"
+    }
+
+
+def parse_social_links(soup):
+    """Social links of a parsed mentor profile page ("N/A" when it has none)"""
+    social_links = [a['href'] for a in soup.select(f"{SOCIAL_LINKS_SELECTOR} a[href]") if a['href']]
+    return ", ".join(social_links) if social_links else "N/A"
+
+
+async def extract_social_links_from_profile(page, profile_url):
+    """Extract social links from a mentor's profile page, loaded in an already open tab"""
+    try:
+        print(f"🔗 Opening profile: {profile_url}")
+        await page.goto(profile_url, wait_until="domcontentloaded", timeout=15000)
+        if not await wait_for_selector_or_settle(page, SOCIAL_LINKS_SELECTOR, quiet_ms=750, timeout_ms=3000,
+                                                 label="profile social links"):
+            print("⚠️  No social-links container found")
+            return "N/A"
+
+        social_links = parse_social_links(parse_html(await page.content()))
+        print(f"✅ Social links: {social_links}")
+        return social_links
+
+    except Exception as e:
+        print(f"❌ Error opening profile {profile_url}: {e}")
+        return "N/A"
+
+
+class CodementorAdapter(SiteAdapter):
+    """CodeMentor mentor search - login through Arc.dev, "Load more" pages, social links per profile"""
+
+    name = "CodeMentor"
+    url = SEARCH_URL
+    domain = "codementor.io"
+    output_filename = "codementor_mentors"
+    ready_marker = "mentor"
+    empty_value = "N/A"
+    card_selectors = [CARD_SELECTOR]
+    detail_delay_range = (0.3, 0.3)
+    # Profiles load in a pool of warm tabs while "Load more" keeps going; each tab waits
+    # for div.social-links or for the page to settle without it
+    detail_workers = 4
+    detail_min_interval = 0.3
+    detail_wait_selector = SOCIAL_LINKS_SELECTOR
+    detail_wait_ms = 3000
+    detail_wait_quiet_ms = 750
+    stream_details = True
+    detail_fields = ["Social Links"]
+    keyboard_stop = True
+    extra_browser_args = [
+        "--disable-web-security",
+        "--disable-features=VizDisplayCompositor",
+        "--disable-background-timer-throttling",
+        "--disable-backgrounding-occluded-windows",
+        "--disable-renderer-backgrounding"
+    ]
+    context_options = {
+        "viewport": {"width": 1920, "height": 1080},
+        "ignore_https_errors": True,
+        "accept_downloads": False
+    }
+    pagination = LoadMore(
+        [
+            "button.ui__sc-1mmo7mk-0.kJekZt",
+            "button[class*='ui__sc-1mmo7mk-0'][class*='kJekZt']",
+            "//button[contains(text(), 'Load more') or contains(text(), 'Show more') or contains(text(), 'More')]"
+        ],
+        wait_ms=3000,
+        max_clicks=100,
+        count_selector=CARD_SELECTOR
+    )
+
+    requires_login = True
+
+    async def after_open(self, page):
+        print("⏳ Waiting for mentor cards to appear...")
+        if await wait_for_selector_or_settle(page, CARD_SELECTOR, quiet_ms=750, timeout_ms=15000,
+                                             label="mentor cards"):
+            print("✅ Mentor cards found on page!")
+        else:
+            print("⚠️  Mentor cards not found, but continuing...")
+
+        # The saved login (browser_state/codementor.io.json) came with the context; the
+        # search page open_site loaded tells whether it is still valid
+        if await read_login_status(page):
+            print("✅ Already logged in! Proceeding with scraping...")
+            return True
+
+        print("\n🔐 Login required detected!")
+        if self.run_headless():
+            print("❌ Saved login has expired. Run `python login.py codementor` to log in again.")
+            return False
+
+        await prompt_for_login()
+        if not await wait_for_codementor_redirect(page):
+            print("❌ Failed to redirect back to CodeMentor. Please try again.")
+            return False
+
+        # Verify login after redirect
+        print("🔍 Verifying login status after redirect...")
+        if not await check_login_status(page, self.url):
+            print("❌ Still not logged in. Please try again or check your credentials.")
+            return False
+
+        print("\n✅ Login successful! The session is saved when the run ends.")
+        return True
+
+    def parse_card(self, card):
+        return parse_mentor_card(card)
+
+    async def enrich(self, page, row):
+        # Only reached with detail_workers=1: profiles one after the other in the main tab
+        return {"Social Links": await extract_social_links_from_profile(page, row["Profile Link"])}
+
+    def detail_url(self, row):
+        profile_link = row.get("Profile Link", "N/A")
+        return profile_link if profile_link.startswith('http') else None
+
+    def parse_detail(self, soup, row):
+        return {"Social Links": parse_social_links(soup)}
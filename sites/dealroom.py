@@ -0,0 +1,149 @@
+import asyncio
+import json
+import os
+
+from engine.adapter import SiteAdapter
+from engine.extract import text_of, texts_of
+from engine.pagination import InfiniteScroll
+
+# Credentials file path
+CREDENTIALS_FILE = "dealroom_credentials.json"
+
+
+def save_credentials(username, password):
+    """Save login credentials to file"""
+    credentials = {
+        "username": username,
+        "password": password
+    }
+    with open(CREDENTIALS_FILE, 'w') as f:
+        json.dump(credentials, f)
+    print(f"✅ Credentials saved to {CREDENTIALS_FILE}")
+
+
+def load_credentials():
+    """Load saved credentials from file"""
+    if os.path.exists(CREDENTIALS_FILE):
+        try:
+            with open(CREDENTIALS_FILE, 'r') as f:
+                credentials = json.load(f)
+            return credentials.get("username"), credentials.get("password")
+        except Exception as e:
+            print(f"⚠️ Error loading credentials: {e}")
+    return None, None
+
+
+async def handle_login(page):
+    """Handle login process for DealRoom"""
+    print("🔐 Checking if login is required...")
+
+    # Check if we're already logged in by looking for user-specific elements
+    try:
+        user_elements = page.locator("//a[contains(@href, 'profile') or contains(@href, 'account') or contains(@href, 'dashboard')]")
+        if await user_elements.count() > 0:
+            print("✅ Already logged in!")
+            return True
+    except:
+        pass
+
+    # Check for login form elements
+    try:
+        login_form = page.locator("form").first
+        if await login_form.is_visible():
+            print("🔐 Login form detected. Attempting to login...")
+
+            # Try to load saved credentials
+            username, password = load_credentials()
+
+            if username and password:
+                print("📁 Using saved credentials...")
+                try:
+                    username_field = page.locator("input[type='email'], input[name='email'], input[name='username'], input[placeholder*='email'], input[placeholder*='Email']").first
+                    password_field = page.locator("input[type='password'], input[name='password']").first
+
+                    if await username_field.is_visible() and await password_field.is_visible():
+                        await username_field.fill(username)
+                        await password_field.fill(password)
+
+                        login_button = page.locator("button[type='submit'], input[type='submit'], button:has-text('Login'), button:has-text('Sign in'), button:has-text('Log in')").first
+                        if await login_button.is_visible():
+                            await login_button.click()
+                            await page.wait_for_timeout(3000)
+
+                            # Check if login was successful
+                            if not await page.locator("form").first.is_visible():
+                                print("✅ Login successful!")
+                                return True
+                            else:
+                                print("❌ Login failed. Please check credentials.")
+                                return False
+                except Exception as e:
+                    print(f"❌ Error during login: {e}")
+                    return False
+            else:
+                print("❌ No saved credentials found. Please login manually in the browser.")
+                print("After logging in, the credentials will be saved for future use.")
+                await asyncio.to_thread(input, "Press Enter after you have logged in manually...")
+
+                # Save credentials after manual login
+                try:
+                    username_input = await asyncio.to_thread(input, "Enter your username/email: ")
+                    password_input = await asyncio.to_thread(input, "Enter your password: ")
+                    save_credentials(username_input, password_input)
+                    return True
+                except KeyboardInterrupt:
+                    print("❌ Login cancelled.")
+                    return False
+    except Exception as e:
+        print(f"Could not detect login form: {e}")
+
+    print("✅ No login required or already logged in.")
+    return True
+
+
+# The fields of parse_funder_card, read in the browser
+FUNDER_FIELDS = {
+    "Name": "div.name a",
+    "Investors": ("div.table-list-column.investors ul li a", "texts"),
+    "Market": ("div.table-list-column.market ul li a", "texts"),
+    "Location": "div.table-list-column.locations span",
+    "Round Valuation": "div.table-list-column.roundValuation",
+    "Last Round": "div.table-list-column._amount div div",
+    "Date": "div.table-list-column.date",
+    "Latest Valuation": "div.table-list-column.valuation"
+}
+
+
+def parse_funder_card(card):
+    """Extract one funder from a div.table-list-item"""
+    return {
+        "Name": text_of(card, "div.name a"),
+        "Investors": texts_of(card, "div.table-list-column.investors ul li a"),
+        "Market": texts_of(card, "div.table-list-column.market ul li a"),
+        "Location": text_of(card, "div.table-list-column.locations span"),
+        "Round Valuation": text_of(card, "div.table-list-column.roundValuation"),
+        "Last Round": text_of(card, "div.table-list-column._amount div div"),
+        "Date": text_of(card, "div.table-list-column.date"),
+        "Latest Valuation": text_of(card, "div.table-list-column.valuation")
+    }
+
+
+class DealroomAdapter(SiteAdapter):
+    """DealRoom Victoria funders - an endlessly scrolling list"""
+
+    name = "DealRoom Victoria"
+    url = "https://dealroom.launchvic.org/transactions/f/all_slug_locations/anyof_~victoria_1~"
+    domain = "dealroom.launchvic.org"
+    requires_login = True
+    output_filename = "dealroom_victoria_funders"
+    card_selectors = ["div.table-list-item"]
+    incremental = True
+    js_fields = FUNDER_FIELDS
+    ready_marker = "table-list-item"
+    pagination = InfiniteScroll(key="PageDown", wait_ms=3000, max_scrolls=5000, count_selector="div.table-list-item")
+
+    async def after_open(self, page):
+        return await handle_login(page)
+
+    def parse_card(self, card):
+        return parse_funder_card(card)
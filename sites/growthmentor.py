@@ -0,0 +1,105 @@
+from engine.adapter import SiteAdapter
+from engine.pagination import LoadMore
+
+CARD_SELECTOR = "div.tw-rounded-2xl.tw-bg-white.tw-shadow-sm.dark\\:tw-bg-neutral-800.tw-p-5"
+NAME_SELECTOR = "h2.tw-text-2xl.tw-font-bold"
+PROFILE_LINK_SELECTOR = "a.tw-order-2"
+TITLE_SELECTOR = "div.tw-text-neutral-600"
+FEATURE_GROUPS = ["Expertise", "Tools", "Industry"]
+
+# The fields of parse_mentor_card, read in the browser
+MENTOR_FIELDS = {
+    "Name": f"{PROFILE_LINK_SELECTOR}[href] {NAME_SELECTOR}",
+    "Profile Link": (PROFILE_LINK_SELECTOR, "@href"),
+    "Title": TITLE_SELECTOR,
+    **{group: (f"div[data-title='{group}'] span", "texts") for group in FEATURE_GROUPS}
+}
+
+
+def parse_mentor_card(card):
+    """Extract name, profile link, title and feature groups from one mentor card"""
+    profile_link_element = card.select_one(PROFILE_LINK_SELECTOR)
+    if profile_link_element and profile_link_element.has_attr('href'):
+        profile_link = profile_link_element['href']
+        name_element = profile_link_element.select_one(NAME_SELECTOR)
+        name = name_element.text.strip() if name_element else "N/A"
+    else:
+        profile_link = "N/A"
+        name = "N/A"
+
+    title_element = card.select_one(TITLE_SELECTOR)
+    title = title_element.text.strip() if title_element else "N/A"
+
+    features_dict = {}
+    for group in card.select("div[data-title]"):
+        spans = group.select("span")
+        if spans:
+            features_dict[group['data-title']] = ", ".join(span.text.strip() for span in spans)
+
+    return {
+        "Name": name,
+        "Profile Link": profile_link,
+        "Title": title,
+        "Expertise": features_dict.get("Expertise", "N/A"),
+        "Tools": features_dict.get("Tools", "N/A"),
+        "Industry": features_dict.get("Industry", "N/A")
+    }
+
+
+class GrowthMentorAdapter(SiteAdapter):
+    """GrowthMentor search - everything is on the cards, more cards behind "Load more"
+
+    Each click's new cards are read in one call inside the page; whether the click brought
+    anyone new is answered by the run's key index rather than by counting cards again.
+    """
+
+    name = "GrowthMentor"
+    url = "https://app.growthmentor.com/search"
+    domain = "growthmentor.com"
+    requires_login = True
+    output_filename = "growthmentor_mentors"
+    ready_marker = "mentor"
+    empty_value = "N/A"
+    card_selectors = [CARD_SELECTOR]
+    incremental = True
+    js_fields = MENTOR_FIELDS
+    wait_until = "networkidle"
+    keyboard_stop = True
+    pagination = LoadMore(
+        [
+            "button.tw-inline-flex.tw-cursor-pointer.tw-select-none.tw-items-center.tw-justify-center.tw-font-medium.tw-outline-none.tw-transition-all.tw-px-4.tw-py-2.tw-text-sm.tw-rounded-full",
+            "button[class*='tw-inline-flex'][class*='tw-cursor-pointer']",
+            "//button[contains(@class, 'tw-inline-flex') and contains(@class, 'tw-cursor-pointer') and contains(@class, 'tw-rounded-full')]",
+            "//button[contains(text(), 'Load more') or contains(text(), 'Show more') or contains(text(), 'More')]",
+            "div.tw-mt-8.tw-text-center > button"
+        ],
+        wait_ms=5000,
+        max_clicks=100,
+        count_selector=CARD_SELECTOR,
+        scroll_into_view=True,
+        count_rows=True
+    )
+
+    async def after_open(self, page):
+        # Check if we need to login
+        try:
+            login_elements = page.locator("//a[contains(text(), 'Login') or contains(text(), 'Sign in')]")
+            if await login_elements.count() > 0:
+                print("⚠️  Login required! Please log in to GrowthMentor in your Chrome browser first.")
+                print("After logging in, close Chrome completely and run this script again.")
+                return False
+            print("✅ Already logged in or no login required!")
+        except Exception as e:
+            print(f"Could not check login status: {e}")
+        return True
+
+    def parse_card(self, card):
+        row = parse_mentor_card(card)
+        if row["Name"] == "N/A":
+            return None
+        return row
+
+    def finish_row(self, row):
+        if row["Name"] == "N/A":
+            return None
+        return row
@@ -0,0 +1,328 @@
+import sys
+
+from engine.adapter import SiteAdapter
+from engine.extract import absolute_url
+from engine.waits import wait_for_count_growth, wait_for_selector_or_settle, wait_for_selector_state
+
+BASE_URL = "https://mentorship.lfx.linuxfoundation.org"
+CARD_SELECTOR = "div.card-align"
+NAME_SELECTOR = "a.card-title span"
+PROFILE_LINK_SELECTORS = ["a.card-title[href]", "a[href*='mentor/']"]
+SOCIAL_LINK_SELECTOR = "div.project-repo.w-100 a"
+SKILL_SELECTOR = "ul.tag-list.skill-list li"
+PROFILE_BUTTON_SELECTORS = [
+    "div.footer-btn.center-btn-text.mt-3",
+    "div.footer-btn",
+    "button[class*='footer']",
+    "a[class*='profile']"
+]
+NEW_TAB_MODIFIER = "Meta" if sys.platform == "darwin" else "Control"  # click modifier opening a link in a new tab
+EMPTY_PROFILE = {"profile_url": "N/A", "social_links": "N/A", "user_features": "N/A"}
+PROJECT_KEYWORDS = ["CNCF", "Open Mainframe Project", "Hyperledger", "FINOS", "Term", "Mentorship", ":", "project", "Project"]
+
+
+def separate_projects_and_mentees(project_data):
+    """Separate project names from mentee names in the project data"""
+    if not project_data or project_data == "N/A":
+        return {"projects": "N/A", "mentees": "N/A"}
+
+    items = [item.strip() for item in project_data.split(",")]
+    projects = []
+    mentees = []
+
+    for item in items:
+        # Check if it's a project (contains organization names or long descriptions)
+        if any(keyword in item for keyword in PROJECT_KEYWORDS):
+            projects.append(item)
+        # Check if it's a mentee name (short, usually 1-3 words, no special characters)
+        elif len(item.split()) <= 3 and not any(char in item for char in [":", "-", "(", ")", "Term", "project", "Project"]):
+            mentees.append(item)
+        else:
+            # If uncertain, treat as project
+            projects.append(item)
+
+    return {
+        "projects": ", ".join(projects) if projects else "N/A",
+        "mentees": ", ".join(mentees) if mentees else "N/A"
+    }
+
+
+def profile_link_of(card):
+    """Profile URL a BeautifulSoup mentor card links to, or "N/A" """
+    for selector in PROFILE_LINK_SELECTORS:
+        link = card.select_one(selector)
+        if link and link['href'].strip() and not link['href'].startswith(('#', 'javascript')):
+            return absolute_url(link['href'].strip(), BASE_URL)
+    return "N/A"
+
+
+def parse_profile(soup):
+    """Social links and skills of a parsed mentor profile page"""
+    social_links = [a['href'] for a in soup.select(f"{SOCIAL_LINK_SELECTOR}[href]") if a['href']]
+    skills = [li.text.strip() for li in soup.select(SKILL_SELECTOR) if li.text.strip()]
+    return {
+        "Social Links": ", ".join(social_links) if social_links else "N/A",
+        "User Features": ", ".join(skills) if skills else "N/A"
+    }
+
+
+async def extract_detailed_profile_info_from_tab(profile_page, mentor_name):
+    """Extract detailed information from an opened mentor profile page"""
+    try:
+        print(f"🔗 Extracting detailed info for: {mentor_name}")
+        await wait_for_selector_or_settle(profile_page, f"{SOCIAL_LINK_SELECTOR}, {SKILL_SELECTOR}",
+                                          quiet_ms=750, timeout_ms=5000, label="profile ready")
+
+        # Get the current URL as the profile link
+        current_url = profile_page.url
+        print(f"📍 Profile URL: {current_url}")
+
+        # Extract social links from div.project-repo.w-100
+        social_links = []
+        try:
+            for element in await profile_page.locator(SOCIAL_LINK_SELECTOR).all():
+                href = await element.get_attribute("href")
+                if href:
+                    social_links.append(href)
+            print(f"✅ Found {len(social_links)} social links")
+        except Exception as e:
+            print(f"⚠️  Error extracting social links: {e}")
+
+        # Extract skills from ul.tag-list.skill-list
+        detailed_skills = []
+        try:
+            for element in await profile_page.locator(SKILL_SELECTOR).all():
+                skill_text = (await element.text_content()).strip()
+                if skill_text:
+                    detailed_skills.append(skill_text)
+            print(f"✅ Found {len(detailed_skills)} detailed skills")
+        except Exception as e:
+            print(f"⚠️  Error extracting detailed skills: {e}")
+
+        return {
+            "profile_url": current_url,
+            "social_links": ", ".join(social_links) if social_links else "N/A",
+            "user_features": ", ".join(detailed_skills) if detailed_skills else "N/A"
+        }
+
+    except Exception as e:
+        print(f"❌ Error extracting detailed profile info: {e}")
+        return dict(EMPTY_PROFILE)
+
+
+async def profile_url_of(page, mentor_card, name):
+    """Profile URL behind a card's "View Profile" button, or "N/A"
+
+    Only used for cards that do not link to their profile (see LinuxFoundationAdapter). The
+    button is clicked with the new-tab modifier, so the list tab stays put: the new tab only
+    lives until its URL is known and the profile is then read by the tab pool.
+    """
+    try:
+        profile_button = None
+        for selector in PROFILE_BUTTON_SELECTORS:
+            try:
+                button = mentor_card.locator(selector).first
+                if await button.is_visible():
+                    profile_button = button
+                    break
+            except:
+                continue
+
+        if not profile_button:
+            print(f"⚠️  Profile button not found or not visible for {name}")
+            return "N/A"
+
+        print(f"🖱️  Opening the profile of {name} in a new tab")
+        try:
+            async with page.expect_popup(timeout=5000) as popup_info:
+                await profile_button.click(modifiers=[NEW_TAB_MODIFIER])
+            popup = await popup_info.value
+        except Exception:
+            if "mentor/" not in page.url:
+                print(f"⚠️  No profile tab opened for {name}")
+                return "N/A"
+            # The app ignored the modifier and navigated the list tab itself
+            profile_url = page.url
+            print(f"⚠️  The profile of {name} opened in the list tab - going back")
+            await page.go_back()
+            await wait_for_selector_state(page, CARD_SELECTOR, "attached", 10000, label="mentor list back")
+            return profile_url
+
+        try:
+            await popup.wait_for_url(lambda url: "mentor/" in url, timeout=10000)
+            return popup.url
+        except Exception:
+            print(f"⚠️  The new tab of {name} did not reach a profile ({popup.url})")
+            return "N/A"
+        finally:
+            await popup.close()
+
+    except Exception as e:
+        print(f"❌ Error opening the profile of {name}: {e}")
+        return "N/A"
+
+
+async def scroll_to_load_more_mentors(page):
+    """Scroll in steps to trigger lazy loading of more mentor cards"""
+    try:
+        print("📜 Scrolling to load more mentors...")
+        current_mentors = await page.locator(CARD_SELECTOR).count()
+        print(f"📊 Current mentors on page: {current_mentors}")
+
+        page_height = await page.evaluate("document.body.scrollHeight")
+        for scroll_step in [0.7, 0.85, 1.0]:
+            await page.evaluate(f"window.scrollTo(0, {int(page_height * scroll_step)})")
+            await wait_for_count_growth(page, CARD_SELECTOR, current_mentors, 800, label="mentor scroll")
+
+            new_mentors = await page.locator(CARD_SELECTOR).count()
+            if new_mentors > current_mentors:
+                print(f"✅ Loaded {new_mentors - current_mentors} new mentors!")
+                return True
+
+        print("⚠️  No new mentors loaded - may have reached the end")
+        return False
+
+    except Exception as e:
+        print(f"❌ Error scrolling to load more mentors: {e}")
+        return False
+
+
+async def aggressive_scroll_to_load_mentors(page):
+    """Fallback - scroll twice to the very bottom of the page"""
+    try:
+        print("🚀 AGGRESSIVE SCROLL: Scrolling 2 times to 100% of page...")
+        start_mentors = await page.locator(CARD_SELECTOR).count()
+
+        for i in range(2):
+            print(f"📜 Aggressive scroll {i+1}/2...")
+            try:
+                await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+                await wait_for_count_growth(page, CARD_SELECTOR, start_mentors, 1000, label="aggressive mentor scroll")
+            except Exception as scroll_error:
+                print(f"⚠️  Error during scroll {i+1}: {scroll_error}")
+
+        total_new_mentors = await page.locator(CARD_SELECTOR).count() - start_mentors
+        if total_new_mentors > 0:
+            print(f"🎉 AGGRESSIVE SCROLL SUCCESS: Loaded {total_new_mentors} new mentors!")
+            return True
+
+        print("⚠️  Aggressive scroll completed - no new mentors found")
+        return False
+
+    except Exception as e:
+        print(f"❌ Error during aggressive scroll: {e}")
+        return False
+
+
+class MentorScroll:
+    """Stepwise scrolling with an aggressive fallback (LFX mentorship)"""
+
+    def __init__(self, max_scrolls=50):
+        self.max_scrolls = max_scrolls
+
+    async def steps(self, page, run):
+        yield 0
+
+        scroll_count = 0
+        while scroll_count < self.max_scrolls and not run.stop_requested:
+            if not await scroll_to_load_more_mentors(page):
+                print("📜 Regular scroll failed, trying aggressive scroll...")
+                if not await aggressive_scroll_to_load_mentors(page):
+                    print("📜 No more mentors to load. Reached the end of the list.")
+                    return
+
+            scroll_count += 1
+            yield scroll_count
+
+        if scroll_count >= self.max_scrolls:
+            print(f"Maximum scroll limit reached ({self.max_scrolls}). Stopping to prevent infinite loop.")
+
+
+class LinuxFoundationAdapter(SiteAdapter):
+    """LFX Mentorship - lazy-loaded mentor cards, profiles read in background tabs
+
+    Profile URLs are taken from the cards as they load and fetched by a pool of tabs while
+    the list keeps scrolling, so the list page never navigates away. Cards without a link
+    have their "View Profile" button opened in a new tab to learn the URL.
+    """
+
+    name = "Linux Foundation Mentorship"
+    url = "https://mentorship.lfx.linuxfoundation.org/#mentors"
+    domain = "mentorship.lfx.linuxfoundation.org"
+    output_filename = "linuxfoundation_mentors"
+    card_selectors = [CARD_SELECTOR]
+    incremental = True
+    ready_marker = "mentor"
+    empty_value = "N/A"
+    keyboard_stop = True
+    headless = True
+    extra_browser_args = [
+        "--disable-web-security",
+        "--disable-features=VizDisplayCompositor",
+        "--disable-background-timer-throttling",
+        "--disable-backgrounding-occluded-windows",
+        "--disable-renderer-backgrounding"
+    ]
+    context_options = {
+        "viewport": {"width": 1920, "height": 1080},
+        "ignore_https_errors": True,
+        "accept_downloads": False
+    }
+    pagination = MentorScroll(max_scrolls=50)
+    detail_workers = 4
+    detail_wait_selector = f"{SOCIAL_LINK_SELECTOR}, {SKILL_SELECTOR}"
+    detail_settle_ms = 500
+    stream_details = True
+    detail_fields = ["Social Links", "User Features"]
+
+    async def after_open(self, page):
+        print("⏳ Waiting for mentor cards to appear...")
+        try:
+            await page.wait_for_selector(CARD_SELECTOR, timeout=15000)
+            print("✅ Mentor cards found on page!")
+        except:
+            print("⚠️  Mentor cards not found, but continuing...")
+            await page.wait_for_timeout(3000)
+        return True
+
+    def parse_card(self, card):
+        """Card fields of a BeautifulSoup mentor card, with the profile URL it links to"""
+        name_element = card.select_one(NAME_SELECTOR)
+        if not name_element or not name_element.text.strip():
+            return None
+        projects = [img.get('title') for img in card.select("div.icons-container img[title]") if img.get('title')]
+        separated_data = separate_projects_and_mentees(", ".join(projects) if projects else "N/A")
+        return {
+            "Name": name_element.text.strip(),
+            "Profile Link": profile_link_of(card),
+            "Projects": separated_data["projects"],
+            "Mentees": separated_data["mentees"],
+            "Social Links": "N/A",
+            "User Features": "N/A"
+        }
+
+    async def extract_rows(self, page, soup, run):
+        async for row in super().extract_rows(page, soup, run):
+            name = row["Name"]
+            if (row["Profile Link"] == "N/A" and self.visit_profiles
+                    and name not in run.seen_keys and not run.is_existing(name)):
+                # No link on the card - ask its button where the profile is
+                mentor_card = page.locator(CARD_SELECTOR).filter(has=page.locator(NAME_SELECTOR, has_text=name)).first
+                row["Profile Link"] = await profile_url_of(page, mentor_card, name)
+            yield row
+
+    async def enrich(self, page, row):
+        # Only reached with detail_workers=1: profiles one after the other once the list is done
+        profile_link = self.detail_url(row)
+        if profile_link is None:
+            return {}
+        await page.goto(profile_link, wait_until="domcontentloaded")
+        info = await extract_detailed_profile_info_from_tab(page, row["Name"])
+        return {"Social Links": info["social_links"], "User Features": info["user_features"]}
+
+    def detail_url(self, row):
+        profile_link = row.get("Profile Link", "N/A")
+        return profile_link if profile_link.startswith('http') else None
+
+    def parse_detail(self, soup, row):
+        return parse_profile(soup)
@@ -0,0 +1,329 @@
+from engine.adapter import SiteAdapter
+from engine.extract import parse_html
+from engine.keys import RecordIndex
+from engine.pagination import NextButton, SinglePage
+from engine.replay import ApiReplayer, capture_page_request, html_from_payload
+from engine.waits import wait_for_dom_settle
+
+# OpenVC investor lists (url, output filename, max investors)
+INVESTOR_LISTS = {
+    "pre-seed": ("https://www.openvc.app/investor-lists/pre-seed-investors", "openvc_pre_seed_investors", 2266),
+    "seed": ("https://www.openvc.app/investor-lists/seed-investors", "openvc_seed_investors", 3512),
+    "series-a": ("https://www.openvc.app/investor-lists/series-a-investors", "openvc_seriesA_investors", 1746),
+    "series-b": ("https://www.openvc.app/investor-lists/series-b-investors", "openvc_series_b_investors", 832),
+}
+
+
+
+class OpenVCIndex:
+    """Investors seen by any list of a multi-list run, keyed on name
+
+    An investor that appears in several lists is parsed once; each list it shows up in
+    is added to its "lists" field.
+    """
+
+    def __init__(self):
+        self.rows = RecordIndex()  # name -> row shared by every list
+
+    def add(self, card, stage):
+        """Row for an investor card, tagged with stage (a copy, safe to save as is)"""
+        name = parse_name(card)
+        if name == "-":
+            return parse_investor_row(card)
+        row = self.rows.get(name)
+        if row is None:
+            row = parse_investor_row(card)
+            row["lists"] = []
+            self.rows.add(name, row)
+        if stage and stage not in row["lists"]:
+            row["lists"].append(stage)
+        return dict(row, lists=", ".join(row["lists"]))
+
+    def merged_rows(self):
+        """Every investor once, with all the lists it was seen in"""
+        return [dict(row, lists=", ".join(row["lists"])) for row in self.rows.values()]
+
+
+NEXT_SELECTOR = "nav#pagination ul.justify-content-center.pagination li.page-item a#pageNext"
+RESULTS_SELECTOR = "table#results_tb tbody"
+
+
+def parse_name(row):
+    """Extract name from td.nameCell"""
+    name = "-"
+    name_cell = row.select_one("td.nameCell")
+    if not name_cell:
+        return name
+
+    # Get text from a tag first (this is usually the clean name)
+    a_tag = name_cell.select_one("a")
+    if a_tag:
+        name = a_tag.get_text(strip=True)
+    else:
+        # Fallback to divs if no a tag
+        name_parts = []
+        for div in name_cell.select("div"):
+            div_text = div.get_text(strip=True)
+            if div_text and div_text not in name_parts:
+                name_parts.append(div_text)
+        name = " ".join(name_parts) if name_parts else name_cell.get_text(strip=True)
+
+    # Clean up the name - remove duplicate "VC firm" patterns
+    if name and "VC firm" in name:
+        # Split by "VC firm" and take the first part, then add "VC firm" once
+        parts = name.split("VC firm")
+        if len(parts) > 1:
+            clean_name = parts[0].strip()
+            name = f"{clean_name} VC firm" if clean_name else "VC firm"
+
+    return name
+
+
+def parse_location(row):
+    """Extract location from td.text-nowrap (country links)"""
+    location_cell = row.select_one("td.text-nowrap")
+    if not location_cell:
+        return "-"
+    countries = []
+    for link in location_cell.select("a[href*='country/']"):
+        href = link.get('href', '')
+        if 'country/' in href:
+            countries.append(href.split('country/')[-1])
+    return ", ".join(countries) if countries else "-"
+
+
+def parse_stages(row):
+    """Extract stages - try multiple selectors to find the right cell"""
+    stages = "-"
+    stages_cell = None
+    selectors = [
+        "td.d-none.d-lg-table-cell.text-nowrap",
+        "td[data-label*='stage']",
+        "td[data-label*='Stage']",
+        "td.text-nowrap"
+    ]
+    for selector in selectors:
+        stages_cell = row.select_one(selector)
+        if stages_cell:
+            break
+
+    if not stages_cell:
+        return stages
+
+    # Try to get all text content from the cell first
+    cell_text = stages_cell.get_text(strip=True)
+    if cell_text and cell_text not in ["-", ""]:
+        # Clean up the stages text by adding proper spacing
+        stages = cell_text
+        # Add spaces before numbers and after periods
+        for number in "123456":
+            stages = stages.replace(f"{number}.", f" {number}.")
+        # Add spaces before + signs
+        stages = stages.replace("+", " +")
+        # Clean up multiple spaces
+        stages = " ".join(stages.split())
+        # Add commas between different stage items
+        for number in "123456":
+            stages = stages.replace(f" {number}.", f", {number}.")
+        # Remove leading comma if present
+        if stages.startswith(", "):
+            stages = stages[2:]
+    else:
+        # Fallback to extracting from links and spans
+        stage_texts = []
+        for link in stages_cell.select("a"):
+            span = link.select_one("span")
+            stage_texts.append((span or link).get_text(strip=True))
+        if stage_texts:
+            stages = ", ".join(stage_texts)
+
+    return stages
+
+
+def parse_investor_row(row):
+    """Extract one investor from a tr of table#results_tb"""
+    # Extract check size from td[data-label="Check size"]
+    check_size = "-"
+    check_size_cell = row.select_one('td[data-label="Check size"]')
+    if check_size_cell:
+        check_size = check_size_cell.get_text(strip=True)
+
+    # Extract investment title from td.criteriaCell
+    investment_title = "-"
+    criteria_cell = row.select_one("td.criteriaCell")
+    if criteria_cell:
+        investment_title = criteria_cell.get_text(strip=True)
+
+    # Extract open rate from td.cursor-pointer.text-nowrap
+    open_rate = "-"
+    open_rate_cell = row.select_one("td.cursor-pointer.text-nowrap")
+    if open_rate_cell:
+        span = open_rate_cell.select_one("span")
+        open_rate = (span or open_rate_cell).get_text(strip=True)
+
+    return {
+        "name": parse_name(row),
+        "location": parse_location(row),
+        "check_size": check_size,
+        "stages": parse_stages(row),
+        "investment_title": investment_title,
+        "open_rate": open_rate
+    }
+
+
+class OpenVCAdapter(SiteAdapter):
+    """OpenVC investor lists (public, numbered pages)"""
+
+    name = "OpenVC"
+    url, output_filename, max_items = INVESTOR_LISTS["seed"]
+    domain = "openvc.app"
+    card_selectors = ["table#results_tb tbody tr"]
+    ready_marker = "results_tb"
+    key_field = "name"
+    open_wait_ms = 8000
+    html_parser = "lxml"
+    pagination = NextButton(NEXT_SELECTOR, content_selector=RESULTS_SELECTOR)
+
+    # --- API replay ---
+    replay_api = False  # fetch pages 2..N from the request behind "next" instead of clicking
+    replay_workers = 4  # pages fetched at once
+    replay_min_interval = 0.5  # min seconds between two page requests
+
+    # --- Multi-list runs ---
+    stage = None  # list name written to the "lists" field
+    index = None  # OpenVCIndex shared by the lists of one run
+
+    def __init__(self, **overrides):
+        super().__init__(**overrides)
+        if self.replay_api and "pagination" not in overrides:
+            # The browser only renders page 1; extract_rows fetches the rest
+            self.pagination = SinglePage()
+
+    def parse_card(self, card):
+        if self.index is not None:
+            return self.index.add(card, self.stage)
+        return parse_investor_row(card)
+
+    def is_empty(self, row):
+        return all(value == self.empty_value for field, value in row.items() if field != "lists")
+
+    def parse_payload(self, text, content_type=""):
+        """Investors in a raw page response (HTML page, HTML fragment or JSON wrapping HTML)"""
+        html = html_from_payload(text, content_type)
+        cards = self.select_cards(self.parse_page(html))
+        if not cards:
+            # A bare fragment of rows has no table#results_tb around it
+            cards = parse_html(html, self.html_parser).select("tr")
+        rows = []
+        for card in cards:
+            row = self.parse_card(card)
+            if not self.is_empty(row):
+                rows.append(row)
+        return rows
+
+    async def next_page(self, page):
+        """Click "next" and wait for the results table to be replaced"""
+        await page.locator(NEXT_SELECTOR).click()
+        await wait_for_dom_settle(page, RESULTS_SELECTOR, timeout_ms=5000, label="next page rows")
+
+    async def extract_rows(self, page, soup, run):
+        first_page = [row async for row in super().extract_rows(page, soup, run)]
+        for row in first_page:
+            yield row
+        if not self.replay_api or run.stop_requested:
+            return
+
+        print("📡 Capturing the request behind the next page...")
+        template = None
+        shown = [1]  # page the table shows once the capture is over
+
+        async def show_page_2():
+            await self.next_page(page)
+            shown[0] = 2
+
+        try:
+            template = await capture_page_request(
+                page, show_page_2, self.parse_payload, page_number=2, page_size=len(first_page)
+            )
+        except Exception as e:
+            print(f"⚠️ Could not load page 2: {e}")
+
+        if template is None:
+            # Keep going in the browser from wherever the table is now
+            print("⚠️ No replayable page request found - clicking through the pages instead")
+            async for row in self.click_through(page, run, shown[0]):
+                yield row
+            return
+
+        replayer = ApiReplayer(
+            page.context,
+            template,
+            self.parse_payload,
+            workers=self.replay_workers,
+            min_interval=self.replay_min_interval,
+            timeout_ms=self.timeout,
+        )
+        # A restarted crawl fetches straight from the page after the last completed one
+        resume_from = run.resume_position("api_page")
+        first_page = resume_from + 1 if resume_from else 2
+        if resume_from:
+            print(f"⏩ Resuming at page {first_page}")
+        async for page_num, rows in replayer.pages(first_page, should_stop=lambda: run.stop_requested):
+            print(f"📄 Page {page_num}: {len(rows)} investors")
+            for row in rows:
+                yield row
+            run.writer.checkpoint()
+            run.save_cursor("api_page", page_num)
+        for page_num in replayer.failed_pages:
+            # The rest of the list was never read - keep the cursor for the next run
+            run.page_failed(page_num)
+
+
+    async def click_through(self, page, run, on_page):
+        """Rows of the pages from on_page (the page the table shows) on, clicking "next"
+
+        Each page is checkpointed like a collect_rows step, so a restarted crawl clicks past
+        the pages already done.
+        """
+        pagination = NextButton(NEXT_SELECTOR, content_selector=RESULTS_SELECTOR)
+        resume_from = run.resume_position(pagination.cursor_kind)
+        skip = resume_from - on_page + 1 if resume_from and resume_from >= on_page else None
+        async for step in pagination.steps(page, run, skip):
+            page_num = step + on_page - 1
+            async for row in super().extract_rows(page, self.parse_page(await page.content()), run):
+                yield row
+            run.writer.checkpoint()
+            run.save_cursor(pagination.cursor_kind, page_num)
+
+
+def openvc_adapter(stage, **overrides):
+    """Adapter for one of the INVESTOR_LISTS stages"""
+    url, output_filename, max_items = INVESTOR_LISTS[stage]
+    settings = {"url": url, "output_filename": output_filename, "max_items": max_items}
+    settings.update(overrides)
+    return OpenVCAdapter(**settings)
+
+
+def stage_of(url):
+    """List name of an investor-list URL (".../investor-lists/seed-investors" -> "seed")"""
+    slug = url.rstrip("/").split("/")[-1]
+    return slug[:-len("-investors")] if slug.endswith("-investors") else slug
+
+
+def multi_list_adapters(urls, index, **overrides):
+    """One adapter per investor-list URL, all sharing index
+
+    Known lists keep their INVESTOR_LISTS output file and limit; other URLs get
+    openvc_<stage>_investors and no limit.
+    """
+    adapters = []
+    for url in urls:
+        stage = stage_of(url)
+        if stage in INVESTOR_LISTS and INVESTOR_LISTS[stage][0] == url:
+            settings = {"output_filename": INVESTOR_LISTS[stage][1], "max_items": INVESTOR_LISTS[stage][2]}
+        else:
+            settings = {"output_filename": f"openvc_{stage.replace('-', '_')}_investors", "max_items": 0}
+        settings.update({"name": f"OpenVC {stage}", "url": url, "stage": stage, "index": index})
+        settings.update(overrides)
+        adapters.append(OpenVCAdapter(**settings))
+    return adapters
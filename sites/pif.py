@@ -0,0 +1,166 @@
+from engine.adapter import SiteAdapter
+from engine.extract import absolute_url, parse_html
+from engine.pagination import HashOffset, scroll_until_stable
+
+BASE_URL = "https://www.pif.gov.sa"
+EMPTY_PROFILE = {"Website": "N/A", "Social Links": "N/A"}
+
+
+def find_investor_cards(soup):
+    """Return the investor li elements, falling back to grid containers / headed divs"""
+    li_elements = soup.select("ul.search-result-list li")
+    if li_elements:
+        return li_elements
+
+    # Fallback: look for grid-container elements
+    investor_cards = soup.select("div.grid-container")
+    if investor_cards:
+        return investor_cards
+
+    # If still no cards, look for divs that have h4 or h5 tags (name/title indicators)
+    return [div for div in soup.select("div") if div.select_one("h4") or div.select_one("h5")]
+
+
+def parse_investor_card(card):
+    """Extract name, title and profile link from one portfolio card"""
+    # Profile link (first href in the card)
+    profile_link = "N/A"
+    first_link = card.select_one("a")
+    if first_link and first_link.has_attr('href'):
+        profile_link = absolute_url(first_link['href'], BASE_URL)
+
+    # Title (h5 from div.text-wrapper-investment-type)
+    title = "N/A"
+    title_element = card.select_one("div.text-wrapper-investment-type h5") or card.select_one("h5")
+    if title_element:
+        title = title_element.text.strip()
+
+    # Name (h4 from div.text-wrapper)
+    name = "N/A"
+    name_element = card.select_one("div.text-wrapper h4") or card.select_one("h4")
+    if name_element:
+        name = name_element.text.strip()
+
+    return {
+        "Name": name,
+        "Title": title,
+        "Profile Link": profile_link,
+        "Website": "N/A",
+        "Social Links": "N/A"
+    }
+
+
+def parse_profile(soup):
+    """Extract website and social media links from a parsed profile page"""
+    website = "N/A"
+    website_element = soup.select_one("div.company-wrapper div.field-website a.primary-btn")
+    if website_element and website_element.has_attr('href'):
+        website = absolute_url(website_element['href'], BASE_URL)
+
+    social_links = []
+    social_elements = soup.select("div.social-wrapper div.social-media-list a")
+    skip_website = False
+    if not social_elements:
+        # Alternative block also contains the website link - filter it out
+        social_elements = soup.select("div.social-media-block a")
+        skip_website = True
+
+    for social_element in social_elements:
+        if not social_element.has_attr('href'):
+            continue
+        href = social_element['href']
+        if skip_website and href == website:
+            continue
+        social_links.append(absolute_url(href, BASE_URL))
+
+    return {
+        "Website": website,
+        "Social Links": "; ".join(social_links) if social_links else "N/A"
+    }
+
+
+async def extract_profile_data(page, profile_url):
+    """Extract website and social media links from investor profile page"""
+    try:
+        print(f"🔍 Extracting profile data from: {profile_url}")
+        await page.goto(profile_url, wait_until="domcontentloaded", timeout=30000)
+        await page.wait_for_load_state("domcontentloaded", timeout=15000)
+
+        profile = parse_profile(parse_html(await page.content()))
+        print(f"✅ Website: {profile['Website']}")
+        return profile
+
+    except Exception as e:
+        print(f"❌ Error extracting profile data from {profile_url}: {e}")
+        return dict(EMPTY_PROFILE)
+
+
+def pif_pagination(workers=1):
+    """The portfolio's hash-offset pages, loaded by `workers` tabs at once"""
+    return HashOffset(
+        "ourportfolio_e={offset}",
+        page_size=18,
+        start_page=1,
+        end_page=7,
+        wait_ms=5000,
+        wait_selector="ul.search-result-list li",
+        content_selector="ul.search-result-list",
+        workers=workers
+    )
+
+
+class PIFAdapter(SiteAdapter):
+    """PIF portfolio - 18 companies per page addressed through the URL hash"""
+
+    name = "PIF Portfolio"
+    url = "https://www.pif.gov.sa/en/our-investments/our-portfolio/"
+    domain = "pif.gov.sa"
+    output_filename = "pif_investors"
+    ready_marker = "portfolio"
+    empty_value = "N/A"
+    open_wait_ms = 3000
+    detail_delay_range = (1, 1)
+    keyboard_stop = True
+    persistent = False
+    timeout = 30000
+    pagination = pif_pagination()
+    detail_min_interval = 0.5
+    detail_fields = list(EMPTY_PROFILE)
+
+    # --- Parallel crawl ---
+    workers = 4  # tabs loading list pages and then profiles at once (1 = one after the other)
+
+    def __init__(self, **overrides):
+        super().__init__(**overrides)
+        if "pagination" not in overrides:
+            self.pagination = pif_pagination(self.workers)
+        if "detail_workers" not in overrides:
+            self.detail_workers = self.workers
+
+    async def after_open(self, page):
+        # The first page lazy-loads while scrolling
+        await scroll_until_stable(page, max_attempts=15, wait_ms=2000)
+        return True
+
+    def select_cards(self, soup):
+        return find_investor_cards(soup)
+
+    def parse_card(self, card):
+        row = parse_investor_card(card)
+        # Skip if no meaningful data found
+        if row["Name"] == "N/A" and row["Title"] == "N/A" and row["Profile Link"] == "N/A":
+            return None
+        return row
+
+    async def enrich(self, page, row):
+        profile_link = row.get("Profile Link", "N/A")
+        if profile_link == "N/A" or not profile_link.startswith('http'):
+            return {}
+        return await extract_profile_data(page, profile_link)
+
+    def detail_url(self, row):
+        profile_link = row.get("Profile Link", "N/A")
+        return profile_link if profile_link.startswith('http') else None
+
+    def parse_detail(self, soup, row):
+        return parse_profile(soup)
@@ -0,0 +1,185 @@
+from engine.adapter import SiteAdapter
+from engine.extract import parse_html
+from engine.pagination import PageParam, scroll_until_stable
+
+CARD_SELECTORS = [
+    "a.mentor-card",  # Direct mentor card links - this is what we want
+    "a[href*='/mentors/']",  # mentor profile links
+    "div:has(h2)",  # divs with mentor names
+    "div:has(p.strapline_small)",  # divs with locations
+    "div[class*='mentor']"
+]
+
+PORTFOLIO_SELECTORS = [
+    "div.mentor-skills ul.list-bullets a.link-mentor-portfolio",
+    "div.mentor-skills a.link-mentor-portfolio",
+    "div.mentor-skills a[href*='portfolio']",
+    "div.mentor-skills a[href*='behance']",
+    "div.mentor-skills a[href*='dribbble']",
+    "div.mentor-skills a[href*='github']",
+    "div.mentor-skills a[href*='linkedin']",
+    "a.link-mentor-portfolio",
+    "a[href*='portfolio']"
+]
+
+
+def is_mentor_card(card):
+    """Filter out elements that don't look like mentor cards"""
+    # Skip body, html, and other top-level elements
+    if card.name in ['body', 'html', 'head']:
+        return False
+
+    # Skip if it's a link to sendowl or other non-mentor pages
+    if card.name == 'a' and card.has_attr('href'):
+        href = card['href']
+        if 'sendowl' in href or 'transactions' in href or href == 'https://www.re-create.com':
+            return False
+
+    # Must have either a name (h2) or be a mentor profile link
+    has_name = card.select_one("h2") is not None
+    is_mentor_link = card.name == 'a' and card.has_attr('href') and '/mentors/' in card['href']
+    return has_name or is_mentor_link
+
+
+def find_mentor_cards(soup):
+    """Return the mentor cards, preferring a.mentor-card over the looser fallbacks"""
+    for selector in CARD_SELECTORS:
+        cards = [card for card in soup.select(selector) if is_mentor_card(card)]
+        if cards:
+            return cards
+    return []
+
+
+def parse_mentor_card(card):
+    """Extract one mentor from a mentor card"""
+    # a.mentor-card keeps its fields in div.mentor-card__link
+    scope = "div.mentor-card__link " if card.name == 'a' else ""
+
+    # Profile link - the card itself for a.mentor-card elements
+    profile_link = "N/A"
+    if card.name == 'a' and card.has_attr('href'):
+        profile_link = card['href']
+    else:
+        profile_link_element = card.select_one("a[href*='/mentors/']")
+        if profile_link_element and profile_link_element.has_attr('href'):
+            profile_link = profile_link_element['href']
+
+    name_element = card.select_one(f"{scope}h2") or card.select_one("h2")
+    location_element = card.select_one(f"{scope}p.strapline_small")
+    job_title_element = card.select_one(f"{scope}p.badge-role")
+    description_element = (card.select_one(f"{scope}p.para.three-lines.ddd-truncated") or
+                           card.select_one(f"{scope}p.para") or
+                           card.select_one(f"{scope}p[class*='para']"))
+
+    return {
+        "Name": name_element.text.strip() if name_element else "N/A",
+        "Profile Link": profile_link,
+        "Location": location_element.text.strip() if location_element else "N/A",
+        "Job Title": job_title_element.text.strip() if job_title_element else "N/A",
+        "Description": description_element.text.strip() if description_element else "N/A",
+        "Portfolio Link": "N/A"  # Will be filled later by portfolio extraction
+    }
+
+
+def parse_portfolio_link(soup):
+    """Find the portfolio link on a mentor profile page"""
+    for selector in PORTFOLIO_SELECTORS:
+        portfolio_element = soup.select_one(selector)
+        if portfolio_element and portfolio_element.has_attr('href'):
+            return portfolio_element['href']
+    return "N/A"
+
+
+async def extract_portfolio_link(page, profile_link):
+    """Extract the portfolio link from a mentor profile page"""
+    try:
+        print(f"🔗 Opening profile: {profile_link}")
+        await page.goto(profile_link, wait_until="domcontentloaded")
+        try:
+            await page.wait_for_load_state("networkidle", timeout=8000)
+        except:
+            pass
+        await page.wait_for_timeout(1000)
+
+        portfolio_link = parse_portfolio_link(parse_html(await page.content()))
+        if portfolio_link == "N/A":
+            print("⚠️  No portfolio link found")
+        else:
+            print(f"✅ Found portfolio link: {portfolio_link}")
+        return portfolio_link
+
+    except Exception as e:
+        print(f"❌ Error extracting portfolio link: {e}")
+        return "N/A"
+
+
+class RecreateAdapter(SiteAdapter):
+    """Re-Create mentors - numbered result pages, one profile visit per mentor for the portfolio"""
+
+    name = "Re-Create Mentors"
+    url = "https://www.re-create.com/mentors/?"
+    domain = "re-create.com"
+    output_filename = "recreate_mentors"
+    ready_marker = "mentor"
+    empty_value = "N/A"
+    wait_until = "domcontentloaded"
+    open_wait_ms = 2000
+    keyboard_stop = True
+    headless = True
+    timeout = 15000
+    pagination = PageParam("results", start_page=1, end_page=30)
+    detail_settle_ms = 1000
+    stream_details = True
+    detail_fields = ["Portfolio Link"]
+
+    # --- Parallel crawl ---
+    workers = 4  # tabs loading result pages, and tabs loading profiles, at once (1 = one after the other)
+
+    def __init__(self, **overrides):
+        super().__init__(**overrides)
+        if "pagination" not in overrides:
+            self.pagination = PageParam("results", start_page=1, end_page=30, workers=self.workers)
+        if "detail_workers" not in overrides:
+            self.detail_workers = self.workers
+
+    def browser_options(self):
+        options = super().browser_options()
+        if options["headless"]:
+            options["extra_args"] = list(self.extra_browser_args) + ["--no-sandbox", "--disable-gpu", "--disable-extensions"]
+        return options
+
+    async def after_open(self, page):
+        # Check if we need to login
+        try:
+            login_elements = page.locator("//a[contains(text(), 'Login') or contains(text(), 'Sign in')]")
+            if await login_elements.count() > 0:
+                print("🔐 Login required for Re-Create")
+                return False
+        except Exception as e:
+            print(f"⚠️  Could not check login status: {e}")
+
+        # The first page lazy-loads while scrolling
+        await scroll_until_stable(page, max_attempts=10, wait_ms=1500)
+        return True
+
+    def select_cards(self, soup):
+        return find_mentor_cards(soup)
+
+    def parse_card(self, card):
+        return parse_mentor_card(card)
+
+    async def enrich(self, page, row):
+        profile_link = row.get("Profile Link", "N/A")
+        if profile_link == "N/A" or not profile_link.startswith('http'):
+            return {"Portfolio Link": "N/A"}
+        return {"Portfolio Link": await extract_portfolio_link(page, profile_link)}
+
+    def detail_url(self, row):
+        profile_link = row.get("Profile Link", "N/A")
+        return profile_link if profile_link.startswith('http') else None
+
+    def parse_detail(self, soup, row):
+        portfolio_link = parse_portfolio_link(soup)
+        if portfolio_link == "N/A":
+            print(f"⚠️  No portfolio link found for {row.get('Name', 'Unknown')}")
+        return {"Portfolio Link": portfolio_link}
@@ -0,0 +1,346 @@
+import asyncio
+import random
+import time
+
+import pandas as pd
+
+from engine.adapter import SiteAdapter
+from engine.blocking import resource_blocker
+from engine.config import CSV_BATCH_SIZE, CSV_ENCODING, CSV_FLUSH_INTERVAL
+from engine.extract import absolute_url, parse_html
+from engine.pagination import LoadMore
+from engine.pool import detail_pool
+from engine.storage import save_data
+
+BASE_URL = "https://signal.nfx.com"
+PROFILE_FIELDS = ["Type", "Job Title", "Social Link"]
+EMPTY_PROFILE = {field: "-" for field in PROFILE_FIELDS}
+
+
+def parse_investor_profile(soup):
+    """Extract Type, Job Title and Social Link from an investor profile page"""
+    profile = dict(EMPTY_PROFILE)
+
+    # Type from div.col-sm-6.col-xs-12 > div.relative.identity-block > div.subheader.white-subheader.b.pb1 > span
+    try:
+        type_container = soup.select_one("div.col-sm-6.col-xs-12 div.relative.identity-block div.subheader.white-subheader.b.pb1")
+        if type_container:
+            type_texts = [span.get_text(strip=True) for span in type_container.select("span") if span.get_text(strip=True)]
+            profile["Type"] = ", ".join(type_texts) if type_texts else "-"
+    except Exception as e:
+        print(f"Error extracting type: {e}")
+
+    # Job title from div.col-sm-6.col-xs-12 > div.subheader.lower-subheader.pb2
+    try:
+        job_title_element = soup.select_one("div.col-sm-6.col-xs-12 div.subheader.lower-subheader.pb2")
+        if job_title_element:
+            profile["Job Title"] = job_title_element.get_text(strip=True)
+    except Exception as e:
+        print(f"Error extracting job title: {e}")
+
+    # Social link from a.ml1.subheader.lower-subheader
+    try:
+        social_element = soup.select_one("a.ml1.subheader.lower-subheader")
+        if social_element:
+            social_link = social_element.get('href', '').strip()
+            if social_link and not social_link.startswith('http'):
+                if social_link.startswith('/'):
+                    social_link = f"{BASE_URL}{social_link}"
+                else:
+                    social_link = f"https://{social_link}"
+            profile["Social Link"] = social_link or "-"
+    except Exception as e:
+        print(f"Error extracting social link: {e}")
+
+    return profile
+
+
+async def extract_investor_profile_data(page, investor_url):
+    """Extract additional data from individual investor profile page"""
+    try:
+        print(f"🔍 Extracting profile data from: {investor_url}")
+        await page.goto(investor_url, wait_until="domcontentloaded")
+        await page.wait_for_timeout(2000)  # Wait for page to load
+
+        # Add random delay to avoid being blocked
+        delay = random.uniform(0.5, 1.5)
+        print(f"⏳ Waiting {delay:.1f} seconds to avoid being blocked...")
+        await page.wait_for_timeout(int(delay * 1000))
+
+        return parse_investor_profile(parse_html(await page.content()))
+
+    except Exception as e:
+        print(f"Error extracting profile data from {investor_url}: {e}")
+        return dict(EMPTY_PROFILE)
+
+
+def parse_investor_row(row):
+    """Extract one investor from a tbody tr of the investor list"""
+    # Profile link from first td > div.flex > a.flex-column.pt1.mr3.items-center
+    profile_link = "-"
+    profile_element = row.select_one("td div.flex a.flex-column.pt1.mr3.items-center")
+    if profile_element and profile_element.get('href', ''):
+        profile_link = absolute_url(profile_element['href'], BASE_URL)
+
+    # Investor name from div.pt1 > div.sn-investor-name-wrapper > a > strong.sn-investor-name
+    investor_name = "-"
+    name_element = row.select_one("div.pt1 div.sn-investor-name-wrapper a strong.sn-investor-name")
+    if name_element:
+        investor_name = name_element.text.strip()
+
+    # Company name is the a tag that comes before the investor type span
+    company_name = "-"
+    investor_type = "-"
+    type_span = row.select_one("span.sn-small-link.hidden-xs")
+    if type_span:
+        investor_type = type_span.text.strip()
+        company_element = type_span.find_previous("a")
+        if company_element:
+            company_name = company_element.get_text(strip=True)
+
+    # Sweet spot (range) from td.text-center.pt2 > div.flex-column > div (both divs)
+    sweet_spot = "-"
+    sweet_spot_container = row.select_one("td.text-center.pt2 div.flex-column")
+    if sweet_spot_container:
+        sweet_spot_texts = [div.get_text(strip=True) for div in sweet_spot_container.select("div") if div.get_text(strip=True)]
+        sweet_spot = " - ".join(sweet_spot_texts) if sweet_spot_texts else "-"
+
+    # Investment location and top categories live in the first / second div.sn-clamp
+    investment_location = "-"
+    location_container = row.select_one("td[style*='max-width: 400px'] div[style*='position: relative'] div.sn-clamp div[style*='position: relative']")
+    if location_container:
+        location_texts = [span.get_text(strip=True) for span in location_container.select("span") if span.get_text(strip=True)]
+        investment_location = ", ".join(location_texts) if location_texts else "-"
+
+    top_categories = "-"
+    sn_clamp_divs = row.select("td[style*='max-width: 400px'] div[style*='position: relative'] div.sn-clamp")
+    if len(sn_clamp_divs) > 1:
+        relative_divs = sn_clamp_divs[1].select("div[style*='position: relative']")
+        if relative_divs:
+            category_texts = [span.get_text(strip=True) for span in relative_divs[0].select("span") if span.get_text(strip=True)]
+            top_categories = ", ".join(category_texts) if category_texts else "-"
+
+    return {
+        "Investor Name": investor_name,
+        "Company Name": company_name,
+        "Investor Type": investor_type,
+        "Sweet Spot (Range)": sweet_spot,
+        "Investment Location": investment_location,
+        "Top Investment Categories": top_categories,
+        "Type": "-",  # Will be filled from profile page
+        "Job Title": "-",  # Will be filled from profile page
+        "Social Link": "-",  # Will be filled from profile page
+        "Profile Link": profile_link
+    }
+
+
+async def check_login_status(page):
+    """Check if user is logged in to Signal NFX"""
+    try:
+        print("🔐 Checking login status...")
+        await page.goto(f"{BASE_URL}/login", wait_until="domcontentloaded")
+        await page.wait_for_timeout(2000)
+
+        # Check if we're redirected to dashboard or if login form is present
+        current_url = page.url
+        print(f"📍 Current URL: {current_url}")
+
+        login_form = await page.query_selector("form")
+        login_button = await page.query_selector('button[type="submit"]')
+
+        if "login" in current_url and (login_form or login_button):
+            print("❌ Not logged in - login form detected")
+            return False
+        else:
+            print("✅ Already logged in - no login form detected")
+            return True
+
+    except Exception as e:
+        print(f"⚠️ Could not check login status: {e}")
+        return False
+
+
+async def ensure_login(page):
+    """Ensure user is logged in, prompt if not"""
+    if await check_login_status(page):
+        print("✅ Already logged in!")
+        return True
+
+    print("\n" + "="*60)
+    print("🔐 LOGIN REQUIRED")
+    print("="*60)
+    print("Please log in to Signal NFX manually in the browser window.")
+    print("The scraper will wait for you to complete the login process.")
+    print("\nSteps:")
+    print("1. Enter your email and password")
+    print("2. Complete any 2FA if required")
+    print("3. Wait for the dashboard to load")
+    print("4. Press Enter here when login is complete")
+    print("="*60)
+
+    try:
+        await asyncio.to_thread(input, "Press Enter when you have completed login...")
+        print("✅ Login process completed!")
+    except EOFError:
+        print("⚠️ No input available, continuing with current session...")
+
+    # Verify login again
+    if await check_login_status(page):
+        print("✅ Login verified successfully!")
+        return True
+    print("⚠️ Login verification failed, but continuing...")
+    return False
+
+
+class SignalNFXAdapter(SiteAdapter):
+    """signal.nfx investor lists - load-more table, then one profile page per investor"""
+
+    name = "Signal NFX Investors"
+    url = "https://signal.nfx.com/investor-lists/top-deeptech-seed-investors"
+    domain = "signal.nfx.com"
+    requires_login = True
+    output_filename = "signal_nfx_investors"
+    card_selectors = ["tbody tr"]
+    html_parser = "lxml"
+    ready_marker = "tbody"
+    key_field = "Profile Link"
+    detail_delay_range = (1, 3)
+    detail_workers = 4
+    detail_host_limit = 4
+    detail_min_interval = 0.5
+    detail_settle_ms = 2000
+    detail_fields = PROFILE_FIELDS
+    pagination = LoadMore(
+        ["button.btn-xs.sn-light-greyblue-accent-button.sn-center.mt3.mb2.btn.btn-default"],
+        wait_ms=5000,
+        count_selector="tbody tr",
+        yield_each_step=False
+    )
+    extra_browser_args = [
+        "--no-first-run",
+        "--no-default-browser-check",
+        "--disable-default-apps",
+        "--disable-background-timer-throttling",
+        "--disable-backgrounding-occluded-windows",
+        "--disable-renderer-backgrounding",
+        "--disable-features=TranslateUI",
+        "--mute-audio",
+        "--hide-scrollbars"
+    ]
+    context_options = {
+        "viewport": {"width": 1920, "height": 1080},
+        "locale": "en-US",
+        "timezone_id": "America/New_York",
+        "extra_http_headers": {"Accept-Language": "en-US,en;q=0.9"}
+    }
+
+    async def prepare(self, page):
+        # Ensure user is logged in before scraping (never blocks the run)
+        await ensure_login(page)
+        return True
+
+    async def extract_rows(self, page, soup, run):
+        rows = [row async for row in super().extract_rows(page, soup, run)]
+        print(f"📊 Found {len(rows)} investor cards")
+
+        # Export backup CSV with main page data before profile extraction
+        if rows:
+            print(f"💾 Saving backup CSV with {len(rows)} investors from main page...")
+            save_data(rows, "main_page_csv")
+
+        for row in rows:
+            yield row
+
+    def parse_card(self, card):
+        return parse_investor_row(card)
+
+    async def enrich(self, page, row):
+        return await extract_investor_profile_data(page, row["Profile Link"])
+
+    def detail_url(self, row):
+        profile_link = row.get("Profile Link", "-")
+        return profile_link if profile_link.startswith("http") else None
+
+    def parse_detail(self, soup, row):
+        return parse_investor_profile(soup)
+
+
+def is_missing(series):
+    """True for cells that are empty or the '-' placeholder"""
+    return series.isna() | (series == '') | (series == '-')
+
+
+async def process_existing_csv(page, csv_filename, adapter=None):
+    """Process existing CSV file and extract profile data for each investor
+
+    Profile pages are loaded with the adapter's page pool settings (SignalNFXAdapter by default).
+    """
+    print(f"📁 Processing existing CSV file: {csv_filename}.csv")
+
+    try:
+        df = pd.read_csv(f"{csv_filename}.csv", encoding=CSV_ENCODING)
+        print(f"📊 Found {len(df)} investors in CSV file")
+
+        if 'Profile Link' not in df.columns:
+            print("❌ Error: CSV file must contain 'Profile Link' column")
+            return []
+
+        if all(col in df.columns for col in PROFILE_FIELDS):
+            print("✅ CSV already contains profile data. Checking for missing data...")
+            # Find rows with ALL THREE fields missing (empty or '-')
+            missing_data = df[is_missing(df['Type']) & is_missing(df['Job Title']) & is_missing(df['Social Link'])]
+            if len(missing_data) == 0:
+                print("✅ All investors already have complete profile data!")
+                return []
+            print(f"📝 Found {len(missing_data)} investors with ALL profile fields missing")
+            investors_to_process = missing_data
+        else:
+            print("📝 CSV missing profile data columns. Adding them...")
+            for field in PROFILE_FIELDS:
+                df[field] = '-'
+            investors_to_process = df
+
+        jobs = []
+        for index, row in investors_to_process.iterrows():
+            profile_link = row.get('Profile Link', '')
+            if not isinstance(profile_link, str) or not profile_link or profile_link == '-':
+                print(f"⏭️ Skipping {row.get('Investor Name', 'Unknown')}: No profile link")
+                continue
+            jobs.append(((index, row.get('Investor Name', 'Unknown')), profile_link))
+
+        # Profiles load in a pool of tabs; each one is written as soon as it finishes
+        adapter = adapter or SignalNFXAdapter()
+        blocker = resource_blocker(adapter)
+        pool = detail_pool(page, adapter, blocker)
+        print(f"🧵 Fetching {len(jobs)} profiles with {pool.size} tabs...")
+
+        async def read_profile(tab, job):
+            return parse_investor_profile(parse_html(await tab.content()))
+
+        processed_count = 0
+        last_save = time.monotonic()
+        try:
+            async for (index, investor_name), profile_data in pool.run(jobs, read_profile):
+                profile_data = profile_data or EMPTY_PROFILE
+                for field in PROFILE_FIELDS:
+                    df.at[index, field] = profile_data[field]
+
+                processed_count += 1
+                print(f"✅ Processed {processed_count}/{len(jobs)}: {investor_name}")
+
+                # Rewrite the CSV every batch of investors instead of after each one
+                if processed_count % CSV_BATCH_SIZE == 0 or time.monotonic() - last_save >= CSV_FLUSH_INTERVAL:
+                    df.to_csv(f"{csv_filename}.csv", index=False, encoding=CSV_ENCODING)
+                    last_save = time.monotonic()
+        finally:
+            await pool.close()
+            df.to_csv(f"{csv_filename}.csv", index=False, encoding=CSV_ENCODING)
+
+        if blocker is not None:
+            blocker.stats.print_summary()
+        print(f"🎉 CSV processing completed! Updated {processed_count} investors")
+        return df.to_dict('records')
+
+    except Exception as e:
+        print(f"❌ Error processing CSV file: {e}")
+        return []
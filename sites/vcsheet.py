@@ -0,0 +1,135 @@
+from engine.adapter import SiteAdapter
+from engine.pagination import InfiniteScroll
+
+CARD_SELECTORS = [
+    "div.list-item.vert-list.less-spacing.w-dyn-item",
+    "div.list-item.vert-list.w-dyn-item",
+    "div.list-item.w-dyn-item",
+    "div.w-dyn-item",
+    "div[class*='list-item']",
+    "div[class*='investor']"
+]
+
+NAME_SELECTORS = [
+    "h3.list-heading.list-pages",
+    "h3.list-heading",
+    "h3",
+    ".list-heading",
+    "a h3",
+    "div h3"
+]
+
+SOCIAL_SELECTORS = [
+    "div.align-row.right-align.center-mobile a",
+    "div[class*='right-align'] a",
+    "div[class*='social'] a"
+]
+
+
+def parse_social_links(card):
+    """Categorize the card's links into website / twitter / linkedin / ..."""
+    links = {
+        "Website": "-",
+        "Twitter": "-",
+        "LinkedIn": "-",
+        "YouTube": "-",
+        "Crunchbase": "-",
+        "Email": "-"
+    }
+    other_links = []
+
+    for selector in SOCIAL_SELECTORS:
+        social_links_elements = card.select(selector)
+        if not social_links_elements:
+            continue
+        for link in social_links_elements:
+            href = link.get('href', '')
+            if not href:
+                continue
+            # Check if there's a div inside the link for additional text
+            div_inside = link.select_one("div")
+            link_text = div_inside.text.strip() if div_inside else ""
+
+            # Categorize the link based on URL or text
+            href_lower = href.lower()
+            text_lower = link_text.lower()
+
+            if 'twitter.com' in href_lower or 'x.com' in href_lower or 'twitter' in text_lower:
+                links["Twitter"] = href
+            elif 'linkedin.com' in href_lower or 'linkedin' in text_lower:
+                links["LinkedIn"] = href
+            elif 'youtube.com' in href_lower or 'youtu.be' in href_lower or 'youtube' in text_lower:
+                links["YouTube"] = href
+            elif 'crunchbase.com' in href_lower or 'crunchbase' in text_lower:
+                links["Crunchbase"] = href
+            elif 'mailto:' in href_lower or '@' in href_lower or 'email' in text_lower:
+                links["Email"] = href
+            elif 'http' in href_lower and ('website' in text_lower or 'site' in text_lower or 'web' in text_lower):
+                links["Website"] = href
+            elif href not in other_links:
+                other_links.append(href)
+        break
+
+    links["Other Links"] = ", ".join(other_links) if other_links else "-"
+    return links
+
+
+def parse_investor_card(card):
+    """Extract one investor from a VC Sheet list card (None when it has no name)"""
+    name = "-"
+    for selector in NAME_SELECTORS:
+        name_element = card.select_one(selector)
+        if name_element and name_element.text.strip():
+            name = name_element.text.strip()
+            break
+
+    if name == "-":
+        return None
+
+    # Stages: div.ra-vert.more-space > div.align-row.center-mobile > div.pill-item
+    # Exclude invisible elements with w-condition-invisible class
+    stages = []
+    for stage_element in card.select("div.ra-vert.more-space div.align-row.center-mobile div.pill-item:not(.w-condition-invisible)"):
+        stage_text = stage_element.text.strip()
+        if stage_text and stage_text not in stages:
+            stages.append(stage_text)
+
+    # Job title from div.html-embed.w-embed under div.align-row.sides
+    job_title = "-"
+    job_title_container = card.select_one("div.align-row.sides")
+    if job_title_container:
+        job_title_texts = [element.get_text(strip=True) for element in job_title_container.select("div.html-embed.w-embed")]
+        job_title_texts = [text for text in job_title_texts if text]
+        if job_title_texts:
+            job_title = " ".join(job_title_texts)
+
+    # Title from div.shortdesccard.more-top.w-richtext
+    title = "-"
+    title_element = card.select_one("div.shortdesccard.more-top.w-richtext")
+    if title_element and title_element.get_text(strip=True):
+        title = title_element.get_text(strip=True)
+
+    investor = {
+        "Name": name,
+        "Job Title": job_title,
+        "Title": title,
+        "Stage": ", ".join(stages) if stages else "-",
+    }
+    investor.update(parse_social_links(card))
+    return investor
+
+
+class VCSheetAdapter(SiteAdapter):
+    """VC Sheet investors - cards appended as the page scrolls"""
+
+    name = "VC Sheet"
+    url = "https://www.vcsheet.com/investors"
+    domain = "vcsheet.com"
+    output_filename = "vcsheet_investors"
+    card_selectors = CARD_SELECTORS
+    incremental = True
+    ready_marker = "list-item vert-list"
+    pagination = InfiniteScroll(wait_ms=2000, max_scrolls=2000, stall_limit=3, count_selector="div.w-dyn-item")
+
+    def parse_card(self, card):
+        return parse_investor_card(card)